@@ -0,0 +1,184 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#==============================================================================#
+# HISTORY                                                                      #
+# -------                                                                      #
+# Developed October 2026.                                                      #
+#==============================================================================#
+"""USAGE
+Module imported and used by the "temporalPersistence.py" script when the
+"Spatial Index" persistence engine is selected. The functions below (other than
+saveAdjacency and loadAdjacency, which only write and read NumPy files) do not
+require arcpy and operate on NumPy arrays only.
+
+SUMMARY
+Sparse cross-time adjacency matrix of the dark targets (by targetID) at a
+persistence radius, in compressed sparse row (CSR) form: the neighbours of target
+i are indices[indptr[i]:indptr[i+1]], at distances distance[indptr[i]:indptr[i+1]]
+(sorted by neighbour index). Only targets from different times (days or years)
+are adjacent, and every pair is present in both rows.
+
+The persistence values, weight values and clusters of a radius are all derived
+from its adjacency matrix:
+    - Persistence = Number of different times among the neighbours of a target.
+    - Weight = 1 plus the number of neighbours of a target (row length).
+    - Clusters = Connected components of the matrix (targets with at least one
+    neighbour), labelled by iterative minimum label propagation.
+
+The adjacency matrix of each radius is saved in the folder of the analysis GDB
+with the content key of the dark targets, so that a subsequent analysis of the
+same dark targets reuses the neighbour pairs without reading or comparing
+geometry again.
+
+INPUT
+- Neighbour pairs (automated input): Arrays of target indices, neighbouring target
+indices and distances (see persistenceEngine.findNeighbours).
+
+OUTPUT
+- Adjacency matrix (automated output): '<source name>_adjacency_<radius>.npz' file
+in the folder of the analysis GDB, with the CSR arrays (indptr, indices, distance),
+the targetID, time slice and times of the targets, the radius and the content key
+of the dark targets.
+
+ADDITIONAL FUNCTIONS (explained in script below)
+- fromPairs
+- toPairs
+- persistence
+- components
+- clusters
+- adjacencyFile
+- saveAdjacency
+- loadAdjacency"""
+
+# Libraries
+# =========
+import os
+import logging
+import numpy as np
+
+# Reload steps required to refresh memory if Catalog is open when changes are made
+import persistenceEngine                    # get module reference for reload
+reload(persistenceEngine)                   # reload step 1
+
+# Name suffix of the adjacency matrix files (preceded by the name of the analysis source, followed by the radius)
+ADJACENCY_SUFFIX = "_adjacency_"
+
+
+def fromPairs(numTargets, targetIdx, neighbourIdx, distance):
+    """Builds the CSR adjacency matrix of neighbour pairs.
+
+    Parameters:
+        numTargets = Number of targets (rows of the matrix)
+        targetIdx = Array of target indices of the neighbour pairs
+        neighbourIdx = Array of neighbouring target indices of the neighbour pairs
+        distance = Array of distances between the targets of the neighbour pairs
+
+    Return:
+        Returns dictionary of CSR arrays: 'indptr' (numTargets + 1 row offsets), 'indices'
+        (neighbour index of each entry) and 'distance' (distance of each entry)"""
+    targetIdx = np.asarray(targetIdx, dtype=np.int64)
+    neighbourIdx = np.asarray(neighbourIdx, dtype=np.int64)
+    order = np.lexsort((neighbourIdx, targetIdx))
+    indptr = np.zeros(numTargets + 1, dtype=np.int64)
+    indptr[1:] = np.cumsum(np.bincount(targetIdx, minlength=numTargets))
+    return {"indptr": indptr, "indices": neighbourIdx[order], "distance": np.asarray(distance, dtype=np.float64)[order]}
+
+
+def toPairs(matrix):
+    """Returns the three arrays of neighbour pairs (target indices, neighbouring target indices, distances) of a CSR adjacency matrix."""
+    rows = np.repeat(np.arange(len(matrix["indptr"]) - 1), np.diff(matrix["indptr"]))
+    return rows, matrix["indices"], matrix["distance"]
+
+
+def persistence(matrix, slices):
+    """Calculates the persistence and weight values of each target from a CSR adjacency matrix (see persistenceEngine.calcPersistence)."""
+    rows, indices, distance = toPairs(matrix)
+    return persistenceEngine.calcPersistence(slices, rows, indices)
+
+
+def components(matrix):
+    """Labels the connected components of a CSR adjacency matrix.
+
+    Each target takes the smallest label of its neighbours until no label changes,
+    with pointer jumping (label of the label) to shorten long chains of targets.
+
+    Parameters:
+        matrix = CSR adjacency matrix (see fromPairs)
+
+    Return:
+        Returns array of component label of each target (smallest target index of its component)"""
+    rows, indices, distance = toPairs(matrix)
+    labels = np.arange(len(matrix["indptr"]) - 1)
+    while True:
+        newLabels = labels.copy()
+        np.minimum.at(newLabels, rows, labels[indices])
+        newLabels = newLabels[newLabels]
+        if (newLabels == labels).all():
+            return labels
+        labels = newLabels
+
+
+def clusters(matrix, targetIDs):
+    """Groups the targets of a CSR adjacency matrix into clusters of connected targets.
+
+    Parameters:
+        matrix = CSR adjacency matrix (see fromPairs)
+        targetIDs = Array of targetID of each target
+
+    Return:
+        Returns list of clusters (lists of targetIDs) of the targets with at least one
+        neighbour, ordered by the smallest target index of each cluster"""
+    labels = components(matrix)
+    members = np.nonzero(np.diff(matrix["indptr"]) > 0)[0]
+    order = members[np.argsort(labels[members], kind="mergesort")]
+    if len(order) == 0:
+        return []
+    breaks = np.nonzero(np.diff(labels[order]))[0] + 1
+    targetIDs = np.asarray(targetIDs)
+    return [targetIDs[group].tolist() for group in np.split(order, breaks)]
+
+
+def adjacencyFile(folder, sourceName, radius):
+    """Returns path of the adjacency matrix file of an analysis source at a radius."""
+    return os.path.join(folder, sourceName + ADJACENCY_SUFFIX + str(radius) + ".npz")
+
+
+def saveAdjacency(adjFile, matrix, targets, radius, targetsKey):
+    """Writes a CSR adjacency matrix and the targets of its rows to a NumPy (.npz) file.
+
+    Parameters:
+        adjFile = Path of the adjacency matrix file
+        matrix = CSR adjacency matrix (see fromPairs)
+        targets = Dictionary of dissolved targets (with 'times', 'targetID' and 'slice')
+        radius = Persistence radius of the matrix
+        targetsKey = Content key of the dark targets (see persistenceCache.contentKey)
+
+    Return:
+        No return"""
+    with open(adjFile, "wb") as npzFile:
+        np.savez(npzFile, indptr=matrix["indptr"], indices=matrix["indices"], distance=matrix["distance"],
+                 targetID=np.array(targets["targetID"].tolist(), dtype="U"), slice=targets["slice"],
+                 times=np.array(targets["times"], dtype="U"), radius=np.float64(radius), targetsKey=np.array(targetsKey, dtype="U"))
+    logging.info("Adjacency Matrix: '%d' neighbour pairs within '%s' metres written to '%s'", len(matrix["indices"]) // 2, str(radius), adjFile)
+
+
+def loadAdjacency(adjFile, targetsKey):
+    """Reads a CSR adjacency matrix, if it was saved for the same dark targets.
+
+    Parameters:
+        adjFile = Path of the adjacency matrix file
+        targetsKey = Content key of the dark targets of the current analysis
+
+    Return:
+        Returns CSR adjacency matrix (dictionary of arrays, with its 'radius'), or None if the
+        file does not exist or was saved for different dark targets"""
+    if not os.path.exists(adjFile):
+        return None
+    with np.load(adjFile) as npzFile:
+        if str(npzFile["targetsKey"]) != targetsKey:
+            return None
+        matrix = {"indptr": npzFile["indptr"], "indices": npzFile["indices"], "distance": npzFile["distance"],
+                  "radius": float(npzFile["radius"])}
+    logging.info("Adjacency Matrix: '%d' neighbour pairs within '%s' metres reused from '%s'", len(matrix["indices"]) // 2, str(matrix["radius"]), adjFile)
+    return matrix
@@ -44,12 +44,12 @@ centroid. The "chlor_5x5_" attribute field contains the extracted raster value o
 the mean of the pixel value within the specified neighbourhood window. ('5x5' in
 this case)
 
+The raster values are sampled in memory at the centroid of each dark target
+(see 'centroidEngine.py'), without point or extraction feature classes.
+
 ADDITIONAL FUNCTIONS (explained in script below)
 - yearDay
-- adapted from ESRI's Join_Field.py functions
-    - joindataGen
-    - percentile
-    - join_field
+- sampleRaster
 - cleanWorkspace"""
 
 # Libraries
@@ -59,6 +59,12 @@ import os
 import sys
 import datetime
 import logging
+import numpy as np
+import stageProfiler
+
+# Reload steps required to refresh memory if Catalog is open when changes are made
+import centroidEngine                       # get module reference for reload
+reload(centroidEngine)                      # reload step 1
 
 
 class applyChloro(object):
@@ -119,6 +125,7 @@ class applyChloro(object):
         parameter.  This method is called after internal validation."""
         return
 
+    @stageProfiler.profiledExecute
     def execute(self, parameters, messages):
         """The source code of the tool."""
         # Set log configuration
@@ -183,14 +190,8 @@ class applyChloro(object):
 
                     dayCounter = 0
 
-                    # Create points feature class from current feature class to extract chlorophyll raster values
-                    arcpy.AddMessage("Creating points feature class...")
-                    targetLyr = "targetLyr"
-                    arcpy.MakeFeatureLayer_management(fc, targetLyr)
-                    logging.info("Make Feature Layer: '%s' layer created from '%s' feature class", targetLyr, fc)
-                    pointFC = fc + "_point"
-                    arcpy.FeatureToPoint_management(targetLyr, pointFC, "CENTROID")
-                    logging.info("Feature To Point: '%s' points feature class created from centroid of features in '%s' layer", pointFC, targetLyr)
+                    # Centroids of the dark targets (calculated in the coordinate system of the first chlorophyll raster, replaces the points feature class)
+                    centroids = None
 
                     # Determine year and day of year to load appropriate .nc file as raster
                     yDay = self.yearDay(fc.split("_")[1], dayRange)
@@ -220,29 +221,39 @@ class applyChloro(object):
                                     # Calculate focal statistics (mean value of focal window)
                                     arcpy.AddMessage("Calculating focal statistics...")
                                     neighborhood = arcpy.sa.NbrRectangle(cell_size, cell_size, "CELL")
-                                    chloro_focal = arcpy.sa.FocalStatistics(chloro_rectExtract, neighborhood, "MEAN", "DATA")
+                                    with stageProfiler.stage("FocalStatistics"):
+                                        chloro_focal = arcpy.sa.FocalStatistics(chloro_rectExtract, neighborhood, "MEAN", "DATA")
                                     logging.info("Focal Statistics: '%s' raster created by calculating mean value of '%s'x'%s' neighbourhood calculated for cells from '%s'", chloro_focal, str(cell_size), str(cell_size), chloro_file)
 
-                                    if not chlor_a in fldNames:
-                                        # Extract point values from raster
-                                        arcpy.AddMessage("Extracting raster chlorophyll_a values to points...")
-                                        extractFC = fc + "_extract"
-                                        arcpy.sa.ExtractValuesToPoints(pointFC, chloro_rectExtract, extractFC)
-                                        arcpy.AlterField_management(extractFC, "RASTERVALU", chlor_a)
-                                        logging.info("Extract Values to Points: '%s' feature class created with point values calculated from '%s' raster layer with '%s' feature class", extractFC, chloro_file, pointFC)
-
-                                    # Extract focal values from raster
-                                    arcpy.AddMessage("Extracting raster chlorophyll_a mean values to points...")
-                                    finalExtractFC = fc + "_final_extract" + str(dayCounter)
-                                    arcpy.sa.ExtractValuesToPoints(extractFC, chloro_focal, finalExtractFC)
-                                    focal_field_Day = "chlor_a_" + str(cell_size) + "x" + str(cell_size) + '_' + str(day)
-                                    arcpy.AlterField_management(finalExtractFC, "RASTERVALU", focal_field_Day)
-                                    logging.info("Extract Values to Points: '%s' feature class created with point values calculated from '%s' raster layer with '%s' feature class", finalExtractFC, chloro_focal, extractFC)
+                                    # Calculate centroid of each dark target in the coordinate system of the raster
+                                    if centroids is None:
+                                        arcpy.AddMessage("Calculating dark target centroids...")
+                                        with stageProfiler.stage("Centroids"):
+                                            centroids = centroidEngine.readCentroids(fc, spatialReference=chloro_rectExtract.spatialReference)
 
-                                    # Join point and focal values to feature class
-                                    arcpy.AddMessage("Joining values to feature class...")
-                                    self.join_field(fc, "OBJECTID", finalExtractFC, "ORIG_FID", "chlor_a;" + focal_field_Day)
-                                    logging.info("Join Field: chlor_a and chlor_a focal values joined to '%s' feature class from '%s' table", fc, finalExtractFC)
+                                    # Sample point and focal values from rasters at the centroid of each dark target
+                                    arcpy.AddMessage("Extracting raster chlorophyll_a values and mean values at dark target centroids...")
+                                    focal_field_Day = "chlor_a_" + str(cell_size) + "x" + str(cell_size) + '_' + str(day)
+                                    valueFields = [focal_field_Day]
+                                    with stageProfiler.stage("Sample rasters", len(centroids["oid"])):
+                                        valueArrays = [self.sampleRaster(chloro_focal, centroids["x"], centroids["y"])]
+                                        if not chlor_a in fldNames:
+                                            valueFields.insert(0, chlor_a)
+                                            valueArrays.insert(0, self.sampleRaster(chloro_rectExtract, centroids["x"], centroids["y"]))
+                                    logging.info("Sample Raster: '%s' values sampled at '%d' dark target centroids from '%s' and '%s' rasters", str(valueFields), len(centroids["oid"]), chloro_file, chloro_focal)
+
+                                    # Write point and focal values to feature class (single cursor iteration by ObjectID)
+                                    arcpy.AddMessage("Writing values to feature class...")
+                                    for fieldName in valueFields:
+                                        if arcpy.ListFields(fc, fieldName) == []:
+                                            arcpy.AddField_management(fc, fieldName, "DOUBLE")
+                                    valueDict = dict(zip(centroids["oid"].tolist(), zip(*[values.tolist() for values in valueArrays])))
+                                    with arcpy.da.UpdateCursor(fc, ["OID@"] + valueFields) as cursor:
+                                        for row in cursor:
+                                            values = valueDict.get(row[0])
+                                            if values is not None:
+                                                cursor.updateRow([row[0]] + list(values))
+                                    logging.info("Update Cursor: chlor_a and chlor_a focal values written to '%s' feature class", fc)
 
                                     # add field with day difference in range
                                     arcpy.AddField_management(fc,"chloro_dayRange","DOUBLE")
@@ -310,77 +321,27 @@ class applyChloro(object):
 
         return chloroDateList
 
-    def joindataGen(self,joinTable,fieldList,sortField):
-        """Code snippet from Esri's Join_Field.py (as a replacement to the Join Field geoprocessing tool, which suffers from exceedingly lengthy processing times.)
-
-        Define generator for join data"""
-        with arcpy.da.SearchCursor(joinTable,fieldList,sql_clause=['DISTINCT',
-                                                                   'ORDER BY '+sortField]) as cursor:
-            for row in cursor:
-                yield row
-
-    def percentile(self,n,pct):
-        """Code snippet from Esri's Join_Field.py (as a replacement to the Join Field geoprocessing tool, which suffers from exceedingly lengthy processing times.)
-
-        Function for progress reporting"""
-        return int(float(n)*float(pct)/100.0)
-
-    def join_field(self, inTable, inJoinField, joinTable, outJoinField, joinFields):
-        """Code snippet from Esri's Join_Field.py (as a replacement to the Join Field geoprocessing tool, which suffers from exceedingly lengthy processing times.)
-
-        Add join fields"""
-        arcpy.AddMessage('\nAdding join fields...')
-        fList = [f for f in arcpy.ListFields(joinTable) if f.name in joinFields.split(';')]
-        for i in range(len(fList)):
-            name = fList[i].name
-            type = fList[i].type
-            if type in ['Integer','OID']:
-                arcpy.AddField_management(inTable,name,field_type='LONG')
-            elif type == 'String':
-                arcpy.AddField_management(inTable,name,field_type='TEXT',field_length=fList[i].length)
-            elif type == 'Double':
-                arcpy.AddField_management(inTable,name,field_type='DOUBLE')
-            elif type == 'Date':
-                arcpy.AddField_management(inTable,name,field_type='DATE')
-            else:
-                arcpy.AddError('\nUnknown field type: {0} for field: {1}'.format(type,name))
-
-        # Write values to join fields
-        arcpy.AddMessage('\nJoining data...')
-        # Create generator for values
-        fieldList = [outJoinField] + joinFields.split(';')
-        joinDataGen = self.joindataGen(joinTable,fieldList,outJoinField)
-        version = sys.version_info[0]
-        if version == 2:
-            joinTuple = joinDataGen.next()
-        else:
-            joinTuple = next(joinDataGen)
-        #
-        fieldList = [inJoinField] + joinFields.split(';')
-        count = int(arcpy.GetCount_management(inTable).getOutput(0))
-        breaks = [self.percentile(count,b) for b in range(10,100,10)]
-        j = 0
-        with arcpy.da.UpdateCursor(inTable,fieldList,sql_clause=(None,'ORDER BY '+inJoinField)) as cursor:
-            for row in cursor:
-                j+=1
-                if j in breaks:
-                    arcpy.AddMessage(str(int(round(j*100.0/count))) + ' percent complete...')
-                row = list(row)
-                key = row[0]
-                try:
-                    while joinTuple[0] < key:
-                        if version == 2:
-                            joinTuple = joinDataGen.next()
-                        else:
-                            joinTuple = next(joinDataGen)
-                    if key == joinTuple[0]:
-                        for i in range(len(joinTuple))[1:]:
-                            row[i] = joinTuple[i]
-                        row = tuple(row)
-                        cursor.updateRow(row)
-                except StopIteration:
-                    arcpy.AddWarning('\nEnd of join table.')
-                    break
+    def sampleRaster(self, raster, x, y):
+        """Samples raster cell values at point locations (in-memory equivalent of Extract Values to Points).
+
+        Parameters:
+            raster = Raster object (e.g. output of a Spatial Analyst function)
+            x = Array of point x coordinates, in the coordinate system of the raster
+            y = Array of point y coordinates, in the coordinate system of the raster
+
+        Return:
+            Returns array of the value of the raster cell containing each point (-9999 for NoData
+            cells and points outside of the raster, as the RASTERVALU field of Extract Values to Points)"""
+        cells = arcpy.RasterToNumPyArray(raster, nodata_to_value=-9999)
+        extent = raster.extent
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        inside = np.isfinite(x) & np.isfinite(y) & (x >= extent.XMin) & (x < extent.XMax) & (y > extent.YMin) & (y <= extent.YMax)
+        col = np.minimum(((x[inside] - extent.XMin) / raster.meanCellWidth).astype(np.int64), cells.shape[1] - 1)
+        row = np.minimum(((extent.YMax - y[inside]) / raster.meanCellHeight).astype(np.int64), cells.shape[0] - 1)
+        values = np.repeat(-9999.0, len(x))
+        values[inside] = cells[row, col]
+        return values
 
     def cleanWorkspace(self, workspace):
         """Clears geodatabase workspace of interim feature classes used during geoprocessing executed in this script.
@@ -0,0 +1,400 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#==============================================================================#
+# HISTORY                                                                      #
+# -------                                                                      #
+# Developed October 2026.                                                      #
+#==============================================================================#
+"""USAGE
+Module imported and used by the "darkTargetStore.py" script to apply the
+"Attribute Selection Criteria" and "Attribute Rejection Criteria" of the
+"3_Temporal Persistence Analysis" tool to dark targets loaded in memory. The
+functions below do not require arcpy.
+
+SUMMARY
+Compiles SQL expressions (the subset used for attribute criteria, e.g.
+"Pice = 1 OR PnearLand = 1 OR PeulerN < -50") and evaluates them to a NumPy
+boolean mask over attribute columns read once, instead of selecting features in
+a feature layer with Select Layer By Attribute. The same loaded columns can then
+be evaluated against any number of criteria.
+
+The following SQL elements are supported:
+    - Field names (optionally delimited by double quotes or square brackets, not case sensitive)
+    - Numeric literals, string literals ('text') and date literals (date 'YYYY-MM-DD [HH:MM:SS]')
+    - Comparison operators: =, <>, !=, <, <=, >, >=
+    - Predicates: IS [NOT] NULL, [NOT] IN (...), [NOT] BETWEEN ... AND ..., [NOT] LIKE '...'
+    - Logical operators: AND, OR, NOT and parentheses
+
+Null values follow SQL three-valued logic: a comparison involving a null value is
+neither true nor false, so that the mask is true only for rows where the
+expression is true (as for a selection in ArcGIS).
+
+INPUT
+- SQL expression (user input): Attribute selection or rejection criteria.
+
+- Attribute columns (automated input): Dictionary of arrays by field name, with one
+value per dark target (floating point arrays with NaN for null numeric values,
+object arrays with None for null values otherwise).
+
+OUTPUT
+- Mask: Boolean array with one value per dark target, True for dark targets meeting
+the expression.
+
+ADDITIONAL FUNCTIONS (explained in script below)
+- tokenize
+- ExpressionParser
+- likeRegex
+- compileExpression
+- operandValues
+- valueKind
+- compareValues
+- evaluateTree
+- evaluate
+- selectMask"""
+
+# Libraries
+# =========
+import re
+import operator
+from datetime import datetime
+import numpy as np
+
+# Token pattern: whitespace, numbers, strings, delimited or plain names, then operators and punctuation
+TOKEN_PATTERN = re.compile(r"""
+    (?P<space>\s+)
+    |(?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)
+    |(?P<string>'(?:[^']|'')*')
+    |(?P<quoted>"[^"]+"|\[[^\]]+\])
+    |(?P<name>[A-Za-z_][A-Za-z0-9_.]*)
+    |(?P<op><>|!=|<=|>=|=|<|>)
+    |(?P<punct>[(),+-])
+    """, re.VERBOSE)
+
+KEYWORDS = ["AND", "OR", "NOT", "IS", "NULL", "IN", "BETWEEN", "LIKE", "DATE", "ESCAPE"]
+
+COMPARISONS = {"=": operator.eq, "<>": operator.ne, "!=": operator.ne, "<": operator.lt,
+               "<=": operator.le, ">": operator.gt, ">=": operator.ge}
+
+
+def tokenize(expression):
+    """Splits an SQL expression into tokens.
+
+    Parameters:
+        expression = SQL expression
+
+    Return:
+        Returns list of (token type, token value) tuples, where token type is one of
+        'number', 'string', 'name', 'keyword', 'op' or 'punct'"""
+    tokens = []
+    pos = 0
+    while pos < len(expression):
+        match = TOKEN_PATTERN.match(expression, pos)
+        if match is None:
+            raise ValueError("Unsupported character in expression at position {0}: '{1}'".format(pos, expression[pos:]))
+        pos = match.end()
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind == "space":
+            continue
+        if kind == "number":
+            tokens.append(("number", float(value)))
+        elif kind == "string":
+            tokens.append(("string", value[1:-1].replace("''", "'")))
+        elif kind == "quoted":
+            tokens.append(("name", value[1:-1]))
+        elif kind == "name" and value.upper() in KEYWORDS:
+            tokens.append(("keyword", value.upper()))
+        else:
+            tokens.append((kind, value))
+    return tokens
+
+
+class ExpressionParser(object):
+    """Recursive descent parser producing a tree of nested tuples from SQL expression tokens."""
+    def __init__(self, tokens):
+        """Initialize parser at the first token."""
+        self.tokens = tokens
+        self.pos = 0
+
+    def peek(self, kind=None, value=None):
+        """Returns True if the current token matches the token type and value (if specified)."""
+        if self.pos >= len(self.tokens):
+            return False
+        token = self.tokens[self.pos]
+        return (kind is None or token[0] == kind) and (value is None or token[1] == value)
+
+    def next(self, kind=None, value=None):
+        """Returns the current token and moves to the next token, raising ValueError if the current token does not match."""
+        if not self.peek(kind, value):
+            found = self.tokens[self.pos][1] if self.pos < len(self.tokens) else "end of expression"
+            raise ValueError("Expected {0} but found '{1}' in expression".format(value or kind, found))
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def parse(self):
+        """Returns the expression tree of all tokens."""
+        tree = self.parseOr()
+        if self.pos < len(self.tokens):
+            raise ValueError("Unexpected '{0}' in expression".format(self.tokens[self.pos][1]))
+        return tree
+
+    def parseOr(self):
+        """Parses expressions separated by OR."""
+        tree = self.parseAnd()
+        while self.peek("keyword", "OR"):
+            self.next()
+            tree = ("or", tree, self.parseAnd())
+        return tree
+
+    def parseAnd(self):
+        """Parses expressions separated by AND."""
+        tree = self.parseNot()
+        while self.peek("keyword", "AND"):
+            self.next()
+            tree = ("and", tree, self.parseNot())
+        return tree
+
+    def parseNot(self):
+        """Parses an expression preceded by any number of NOT."""
+        if self.peek("keyword", "NOT"):
+            self.next()
+            return ("not", self.parseNot())
+        return self.parsePredicate()
+
+    def parsePredicate(self):
+        """Parses a parenthesized expression, comparison or predicate (IS NULL, IN, BETWEEN, LIKE)."""
+        if self.peek("punct", "("):
+            self.next()
+            tree = self.parseOr()
+            self.next("punct", ")")
+            return tree
+
+        left = self.parseOperand()
+        if self.peek("op"):
+            op = self.next()[1]
+            return ("compare", op, left, self.parseOperand())
+        if self.peek("keyword", "IS"):
+            self.next()
+            negate = self.peek("keyword", "NOT")
+            if negate:
+                self.next()
+            self.next("keyword", "NULL")
+            tree = ("null", left)
+            return ("not", tree) if negate else tree
+
+        negate = self.peek("keyword", "NOT")
+        if negate:
+            self.next()
+        if self.peek("keyword", "IN"):
+            self.next()
+            self.next("punct", "(")
+            values = [self.parseOperand()]
+            while self.peek("punct", ","):
+                self.next()
+                values.append(self.parseOperand())
+            self.next("punct", ")")
+            tree = ("in", left, values)
+        elif self.peek("keyword", "BETWEEN"):
+            self.next()
+            low = self.parseOperand()
+            self.next("keyword", "AND")
+            tree = ("between", left, low, self.parseOperand())
+        elif self.peek("keyword", "LIKE"):
+            self.next()
+            pattern = self.next("string")[1]
+            escape = None
+            if self.peek("keyword", "ESCAPE"):
+                self.next()
+                escape = self.next("string")[1]
+            tree = ("like", left, likeRegex(pattern, escape))
+        else:
+            found = self.tokens[self.pos][1] if self.pos < len(self.tokens) else "end of expression"
+            raise ValueError("Expected comparison or predicate but found '{0}' in expression".format(found))
+        return ("not", tree) if negate else tree
+
+    def parseOperand(self):
+        """Parses a field name or a literal value (number, signed number, string or date)."""
+        if self.peek("punct", "-") or self.peek("punct", "+"):
+            sign = -1.0 if self.next()[1] == "-" else 1.0
+            return ("literal", sign * self.next("number")[1])
+        if self.peek("number") or self.peek("string"):
+            return ("literal", self.next()[1])
+        if self.peek("keyword", "DATE"):
+            self.next()
+            dateString = self.next("string")[1].strip()
+            for dateFormat in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d"):
+                try:
+                    return ("literal", datetime.strptime(dateString, dateFormat))
+                except ValueError:
+                    continue
+            raise ValueError("Unsupported date literal in expression: '{0}'".format(dateString))
+        if self.peek("name"):
+            return ("field", self.next()[1])
+        found = self.tokens[self.pos][1] if self.pos < len(self.tokens) else "end of expression"
+        raise ValueError("Expected field name or value but found '{0}' in expression".format(found))
+
+
+def likeRegex(pattern, escape=None):
+    """Converts an SQL LIKE pattern (% and _ wildcards) to a compiled regular expression."""
+    regex = ""
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if escape is not None and char == escape and i + 1 < len(pattern):
+            i += 1
+            regex += re.escape(pattern[i])
+        elif char == "%":
+            regex += ".*"
+        elif char == "_":
+            regex += "."
+        else:
+            regex += re.escape(char)
+        i += 1
+    return re.compile(regex + r"\Z", re.DOTALL)
+
+
+def compileExpression(expression):
+    """Compiles an SQL expression into an expression tree.
+
+    Parameters:
+        expression = SQL expression (subset described in the module docstring)
+
+    Return:
+        Returns expression tree (nested tuples) to be evaluated with evaluate.
+        Raises ValueError if the expression is not supported."""
+    return ExpressionParser(tokenize(expression)).parse()
+
+
+def operandValues(operand, columns, numRows):
+    """Returns values and known (not null) mask of an operand, as arrays of the number of rows."""
+    if operand[0] == "literal":
+        value = operand[1]
+        values = np.empty(numRows, dtype=np.float64 if isinstance(value, float) else object)
+        values[:] = value
+        return values, np.ones(numRows, dtype=bool)
+
+    # Field names are not case sensitive
+    name = operand[1]
+    if name not in columns:
+        matches = [fld for fld in columns if fld.upper() == name.upper()]
+        if matches == []:
+            raise ValueError("Field '{0}' of expression not found in attribute columns".format(name))
+        name = matches[0]
+    values = np.asarray(columns[name])
+    if values.dtype.kind == "f":
+        return values, ~np.isnan(values)
+    if values.dtype.kind in "iub":
+        return values, np.ones(numRows, dtype=bool)
+    return values, np.array([value is not None for value in values], dtype=bool)
+
+
+def valueKind(value):
+    """Returns the kind of a value compared by an expression ('number', 'string', 'date' or the name of its type)."""
+    if isinstance(value, (bool, np.bool_)):
+        return "number"
+    if isinstance(value, (int, float, np.number)) or type(value).__name__ == "long":
+        return "number"
+    if hasattr(value, "encode"):
+        return "string"
+    if isinstance(value, datetime):
+        return "date"
+    return type(value).__name__
+
+
+def compareValues(op, left, right, known):
+    """Applies a comparison operator to the known values of two arrays (vectorized for numeric arrays).
+
+    Raises ValueError if values of different kinds are compared (e.g. a number with a string or a date)."""
+    if left.dtype != object and right.dtype != object:
+        with np.errstate(invalid="ignore"):
+            return op(left, right) & known
+    result = np.zeros(len(known), dtype=bool)
+    idx = np.nonzero(known)[0]
+    kinds = set(valueKind(value) for value in left[idx]) | set(valueKind(value) for value in right[idx])
+    if len(kinds) > 1:
+        raise ValueError("Comparison of values of different kinds in expression: {0}".format(", ".join(sorted(kinds))))
+    try:
+        result[idx] = [op(a, b) for a, b in zip(left[idx], right[idx])]
+    except TypeError as e:
+        raise ValueError("Unsupported comparison in expression: {0}".format(str(e)))
+    return result
+
+
+def evaluateTree(tree, columns, numRows):
+    """Evaluates an expression tree, returning the (true, false) masks of SQL three-valued logic."""
+    kind = tree[0]
+    if kind == "or":
+        true1, false1 = evaluateTree(tree[1], columns, numRows)
+        true2, false2 = evaluateTree(tree[2], columns, numRows)
+        return true1 | true2, false1 & false2
+    if kind == "and":
+        true1, false1 = evaluateTree(tree[1], columns, numRows)
+        true2, false2 = evaluateTree(tree[2], columns, numRows)
+        return true1 & true2, false1 | false2
+    if kind == "not":
+        isTrue, isFalse = evaluateTree(tree[1], columns, numRows)
+        return isFalse, isTrue
+    if kind == "null":
+        values, known = operandValues(tree[1], columns, numRows)
+        return ~known, known
+    if kind == "compare":
+        left, leftKnown = operandValues(tree[2], columns, numRows)
+        right, rightKnown = operandValues(tree[3], columns, numRows)
+        known = leftKnown & rightKnown
+        isTrue = compareValues(COMPARISONS[tree[1]], left, right, known)
+        return isTrue, known & ~isTrue
+    if kind == "in":
+        isTrue = np.zeros(numRows, dtype=bool)
+        isFalse = np.ones(numRows, dtype=bool)
+        for value in tree[2]:
+            valueTrue, valueFalse = evaluateTree(("compare", "=", tree[1], value), columns, numRows)
+            isTrue |= valueTrue
+            isFalse &= valueFalse
+        return isTrue, isFalse
+    if kind == "between":
+        return evaluateTree(("and", ("compare", ">=", tree[1], tree[2]), ("compare", "<=", tree[1], tree[3])), columns, numRows)
+    if kind == "like":
+        values, known = operandValues(tree[1], columns, numRows)
+        isTrue = np.zeros(numRows, dtype=bool)
+        idx = np.nonzero(known)[0]
+        isTrue[idx] = [tree[2].match(value if hasattr(value, "encode") else str(value)) is not None for value in values[idx]]
+        return isTrue, known & ~isTrue
+    raise ValueError("Unsupported expression element: '{0}'".format(kind))
+
+
+def evaluate(tree, columns, numRows):
+    """Evaluates a compiled expression tree against attribute columns.
+
+    Parameters:
+        tree = Expression tree returned by compileExpression
+        columns = Dictionary of attribute arrays by field name
+        numRows = Number of rows (length of the attribute arrays)
+
+    Return:
+        Returns boolean array, True for rows where the expression is true"""
+    return evaluateTree(tree, columns, numRows)[0]
+
+
+def selectMask(columns, numRows, keepExpression=None, rejectExpression=None):
+    """Determines the rows meeting the attribute selection criteria and not meeting the rejection criteria.
+
+    Equivalent to a NEW_SELECTION with the selection criteria followed by a
+    REMOVE_FROM_SELECTION with the rejection criteria (or a SWITCH_SELECTION of the
+    rejection criteria if no selection criteria are specified).
+
+    Parameters:
+        columns = Dictionary of attribute arrays by field name
+        numRows = Number of rows (length of the attribute arrays)
+        keepExpression = SQL expression which the selected rows must meet (all rows if None)
+        rejectExpression = SQL expression of rows removed from the selection (none if None)
+
+    Return:
+        Returns boolean array, True for selected rows"""
+    mask = np.ones(numRows, dtype=bool)
+    if keepExpression is not None:
+        mask &= evaluate(compileExpression(keepExpression), columns, numRows)
+    if rejectExpression is not None:
+        mask &= ~evaluate(compileExpression(rejectExpression), columns, numRows)
+    return mask
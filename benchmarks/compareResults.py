@@ -0,0 +1,166 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#==============================================================================#
+# HISTORY                                                                      #
+# -------                                                                      #
+# Developed October 2026.                                                      #
+#==============================================================================#
+"""USAGE
+Standalone script, run from the command line (arcpy is not required):
+
+    python benchmarks/compareResults.py serial.csv parallel.csv
+
+Checks that two exports of the consolidated persistent targets feature class
+(e.g. a run with 1 worker process and a run with several worker processes of the
+"Buffer and Union" engine, on the same dark targets and radii) hold the same
+persistence, weight and cluster fields.
+
+SUMMARY
+The exported attribute tables (see 'resultExport.py', CSV or Parquet) are read
+and indexed by targetID. Both exports must have the same targetIDs and the same
+persistence ('pers*'/'Ypers*'), weight ('wght*'/'Ywght*') and cluster ID
+('clst*'/'Yclst*') fields. Persistence and weight values must be equal for
+every dark target. Cluster IDs are arbitrary numbers, so the clusters are
+compared as groups of targetIDs: each cluster of one export must have the same
+dark targets and the same time span (in months, after the decimal point of the
+cluster ID) as a cluster of the other export.
+
+INPUT
+- Exports (user input): Paths of the two CSV (or Parquet, requires 'pyarrow')
+exports to compare.
+
+OUTPUT
+- Report (automated output): Differences printed for each field. The exit code
+is 1 if the exports differ, 0 otherwise.
+
+ADDITIONAL FUNCTIONS (explained in script below)
+- readExport
+- resultFields
+- clusterGroups
+- compareExports
+- main"""
+
+# Libraries
+# =========
+import os
+import sys
+import csv
+import argparse
+
+# Prefixes of the persistence, weight and cluster ID fields of the day-to-day and year-to-year analyses
+VALUE_PREFIXES = ("pers", "wght", "Ypers", "Ywght")
+CLUSTER_PREFIXES = ("clst", "Yclst")
+
+
+def readExport(path):
+    """Reads an exported attribute table into a dictionary of rows (dictionary of column values) by targetID.
+
+    Parameters:
+        path = Path of the CSV or Parquet export
+
+    Return:
+        Returns tuple of the list of column names and the dictionary of rows by targetID
+        (values as strings, empty string for null values)"""
+    if os.path.splitext(path)[1].lower() == ".parquet":
+        import pyarrow.parquet
+        table = pyarrow.parquet.read_table(path)
+        columnNames = table.column_names
+        columns = [table.column(name).to_pylist() for name in columnNames]
+        rows = [["" if value is None else str(value) for value in values] for values in zip(*columns)]
+    else:
+        with open(path, "rb" if sys.version_info[0] == 2 else "r") as csvFile:
+            reader = csv.reader(csvFile)
+            columnNames = next(reader)
+            rows = list(reader)
+    targetIndex = columnNames.index("targetID")
+    return columnNames, dict((row[targetIndex], dict(zip(columnNames, row))) for row in rows)
+
+
+def resultFields(columnNames):
+    """Returns the sorted lists of persistence and weight fields and of cluster ID fields of the column names."""
+    valueFields = sorted(name for name in columnNames if name.startswith(VALUE_PREFIXES) and name[len(name.rstrip("0123456789")):] != "")
+    clusterFields = sorted(name for name in columnNames if name.startswith(CLUSTER_PREFIXES) and name[len(name.rstrip("0123456789")):] != "")
+    return valueFields, clusterFields
+
+
+def clusterGroups(rows, clusterField):
+    """Groups the targetIDs of the dark targets by cluster ID.
+
+    Parameters:
+        rows = Dictionary of rows by targetID
+        clusterField = Cluster ID field
+
+    Return:
+        Returns set of (frozenset of targetIDs, time span) tuples, one per cluster"""
+    groups = {}
+    for targetID in rows:
+        clusterID = rows[targetID][clusterField]
+        if clusterID != "":
+            groups.setdefault(clusterID, set()).add(targetID)
+    return set((frozenset(groups[clusterID]), clusterID.split(".")[-1]) for clusterID in groups)
+
+
+def compareExports(firstPath, secondPath):
+    """Compares the persistence, weight and cluster fields of two exports.
+
+    Parameters:
+        firstPath = Path of the first export (e.g. serial run)
+        secondPath = Path of the second export (e.g. parallel run)
+
+    Return:
+        Returns list of difference messages (empty list if the exports hold the same results)"""
+    firstColumns, firstRows = readExport(firstPath)
+    secondColumns, secondRows = readExport(secondPath)
+    differences = []
+
+    # Same dark targets and result fields
+    missing = set(firstRows) ^ set(secondRows)
+    if missing:
+        differences.append(str(len(missing)) + " targetIDs not in both exports (e.g. " + sorted(missing)[0] + ")")
+    firstValues, firstClusters = resultFields(firstColumns)
+    secondValues, secondClusters = resultFields(secondColumns)
+    for name in sorted(set(firstValues + firstClusters) ^ set(secondValues + secondClusters)):
+        differences.append("'" + name + "' field not in both exports")
+    if firstClusters == [] and firstValues != []:
+        differences.append("No cluster ID field in " + firstPath)
+    targetIDs = sorted(set(firstRows) & set(secondRows))
+
+    # Persistence and weight values of every dark target
+    for name in sorted(set(firstValues) & set(secondValues)):
+        unequal = [targetID for targetID in targetIDs if firstRows[targetID][name] != secondRows[targetID][name]]
+        if unequal:
+            differences.append("'" + name + "' values differ for " + str(len(unequal)) + " dark targets (e.g. " + unequal[0] + ")")
+
+    # Clusters compared as groups of targetIDs (cluster IDs are arbitrary numbers)
+    common = dict((targetID, firstRows[targetID]) for targetID in targetIDs)
+    commonSecond = dict((targetID, secondRows[targetID]) for targetID in targetIDs)
+    for name in sorted(set(firstClusters) & set(secondClusters)):
+        firstGroups = clusterGroups(common, name)
+        secondGroups = clusterGroups(commonSecond, name)
+        if firstGroups != secondGroups:
+            differences.append("'" + name + "' clusters differ: " + str(len(firstGroups - secondGroups)) + " of " + str(len(firstGroups)) +
+                               " clusters not in " + secondPath + ", " + str(len(secondGroups - firstGroups)) + " of " + str(len(secondGroups)) +
+                               " clusters not in " + firstPath)
+    return differences
+
+
+def main(argv=None):
+    """Parses command line arguments, compares the exports and reports the differences."""
+    parser = argparse.ArgumentParser(description="Comparison of the persistence, weight and cluster fields of two persistent targets exports.")
+    parser.add_argument("first", help="Path of the first export (CSV or Parquet), e.g. serial run")
+    parser.add_argument("second", help="Path of the second export (CSV or Parquet), e.g. parallel run")
+    args = parser.parse_args(argv)
+
+    differences = compareExports(args.first, args.second)
+    for message in differences:
+        print(message)
+    if differences:
+        print(str(len(differences)) + " differences found")
+        return 1
+    print("Persistence, weight and cluster fields identical")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,325 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#==============================================================================#
+# HISTORY                                                                      #
+# -------                                                                      #
+# Developed October 2026.                                                      #
+#==============================================================================#
+"""USAGE
+Standalone script, run from the command line (arcpy is not required):
+
+    python benchmarks/persistenceBenchmark.py --targets 1000,10000,100000 --slices 10
+
+Use "--help" for every option (random seed, radii, clustering, memory tracing,
+JSON report).
+
+SUMMARY
+Measures how the arcpy-free stages of the temporal persistence analysis scale,
+using seeded synthetic dark targets instead of RADARSAT-2 archives. For each
+scale (number of dark targets per day or year), the following stages are timed:
+    - criteria = Attribute selection and rejection criteria (attributeCriteria.py)
+    - centroids = Shoelace centroid and area of every dark target polygon (centroidEngine.py)
+    - dissolve = Grouping of dark targets by targetID (darkTargetStore.py)
+    - neighbours = Grid index neighbour query at the largest radius (persistenceEngine.py)
+    - geodesic = Geodesic neighbour query at every radius, with planar prefilter (geodesicKernel.py)
+    - persistence = Adjacency matrix, persistence and weight values at every radius (adjacencyMatrix.py)
+    - clusters = Connected components of the adjacency matrix of the largest radius (adjacencyMatrix.py)
+    - join = Hash join of persistence values to every dark target (hashJoin.py)
+
+The same seed always produces the same dark targets, so that results are
+comparable between runs and code versions.
+
+INPUT
+- Number of dark targets per time slice (user input): List of scales to measure.
+
+- Number of time slices (user input): Number of days or years.
+
+- Clustering (user input): Proportion of dark targets located around persistent
+sites (seeps), number of sites and spread of targets around each site (metres).
+
+OUTPUT
+- Report (automated output): Table printed for every scale and stage, with the wall
+time (seconds), throughput (dark targets per second) and peak memory allocated
+during the stage (MB, measured with tracemalloc when available).
+
+- JSON report (optional output): Same results, written to the specified file.
+
+ADDITIONAL FUNCTIONS (explained in script below)
+- generateTargets
+- buildStore
+- measure
+- runBenchmark
+- main"""
+
+# Libraries
+# =========
+import os
+import sys
+import json
+import time
+import argparse
+from datetime import datetime, timedelta
+import numpy as np
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+# Toolbox modules are located in the parent folder of the benchmarks folder
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+try:
+    reload
+except NameError:
+    # Toolbox modules use the Python 2 reload built-in to refresh memory in ArcGIS
+    import importlib
+    import builtins
+    builtins.reload = importlib.reload
+import darkTargetStore
+import hashJoin
+import persistenceEngine
+import geodesicKernel
+import centroidEngine
+import adjacencyMatrix
+
+# Default attribute criteria of the "3_Temporal Persistence Analysis" tool
+KEEP_EXPRESSION = "PcontrDb < -2.5 AND PwindMin < 4 AND SwindMean > 2 AND SwindMean < 10 AND Lcard < 10 AND Ldens < 0.0000075 AND SstdDb_Th < Th_SstdDb"
+REJECT_EXPRESSION = "Pice = 1 OR PnearLand = 1 OR PeulerN < -50"
+
+# Memory allocations traced during each stage (disabled with the "--no-memory" option)
+TRACE_MEMORY = True
+
+# Extent of the synthetic dark targets (metres, NAD 1983 Canada Atlas Lambert)
+EXTENT = (-2500000.0, 500000.0, -1500000.0, 1500000.0)
+
+
+def generateTargets(numTargets, numSlices, seed=0, clusterFraction=0.2, numSites=500, siteSpread=1000.0, yearly=False):
+    """Generates seeded synthetic dark targets (one square polygon per targetID).
+
+    Parameters:
+        numTargets = Number of dark targets per time slice
+        numSlices = Number of time slices (days or years)
+        seed = Random seed
+        clusterFraction = Proportion of dark targets located around persistent sites
+        numSites = Number of persistent sites
+        siteSpread = Standard deviation of the distance of clustered targets to their site (metres)
+        yearly = Boolean value indicating whether time slices are years (otherwise days)
+
+    Return:
+        Returns dictionary with the list of times and arrays of targetID, slice, x, y,
+        polygon coordinates (with ring, part and feature offsets) and attribute columns"""
+    rng = np.random.RandomState(seed)
+    total = numTargets * numSlices
+    xMin, yMin, xMax, yMax = EXTENT
+    sites = np.column_stack([rng.uniform(xMin, xMax, numSites), rng.uniform(yMin, yMax, numSites)])
+
+    # Centroids: clustered around persistent sites or uniformly distributed
+    clustered = rng.uniform(size=total) < clusterFraction
+    site = rng.randint(0, numSites, total)
+    x = np.where(clustered, sites[site, 0] + rng.normal(0, siteSpread, total), rng.uniform(xMin, xMax, total))
+    y = np.where(clustered, sites[site, 1] + rng.normal(0, siteSpread, total), rng.uniform(yMin, yMax, total))
+    slices = np.repeat(np.arange(numSlices, dtype=np.int32), numTargets)
+
+    # Times and targetIDs (pid_YYYYMMDD_HHMMSS)
+    start = datetime(2010, 1, 1)
+    if yearly:
+        times = [str(2010 + i) for i in range(numSlices)]
+        dates = [datetime(2010 + i, 6, 1) for i in range(numSlices)]
+    else:
+        dates = [start + timedelta(days=i) for i in range(numSlices)]
+        times = [date.strftime("%Y%m%d") for date in dates]
+    pid = rng.randint(100000, 999999, total)
+    seconds = rng.randint(0, 86400, total)
+    targetIDs = np.empty(total, dtype=object)
+    targetIDs[:] = ["{0}_{1}".format(pid[i], (dates[slices[i]] + timedelta(seconds=int(seconds[i]))).strftime("%Y%m%d_%H%M%S"))
+                    for i in range(total)]
+
+    # Square polygons (one ring, one part) of random half width around each centroid
+    halfWidth = rng.uniform(50.0, 500.0, total)
+    corners = np.array([[-1, -1], [-1, 1], [1, 1], [1, -1], [-1, -1]], dtype=np.float64)
+    coords = (np.column_stack([x, y])[:, None, :] + corners[None, :, :] * halfWidth[:, None, None]).reshape(-1, 2)
+    offsets = np.arange(total + 1, dtype=np.int64)
+
+    # Attribute columns (distributions roughly following the conditioned dark targets)
+    columns = {"Pid": pid.astype(np.float64),
+               "PwindMin": rng.gamma(2.0, 2.0, total),
+               "SwindMean": rng.gamma(3.0, 2.0, total),
+               "Lcard": rng.poisson(4, total).astype(np.float64),
+               "Ldens": rng.exponential(0.00001, total),
+               "PcontrDb": rng.normal(-3.0, 1.5, total),
+               "SstdDb_Th": rng.normal(1.0, 0.5, total),
+               "Th_SstdDb": rng.normal(1.2, 0.5, total),
+               "Pice": (rng.uniform(size=total) < 0.05).astype(np.float64),
+               "PnearLand": (rng.uniform(size=total) < 0.1).astype(np.float64),
+               "PeulerN": rng.normal(-10.0, 20.0, total)}
+
+    return {"times": times, "targetID": targetIDs, "slice": slices, "x": x, "y": y, "area": (2 * halfWidth) ** 2,
+            "coords": coords, "ringOffsets": offsets * 5, "partOffsets": offsets, "featureOffsets": offsets,
+            "columns": columns}
+
+
+def buildStore(data):
+    """Builds an in-memory dark target store from synthetic dark targets (equivalent of loadFeatureClass, without arcpy).
+
+    Parameters:
+        data = Dictionary of synthetic dark targets returned by generateTargets
+
+    Return:
+        Returns darkTargetStore.DarkTargetStore object"""
+    store = darkTargetStore.DarkTargetStore()
+    for sliceTime in data["times"]:
+        store.addSlice(sliceTime, "RS2_" + sliceTime)
+    total = len(data["targetID"])
+    store.sources = ["synthetic"]
+    for fld in sorted(data["columns"]):
+        store.fieldTypes[fld] = ("Double", 8)
+        store.fieldOrder.append(fld)
+        store.columns[fld] = data["columns"][fld]
+    store.targetID = data["targetID"]
+    store.oid = np.arange(1, total + 1, dtype=np.int64)
+    store.slice = data["slice"]
+    store.source = np.zeros(total, dtype=np.int32)
+    store.x = data["x"]
+    store.y = data["y"]
+    store.area = data["area"]
+    store.selected = np.ones(total, dtype=bool)
+    store.coords = data["coords"]
+    store.ringOffsets = data["ringOffsets"]
+    store.partOffsets = data["partOffsets"]
+    store.featureOffsets = data["featureOffsets"]
+    store.featureTarget = np.repeat(-1, total)
+    return store
+
+
+def measure(function, *args):
+    """Runs a function, measuring its wall time and peak memory allocation.
+
+    Memory tracing slows down stages creating many Python objects (e.g. clusters),
+    it can be disabled with the TRACE_MEMORY module variable ("--no-memory" option).
+
+    Parameters:
+        function = Function to run
+        args = Arguments of the function
+
+    Return:
+        Returns the result of the function, the wall time (seconds) and the peak
+        memory allocated during the function (MB, None if tracemalloc is not available)"""
+    trace = tracemalloc is not None and TRACE_MEMORY
+    if trace:
+        tracemalloc.start()
+    start = time.time()
+    result = function(*args)
+    elapsed = time.time() - start
+    peak = None
+    if trace:
+        peak = tracemalloc.get_traced_memory()[1] / 1048576.0
+        tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def runBenchmark(numTargets, numSlices, radii, seed, clusterFraction, numSites, siteSpread):
+    """Times every stage of the persistence analysis for one scale.
+
+    Parameters:
+        numTargets = Number of dark targets per time slice
+        numSlices = Number of time slices
+        radii = List of persistence radii (metres)
+        seed = Random seed
+        clusterFraction, numSites, siteSpread = Clustering parameters (see generateTargets)
+
+    Return:
+        Returns list of dictionaries (one per stage) with the stage name, number of dark
+        targets processed, wall time, throughput and peak memory"""
+    data = generateTargets(numTargets, numSlices, seed, clusterFraction, numSites, siteSpread)
+    store = buildStore(data)
+    total = len(store)
+    results = []
+
+    def record(stage, count, elapsed, peak, **details):
+        result = {"stage": stage, "targets": numTargets, "slices": numSlices, "count": count,
+                  "seconds": round(elapsed, 4), "throughput": round(count / elapsed, 1) if elapsed > 0 else None,
+                  "peakMB": None if peak is None else round(peak, 2)}
+        result.update(details)
+        results.append(result)
+
+    mask, elapsed, peak = measure(store.criteriaMask, KEEP_EXPRESSION, REJECT_EXPRESSION)
+    record("criteria", total, elapsed, peak, selected=int(mask.sum()))
+
+    centroids, elapsed, peak = measure(centroidEngine.polygonCentroids, store.coords, store.ringOffsets, store.partOffsets, store.featureOffsets)
+    record("centroids", total, elapsed, peak)
+
+    # All targets remain selected for the remaining stages, so that scales are comparable
+    targets, elapsed, peak = measure(store.dissolveByTargetID)
+    record("dissolve", total, elapsed, peak, dissolved=len(targets["targetID"]))
+
+    maxRadius = max(radii)
+    neighbours, elapsed, peak = measure(lambda: persistenceEngine.sortNeighbours(
+        *persistenceEngine.findNeighbours(targets["x"], targets["y"], targets["slice"], maxRadius)))
+    record("neighbours", total, elapsed, peak, pairs=len(neighbours[0]) // 2, radius=maxRadius)
+
+    geodesic, elapsed, peak = measure(geodesicKernel.findGeodesicNeighbours, targets["x"], targets["y"], targets["slice"], radii)
+    record("geodesic", total, elapsed, peak, pairs=len(geodesic[0]) // 2, radius=maxRadius)
+
+    matrices = {}
+
+    def persistence():
+        values = {}
+        for radius in radii:
+            matrices[radius] = adjacencyMatrix.fromPairs(len(targets["targetID"]), *persistenceEngine.withinRadius(neighbours, radius))
+            values[radius] = adjacencyMatrix.persistence(matrices[radius], targets["slice"])
+        return values
+    values, elapsed, peak = measure(persistence)
+    record("persistence", total * len(radii), elapsed, peak, radii=list(radii))
+
+    clusterList, elapsed, peak = measure(adjacencyMatrix.clusters, matrices[maxRadius], targets["targetID"])
+    record("clusters", len(neighbours[0]) // 2, elapsed, peak, clusters=len(clusterList))
+
+    # Join persistence and weight values of the largest radius to every dark target by targetID (as joinField)
+    def join():
+        persis, weight = values[maxRadius]
+        joinDict = hashJoin.buildJoinDict(zip(targets["targetID"], persis, weight), 1)
+        return [joinDict.get(tid) for tid in store.targetID]
+    joined, elapsed, peak = measure(join)
+    record("join", total, elapsed, peak, matched=sum(1 for row in joined if row is not None))
+
+    return results
+
+
+def main(argv=None):
+    """Parses command line arguments, runs the benchmark at every scale and reports the results."""
+    parser = argparse.ArgumentParser(description="Benchmark of the arcpy-free temporal persistence stages on synthetic dark targets.")
+    parser.add_argument("--targets", default="1000,10000,100000", help="Comma separated numbers of dark targets per time slice")
+    parser.add_argument("--slices", type=int, default=10, help="Number of time slices (days or years)")
+    parser.add_argument("--radii", default="1000,5000,10000", help="Comma separated persistence radii (metres)")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--cluster-fraction", type=float, default=0.2, help="Proportion of dark targets around persistent sites")
+    parser.add_argument("--sites", type=int, default=500, help="Number of persistent sites")
+    parser.add_argument("--spread", type=float, default=1000.0, help="Spread of dark targets around persistent sites (metres)")
+    parser.add_argument("--no-memory", action="store_true", help="Do not trace memory allocations (removes tracing overhead from the wall times)")
+    parser.add_argument("--json", help="Path of the JSON report to write")
+    args = parser.parse_args(argv)
+
+    global TRACE_MEMORY
+    TRACE_MEMORY = not args.no_memory
+    radii = [int(radius) for radius in args.radii.split(",")]
+    allResults = []
+    print("{0:>10} {1:>7} {2:<12} {3:>10} {4:>14} {5:>9}".format("targets", "slices", "stage", "seconds", "targets/sec", "peak MB"))
+    for numTargets in [int(n) for n in args.targets.split(",")]:
+        results = runBenchmark(numTargets, args.slices, radii, args.seed, args.cluster_fraction, args.sites, args.spread)
+        for result in results:
+            print("{0:>10} {1:>7} {2:<12} {3:>10.4f} {4:>14} {5:>9}".format(
+                result["targets"], result["slices"], result["stage"], result["seconds"],
+                str(result["throughput"]), str(result["peakMB"])))
+        allResults.extend(results)
+
+    if args.json is not None:
+        report = {"seed": args.seed, "slices": args.slices, "radii": radii, "python": sys.version.split()[0],
+                  "numpy": np.__version__, "results": allResults}
+        with open(args.json, "w") as jsonFile:
+            json.dump(report, jsonFile, indent=2)
+        print("JSON report written to " + args.json)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,303 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#==============================================================================#
+# HISTORY                                                                      #
+# -------                                                                      #
+# Developed October 2026.                                                      #
+#==============================================================================#
+"""USAGE
+Module imported and used by the "temporalPersistence.py", "applyChloro.py" and
+"temporalVisuals.py" scripts and by the dark target store (see
+'darkTargetStore.py') to calculate the centroid of dark target polygons in
+memory, as a replacement to the Feature To Point (CENTROID) geoprocessing tool.
+
+SUMMARY
+Polygon coordinates are flattened into a single coordinate array, with offset
+arrays delimiting the rings, parts (multipart polygons) and features (same
+structure as the dark target store). The signed area and first moments of every
+ring are calculated at once with the shoelace formula, and summed by feature:
+exterior rings (clockwise) and interior rings (counterclockwise) have opposite
+signs, so that holes are subtracted. The centroid of each feature is the ratio of
+its first moments to its area (area-weighted centroid of every part, equivalent
+to the true centroid of the Feature To Point "CENTROID" option). Coordinates are
+translated to the first vertex of each feature before the calculation, to avoid
+the loss of precision of large projected coordinates.
+
+The centroid of a group of polygons (e.g. the polygons sharing a targetID) is
+the area-weighted mean of the centroids of its polygons, equal to the true
+centroid of the dissolved polygon when the polygons do not overlap, so that
+polygons do not need to be unioned (Dissolve) only to locate their centroid.
+
+Centroids are returned as arrays, so that neighbour queries and raster sampling
+do not require a point feature class. A point feature class is only written
+where a geoprocessing tool requires point features as input (e.g. Buffer).
+
+INPUT
+- Polygons (automated input): Feature class, layer or arcpy Polygon objects.
+
+OUTPUT
+- Centroids (automated output): Arrays of centroid x and y coordinates and of
+polygon areas (units of the coordinate system of the polygons).
+
+- Point feature class (optional output): Centroid of each polygon, with the
+attribute fields of the polygons.
+
+ADDITIONAL FUNCTIONS (explained in script below)
+- appendPolygon
+- countsToOffsets
+- ringMoments
+- polygonCentroids
+- groupCentroids
+- readCentroids
+- writeCentroids"""
+
+# Libraries
+# =========
+import os
+import logging
+import numpy as np
+
+# Reload steps required to refresh memory if Catalog is open when changes are made
+import hashJoin                             # get module reference for reload
+reload(hashJoin)                            # reload step 1
+
+# arcpy is only required to read and write feature classes (centroid calculations do not require it)
+try:
+    import arcpy
+except ImportError:
+    arcpy = None
+
+
+def appendPolygon(shape, coords, ringCounts, partCounts, featureCounts):
+    """Appends the coordinates of a polygon to flattened coordinate lists.
+
+    Parameters:
+        shape = arcpy Polygon (interior rings are separated by a null point within each part)
+        coords = List of (x, y) coordinates to which the vertices are appended
+        ringCounts = List of number of vertices of each ring
+        partCounts = List of number of rings of each part
+        featureCounts = List of number of parts of each feature
+
+    Return:
+        No return"""
+    numParts = 0
+    for part in shape:
+        ring = []
+        numRings = 0
+        for pnt in part:
+            if pnt is None:
+                coords.extend(ring)
+                ringCounts.append(len(ring))
+                numRings += 1
+                ring = []
+            else:
+                ring.append((pnt.X, pnt.Y))
+        coords.extend(ring)
+        ringCounts.append(len(ring))
+        partCounts.append(numRings + 1)
+        numParts += 1
+    featureCounts.append(numParts)
+
+
+def countsToOffsets(counts):
+    """Returns array of offsets (starting at 0, one more than the number of counts) from a list of counts."""
+    offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum(np.asarray(counts, dtype=np.int64))
+    return offsets
+
+
+def ringMoments(coords, ringOffsets):
+    """Calculates the signed area and first moments of every ring with the shoelace formula.
+
+    Parameters:
+        coords = Array of vertex coordinates (N x 2)
+        ringOffsets = Array of offsets of the first vertex of each ring (number of rings + 1)
+
+    Return:
+        Returns three arrays with one value per ring: signed area (negative for clockwise
+        rings), and first moments about the y and x axes (sums of (x1 + x2) * cross and
+        (y1 + y2) * cross, to be divided by 6 times the area)"""
+    coords = np.asarray(coords, dtype=np.float64).reshape(-1, 2)
+    ringOffsets = np.asarray(ringOffsets, dtype=np.int64)
+    numRings = len(ringOffsets) - 1
+    ringCounts = np.diff(ringOffsets)
+    if len(coords) == 0:
+        return np.zeros(numRings), np.zeros(numRings), np.zeros(numRings)
+
+    # Index of the next vertex of each vertex (last vertex of each ring followed by its first vertex)
+    nextIdx = np.arange(1, len(coords) + 1)
+    nonEmpty = ringCounts > 0
+    nextIdx[ringOffsets[1:][nonEmpty] - 1] = ringOffsets[:-1][nonEmpty]
+
+    x = coords[:, 0]
+    y = coords[:, 1]
+    cross = x * y[nextIdx] - x[nextIdx] * y
+    ringIdx = np.repeat(np.arange(numRings), ringCounts)
+    area = np.bincount(ringIdx, cross, numRings) / 2.0
+    momentX = np.bincount(ringIdx, (x + x[nextIdx]) * cross, numRings)
+    momentY = np.bincount(ringIdx, (y + y[nextIdx]) * cross, numRings)
+    return area, momentX, momentY
+
+
+def polygonCentroids(coords, ringOffsets, partOffsets, featureOffsets):
+    """Calculates the centroid and area of a contiguous range of flattened polygons.
+
+    Parameters:
+        coords = Array of vertex coordinates (N x 2)
+        ringOffsets = Array of offsets of the first vertex of each ring
+        partOffsets = Array of offsets of the first ring of each part
+        featureOffsets = Array of offsets of the first part of each feature (may be a
+        contiguous slice of the feature offsets of larger arrays, e.g. the store)
+
+    Return:
+        Returns three arrays with one value per feature: centroid x and y coordinates
+        and area. Features without area (degenerate rings) are located at the mean of
+        their vertices, features without vertices have NaN coordinates."""
+    featureOffsets = np.asarray(featureOffsets, dtype=np.int64)
+    numFeatures = len(featureOffsets) - 1
+    if numFeatures <= 0:
+        return np.zeros(0), np.zeros(0), np.zeros(0)
+
+    # Limit offset arrays and coordinates to the range of features (offsets relative to the start of the range)
+    parts = np.asarray(partOffsets, dtype=np.int64)[featureOffsets[0]:featureOffsets[-1] + 1]
+    rings = np.asarray(ringOffsets, dtype=np.int64)[parts[0]:parts[-1] + 1]
+    coords = np.asarray(coords, dtype=np.float64).reshape(-1, 2)[rings[0]:rings[-1]]
+    featureOffsets = featureOffsets - featureOffsets[0]
+    parts = parts - parts[0]
+    rings = rings - rings[0]
+
+    # Feature of every ring and of every vertex
+    ringFeature = np.repeat(np.arange(numFeatures), parts[featureOffsets[1:]] - parts[featureOffsets[:-1]])
+    vertexCounts = np.bincount(ringFeature, np.diff(rings), numFeatures)
+    coordFeature = np.repeat(ringFeature, np.diff(rings))
+
+    # Translate coordinates to the first vertex of each feature
+    firstVertex = np.minimum(rings[parts[featureOffsets[:-1]]], max(len(coords) - 1, 0))
+    origin = coords[firstVertex] if len(coords) > 0 else np.zeros((numFeatures, 2))
+    local = coords - origin[coordFeature]
+
+    area, momentX, momentY = ringMoments(local, rings)
+    featureArea = np.bincount(ringFeature, area, numFeatures)
+    featureMomentX = np.bincount(ringFeature, momentX, numFeatures)
+    featureMomentY = np.bincount(ringFeature, momentY, numFeatures)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        x = featureMomentX / (6.0 * featureArea)
+        y = featureMomentY / (6.0 * featureArea)
+
+        # Features without area located at the mean of their vertices
+        degenerate = featureArea == 0
+        if degenerate.any():
+            x[degenerate] = (np.bincount(coordFeature, local[:, 0], numFeatures) / vertexCounts)[degenerate]
+            y[degenerate] = (np.bincount(coordFeature, local[:, 1], numFeatures) / vertexCounts)[degenerate]
+    return x + origin[:, 0], y + origin[:, 1], np.abs(featureArea)
+
+
+def groupCentroids(x, y, area, groups, numGroups):
+    """Calculates the area-weighted centroid of groups of polygons from the centroid and area of each polygon.
+
+    Parameters:
+        x, y = Arrays of centroid coordinates of the polygons
+        area = Array of area of the polygons
+        groups = Array of group index of each polygon
+        numGroups = Number of groups
+
+    Return:
+        Returns two arrays with one value per group: centroid x and y coordinates (true
+        centroid of the union of the polygons of the group, if they do not overlap).
+        Groups without area are located at the mean of their polygon centroids, groups
+        without polygons have NaN coordinates."""
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    area = np.asarray(area, dtype=np.float64)
+    groups = np.asarray(groups, dtype=np.int64)
+
+    # Translate centroids to the first polygon of each group
+    origin = np.zeros((numGroups, 2))
+    present, first = np.unique(groups, return_index=True)
+    origin[present, 0] = x[first]
+    origin[present, 1] = y[first]
+    localX = x - origin[groups, 0]
+    localY = y - origin[groups, 1]
+
+    groupArea = np.bincount(groups, area, numGroups)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cx = np.bincount(groups, localX * area, numGroups) / groupArea
+        cy = np.bincount(groups, localY * area, numGroups) / groupArea
+
+        # Groups without area located at the mean of their polygon centroids
+        degenerate = groupArea == 0
+        if degenerate.any():
+            counts = np.bincount(groups, minlength=numGroups)
+            cx[degenerate] = (np.bincount(groups, localX, numGroups) / counts)[degenerate]
+            cy[degenerate] = (np.bincount(groups, localY, numGroups) / counts)[degenerate]
+    return cx + origin[:, 0], cy + origin[:, 1]
+
+
+def readCentroids(fc, fields=None, whereClause=None, spatialReference=None):
+    """Reads the polygons of a feature class (or layer) and calculates their centroids.
+
+    Parameters:
+        fc = Polygon feature class or layer
+        fields = List of attribute fields to read along with the polygons (optional)
+        whereClause = Optional SQL expression limiting the polygons read
+        spatialReference = Optional spatial reference in which the polygons are read (projected by the cursor)
+
+    Return:
+        Returns dictionary of arrays with one value per polygon: 'oid', 'x', 'y', 'area'
+        and one array (object) per attribute field"""
+    fields = list(fields or [])
+    oids = []
+    values = [[] for fld in fields]
+    coords, ringCounts, partCounts, featureCounts = [], [], [], []
+    with arcpy.da.SearchCursor(fc, ["OID@", "SHAPE@"] + fields, whereClause, spatialReference) as cursor:
+        for row in cursor:
+            if row[1] is None:
+                continue
+            oids.append(row[0])
+            for i in range(len(fields)):
+                values[i].append(row[i + 2])
+            appendPolygon(row[1], coords, ringCounts, partCounts, featureCounts)
+
+    x, y, area = polygonCentroids(np.array(coords, dtype=np.float64).reshape(-1, 2), countsToOffsets(ringCounts),
+                                  countsToOffsets(partCounts), countsToOffsets(featureCounts))
+    centroids = {"oid": np.array(oids, dtype=np.int64), "x": x, "y": y, "area": area}
+    for i in range(len(fields)):
+        column = np.empty(len(values[i]), dtype=object)
+        column[:] = values[i]
+        centroids[fields[i]] = column
+    logging.info("Centroid Engine: Centroids of '%d' polygons calculated from '%s'", len(oids), fc)
+    return centroids
+
+
+def writeCentroids(fc, outFC, whereClause=None):
+    """Writes the centroid of each polygon of a feature class (or layer) to a new point feature class (replacement to Feature To Point with the CENTROID option).
+
+    Parameters:
+        fc = Polygon feature class or layer
+        outFC = Path of the point feature class to create
+        whereClause = Optional SQL expression limiting the polygons written
+
+    Return:
+        Returns number of points written. The attribute fields of the polygons are
+        copied, and the OID of each polygon is recorded in the 'ORIG_FID' field."""
+    desc = arcpy.Describe(fc)
+    fields = [fld for fld in arcpy.ListFields(fc) if fld.type in hashJoin.JOIN_FIELD_TYPES and fld.type != "OID" and
+              fld.name.upper() not in ("SHAPE_LENGTH", "SHAPE_AREA", "ORIG_FID")]
+    fieldNames = [fld.name for fld in fields]
+    centroids = readCentroids(fc, fieldNames, whereClause)
+
+    arcpy.CreateFeatureclass_management(os.path.dirname(outFC), os.path.basename(outFC), "POINT", spatial_reference=desc.spatialReference)
+    for fld in fields:
+        if fld.type == "String":
+            arcpy.AddField_management(outFC, fld.name, "TEXT", field_length=fld.length)
+        else:
+            arcpy.AddField_management(outFC, fld.name, hashJoin.JOIN_FIELD_TYPES[fld.type])
+    arcpy.AddField_management(outFC, "ORIG_FID", "LONG")
+
+    with arcpy.da.InsertCursor(outFC, ["SHAPE@XY"] + fieldNames + ["ORIG_FID"]) as cursor:
+        for i in range(len(centroids["oid"])):
+            cursor.insertRow([(centroids["x"][i], centroids["y"][i])] + [centroids[fld][i] for fld in fieldNames] + [int(centroids["oid"][i])])
+    logging.info("Centroid Engine: '%s' point feature class created from centroid of '%d' polygons in '%s'", outFC, len(centroids["oid"]), fc)
+    return len(centroids["oid"])
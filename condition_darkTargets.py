@@ -13,19 +13,20 @@ tool in the "GEM2_Oil_Seep_Detection_Analysis" Python Toolbox.
 
 SUMMARY
 This script separates all the dark targets from the 'NOS_XXXX_RSimageinfo'
-shapefile for a selected year produced by the visual interpretation process
-on RADARSAT-2 imagery following GEM1 development. The data is cleaned up and
+shapefile produced by the visual interpretation process on RADARSAT-2 imagery
+following GEM1 development into one folder per year. The data is cleaned up and
 same day acquisitions are merged together into a single feature class per day.
-The data is conditioned and organized in a file geodatabase that is created
-with the same name and located in the same directory as the selected folder.
+The data of each year is conditioned and organized in a file geodatabase that
+is created with the same name and located in the same directory as the year
+folder.
 
 INPUT
 - NOS File (user input):'NOS_XXXX_RSimageinfo' shapefile developed by Step 1.
 
 OUTPUT
 - Yearly Data File Geodatabase (automated output): A file geodatabase is
-produced in the same folder of the input year folder and is also named the same
-as the input year folder. (e.g. 2010.gdb) The FGDB contains the feature classes
+produced for each year of the NOS file in the same folder of the year folder
+and is also named the same as the year folder. (e.g. 2010.gdb) The FGDB contains the feature classes
 of all the dark targets per acquisition day, as well as the working files used
 in the conditioning, which are placed in the "dark_features", "feature_overlap"
 and "feature_union" feature datasets."""
@@ -35,6 +36,7 @@ and "feature_union" feature datasets."""
 import arcpy
 import os
 import logging
+import stageProfiler
 
 import convertGEM1toGEM2                                    # get module reference for reload
 reload(convertGEM1toGEM2)                                   # reload step 1
@@ -100,7 +102,16 @@ class condition_darkTargets(object):
             parameterType="Derived",
             direction="Output")
 
-        params = [params0, params1, params2, params3]
+        params4 = arcpy.Parameter(
+            displayName="Input: Worker Processes (Load Dark Targets)",
+            name="workerCount",
+            datatype="GPLong",
+            parameterType="Optional",
+            direction="Input")
+
+        params4.value = 1
+
+        params = [params0, params1, params2, params3, params4]
 
         return params
 
@@ -119,6 +130,7 @@ class condition_darkTargets(object):
         parameter.  This method is called after internal validation."""
         return
 
+    @stageProfiler.profiledExecute
     def execute(self, parameters, messages):
         """The source code of the tool."""
         # Set log configuration
@@ -136,39 +148,52 @@ class condition_darkTargets(object):
         conversion = convertGEM1toGEM2()
         conversionparams = conversion.getParameterInfo()
         conversionparams[0] = parameters[0]
-        feature_folder = conversion.execute(conversionparams)
-        arcpy.SetParameterAsText(3, feature_folder)
-        arcpy.AddMessage("Succesfully converted {} to GEM2 formatting/n/n".format(parameters[0]))
-
-        # ========================= #
-        # Create File GDB Structure #
-        # ========================= #
-        arcpy.AddMessage("Running createGDBStruct.py for {}/n/n".format(parameters[0]))
-        createGDB = createGDBStruct()
-        createGDBparams = createGDB.getParameterInfo()
-        # Define products folder value (parent directory to year folder)
-        createGDBparams[0] = os.path.dirname(parameters[3].valueAsText)
-        # Define File GDB name value (based on year folder being processed)
-        createGDBparams[1] = os.path.basename(parameters[3].valueAsText)
-        # Execute Create File GDB script
-        feat_DS, gdbWorkspace = createGDB.execute(createGDBparams, None)
-        # Assign return dataset values to output parameters
-        arcpy.SetParameterAsText(1, feat_DS)
-        arcpy.SetParameterAsText(2, gdbWorkspace)
-        arcpy.AddMessage("Completed createGDBStruct.py for {}/n/n".format(parameters[0]))
-
-        # ============================ #
-        # Load Dark Targets shapefiles #
-        # ============================ #
-
-        loadSHP = loadDarkTargets()
-        loadSHPparams = loadSHP.getParameterInfo()
-        # Define year workspace folder value
-        loadSHPparams[0] = parameters[3]
-        # Define dark features dataset value
-        loadSHPparams[1] = parameters[1]
-        # Execute Load Dark Targets script
-        loadSHP.execute(loadSHPparams, None)
+        year_folders = conversion.execute(conversionparams)
+        if year_folders == []:
+            arcpy.AddWarning("No dark targets found in {}, nothing to condition".format(parameters[0]))
+            logging.info("condition_darkTargets.py script finished (no dark targets).\n\n")
+            return
+        arcpy.SetParameterAsText(3, year_folders[0])
+        arcpy.AddMessage("Succesfully converted {} to GEM2 formatting for {} year(s)/n/n".format(parameters[0], len(year_folders)))
+
+        # Condition the dark targets of every year folder of the NOS file
+        for year_folder in year_folders:
+            arcpy.AddMessage("Conditioning {}/n/n".format(year_folder))
+            logging.info("Conditioning '%s' year folder\n", year_folder)
+
+            # ========================= #
+            # Create File GDB Structure #
+            # ========================= #
+            arcpy.AddMessage("Running createGDBStruct.py for {}/n/n".format(year_folder))
+            createGDB = createGDBStruct()
+            createGDBparams = createGDB.getParameterInfo()
+            # Define products folder value (parent directory to year folder)
+            createGDBparams[0] = os.path.dirname(year_folder)
+            # Define File GDB name value (based on year folder being processed)
+            createGDBparams[1] = os.path.basename(year_folder)
+            # Execute Create File GDB script
+            feat_DS, gdbWorkspace = createGDB.execute(createGDBparams, None)
+            # Assign return dataset values of the first year to output parameters
+            if year_folder == year_folders[0]:
+                arcpy.SetParameterAsText(1, feat_DS)
+                arcpy.SetParameterAsText(2, gdbWorkspace)
+            arcpy.AddMessage("Completed createGDBStruct.py for {}/n/n".format(year_folder))
+
+            # ============================ #
+            # Load Dark Targets shapefiles #
+            # ============================ #
+
+            loadSHP = loadDarkTargets()
+            loadSHPparams = loadSHP.getParameterInfo()
+            # Define year workspace folder value
+            loadSHPparams[0].value = year_folder
+            # Define dark features dataset value
+            loadSHPparams[1].value = feat_DS
+            # Define number of worker processes value
+            if len(parameters) > 4:
+                loadSHPparams[2] = parameters[4]
+            # Execute Load Dark Targets script
+            loadSHP.execute(loadSHPparams, None)
 
         logging.info("condition_darkTargets.py script finished.\n\n")
 
@@ -24,6 +24,12 @@ dark targets which contains two sets of attributes. A default value is entered,
 however the parameter can be customized.
 
 OUTPUT
+- Dark target shapefiles (automated output): 'dark_target' shapefile of each
+Radarsat-2 image in the '<year>/<image>/Features' folder, for every year of the
+NOS file. The NOS file is read once and each row is written to the shapefile of
+its image (see 'partitionWriter.py'). The year folders are returned (sorted) for
+the subsequent conditioning steps of each year.
+
 - Yearly Data File Geodatabase (automated output): A file geodatabase is
 produced in the same folder of the input year folder and is also named the same
 as the input year folder. (e.g. 2010.gdb) The FGDB contains the feature classes
@@ -36,6 +42,11 @@ import os
 import sys
 import datetime
 import logging
+import stageProfiler
+
+# Reload steps required to refresh memory if Catalog is open when changes are made
+import partitionWriter                      # get module reference for reload
+reload(partitionWriter)                     # reload step 1
 
 
 class convertGEM1toGEM2(object):
@@ -74,49 +85,47 @@ class convertGEM1toGEM2(object):
         parameter.  This method is called after internal validation."""
         return
 
+    @stageProfiler.profiledExecute
     def execute(self, parameters):
 # structure
         filetochange = parameters[0].valueAsText
         base_folder = os.path.dirname(filetochange)
         field = 'RsatID'
 
-#make list of all dates to make into feature classes
-        images = [row[0] for row in arcpy.da.SearchCursor(filetochange,field)]
-        uniqueImage= sorted(list(set(images)))
-        years = []
-        for item in uniqueImage:
-            years.append(item[33:37])
-        uniqueYears= sorted(list(set(years)))
-        arcpy.AddMessage("Modifying NOS File for the following year(s): {}".format(uniqueYears[0]))
-
-
-#make folder for year
-
-        for year in uniqueYears:
-            year_folder = ("{}\{}".format(base_folder,year))
+#make year, image and features folders of an image (year of the image found in its RsatID) when its first features are written
+        def darkTargetPath(date):
+            year_folder = os.path.join(base_folder,date[33:37])
             if not os.path.exists(year_folder):
                 os.makedirs(year_folder)
                 arcpy.AddMessage("Created {} folder\n".format(year_folder))
-
-            #create shapefile for each date
-            for date in uniqueImage:
-                image_folder = os.path.join(year_folder,date)
-                if not os.path.exists(image_folder):
-                 os.makedirs(image_folder)
-                 arcpy.AddMessage("Created {} folder".format(date))
-                features_folder = os.path.join(image_folder,'Features')
-                if not os.path.exists(features_folder):
-                 os.makedirs(features_folder)
-
-                #set up selection
-                sqlexpression = "\"RsatID\" =" "\'{}\'".format(date)
-                changelyr = os.path.splitext(os.path.basename(filetochange))[0]+"_lyr"
-
-                #create layer and select proper date
-                arcpy.MakeFeatureLayer_management(filetochange,changelyr)
-                arcpy.SelectLayerByAttribute_management(changelyr,"NEW_SELECTION",sqlexpression)
-
-                #save layer as shape file
-                arcpy.CopyFeatures_management(changelyr,os.path.join(features_folder,'dark_target'))
-                arcpy.AddMessage("Saved {} to {}".format(date,year_folder))
-            return year_folder
\ No newline at end of file
+            image_folder = os.path.join(year_folder,date)
+            if not os.path.exists(image_folder):
+                os.makedirs(image_folder)
+                arcpy.AddMessage("Created {} folder".format(date))
+            features_folder = os.path.join(image_folder,'Features')
+            if not os.path.exists(features_folder):
+                os.makedirs(features_folder)
+            return os.path.join(features_folder,'dark_target.shp')
+
+#route each row of the NOS file to the shapefile of its image in a single pass
+        writer = partitionWriter.PartitionWriter(filetochange, darkTargetPath)
+        rsatIndex = writer.fields.index(field)
+        with stageProfiler.stage("Partition NOS file") as record:
+            with arcpy.da.SearchCursor(filetochange,writer.fields) as cursor:
+                for row in cursor:
+                    writer.add(row[rsatIndex], row)
+            counts = writer.close()
+            record["rows"] = sum(counts.values())
+        if counts == {}:
+            arcpy.AddWarning("No features found in {}, no year folder created".format(filetochange))
+            logging.info("Convert GEM1 to GEM2: No features found in '%s'", filetochange)
+            return []
+        uniqueImage = sorted(counts)
+        uniqueYears = sorted(list(set([item[33:37] for item in uniqueImage])))
+        for date in uniqueImage:
+            arcpy.AddMessage("Saved {} ({} features) to {}".format(date,counts[date],os.path.join(base_folder,date[33:37])))
+        arcpy.AddMessage("Modified NOS File for the following year(s): {}".format(", ".join(uniqueYears)))
+        logging.info("Convert GEM1 to GEM2: '%d' images of '%d' year(s) written from '%s'", len(uniqueImage), len(uniqueYears), filetochange)
+
+#every year folder is returned for the subsequent conditioning steps
+        return [os.path.join(base_folder,year) for year in uniqueYears]
@@ -41,6 +41,7 @@ as the input year folder. (e.g. 2010.gdb) The FGDB contains the "dark_features",
 import arcpy
 import os
 import logging
+import stageProfiler
 
 
 class createGDBStruct(object):
@@ -86,6 +87,7 @@ class createGDBStruct(object):
         parameter.  This method is called after internal validation."""
         return
 
+    @stageProfiler.profiledExecute
     def execute(self, parameters, messages):
         """The source code of the tool."""
         arcpy.AddMessage("\nCreating File GDB...")
@@ -0,0 +1,524 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#==============================================================================#
+# HISTORY                                                                      #
+# -------                                                                      #
+# Developed October 2026.                                                      #
+#==============================================================================#
+"""USAGE
+Module imported and used by the "temporalPersistence.py" script when the
+"Spatial Index" persistence engine is selected in the "3_Temporal Persistence
+Analysis" tool.
+
+SUMMARY
+In-memory columnar store of dark targets. The dark targets of every input
+feature class are read once into NumPy arrays (attributes, centroid, area and
+flattened polygon coordinates) and are then filtered, dissolved by targetID and
+analyzed for persistence in memory. Interim feature classes and tables (filter,
+targetID, points, buffer, union, dissolve and statistics outputs) are no longer
+written to the analysis GDB; the store is written back to disk only once the
+persistence values are known.
+
+INPUT
+- Dark Targets Feature Classes (automated input): 'RS2_*' feature classes of the
+day to day or year to year analysis, and optional dark targets feature classes
+from other sources.
+
+OUTPUT
+- Columns (in memory): One array per attribute field, plus the following arrays
+with one value per dark target polygon:
+    - targetID = targetID of the dark target
+    - oid = ObjectID of the polygon in its source feature class
+    - slice = Index of the time (day or year) of the dark target in 'times'
+    - source = Index of the feature class of the dark target in 'sources'
+    - x, y = Coordinates of the true centroid of the polygon (see 'centroidEngine.py'),
+    NaN if only the attributes are loaded
+    - area = Area of the polygon (NaN if only the attributes are loaded)
+    - selected = Boolean value indicating whether the polygon meets the attribute
+    selection and rejection criteria
+
+- Geometry (in memory): Polygon (SHAPE@) object of each dark target polygon as
+read from its feature class, written back unchanged. Unless only the attributes
+are loaded, polygon coordinates are also flattened in a single (n, 2) array, with
+ring, part and feature offsets (ring i spans coords[ringOffsets[i]:ringOffsets[i+1]],
+part i spans rings partOffsets[i] to partOffsets[i+1], and feature i spans parts
+featureOffsets[i] to featureOffsets[i+1]).
+
+- Target values (in memory): Values calculated per dissolved targetID (e.g.
+persistence and weight values), applied to every polygon of the targetID when
+the store is written to a feature class.
+
+ADDITIONAL FUNCTIONS (explained in script below)
+- targetIDString
+- DarkTargetStore"""
+
+# Libraries
+# =========
+import os
+import logging
+import numpy as np
+
+# Reload steps required to refresh memory if Catalog is open when changes are made
+import attributeCriteria                    # get module reference for reload
+reload(attributeCriteria)                   # reload step 1
+import persistenceCache                     # get module reference for reload
+reload(persistenceCache)                    # reload step 1
+import centroidEngine                       # get module reference for reload
+reload(centroidEngine)                      # reload step 1
+
+# arcpy is only required to load and write feature classes (the in-memory operations do not require it)
+try:
+    import arcpy
+except ImportError:
+    arcpy = None
+
+# Field types that are not loaded as attribute columns (every other field type is in ADD_FIELD_TYPES)
+SKIP_FIELD_TYPES = ["OID", "Geometry", "GlobalID", "Blob", "Raster"]
+SKIP_FIELD_NAMES = ["Shape_Length", "Shape_Area", "Shape_Leng"]
+
+# Numeric field types (loaded as floating point columns with NaN for null values)
+NUMERIC_FIELD_TYPES = ["Double", "Single", "Integer", "SmallInteger"]
+
+# Field types used to create fields from loaded field types
+ADD_FIELD_TYPES = {"String": "TEXT", "Double": "DOUBLE", "Single": "FLOAT",
+                   "Integer": "LONG", "SmallInteger": "SHORT", "Date": "DATE", "Guid": "GUID"}
+
+
+def targetIDString(value):
+    """Returns targetID value as a string (numeric ID values from other sources are converted, e.g. 1234.0 to '1234')."""
+    if value is None or hasattr(value, "encode"):
+        return value
+    if isinstance(value, float) and value == int(value):
+        value = int(value)
+    return str(value)
+
+
+class DarkTargetStore(object):
+    """Columnar in-memory store of dark target polygons and their attributes."""
+    def __init__(self):
+        """Initialize an empty store."""
+        self.spatialReference = None
+        self.times = []
+        self.sliceNames = []
+        self.sources = []
+        self.fieldTypes = {}
+        self.fieldOrder = []
+        self.columns = {}
+        self.targetID = np.zeros(0, dtype=object)
+        self.oid = np.zeros(0, dtype=np.int64)
+        self.slice = np.zeros(0, dtype=np.int32)
+        self.source = np.zeros(0, dtype=np.int32)
+        self.x = np.zeros(0, dtype=np.float64)
+        self.y = np.zeros(0, dtype=np.float64)
+        self.area = np.zeros(0, dtype=np.float64)
+        self.selected = np.zeros(0, dtype=bool)
+        self.coords = np.zeros((0, 2), dtype=np.float64)
+        self.ringOffsets = np.zeros(1, dtype=np.int64)
+        self.partOffsets = np.zeros(1, dtype=np.int64)
+        self.featureOffsets = np.zeros(1, dtype=np.int64)
+        self.shapes = []
+        self.featureTarget = np.zeros(0, dtype=np.int64)
+        self.targetValues = {}
+        self.targetTypes = {}
+
+    def __len__(self):
+        """Returns the number of dark target polygons in the store."""
+        return len(self.targetID)
+
+    def addSlice(self, time, sliceName):
+        """Returns the index of the time slice, recording the time slice if not already present.
+
+        Parameters:
+            time = Time (day or year) of the slice (e.g. '20100925' or '2010')
+            sliceName = Name of the feature class associated with the time slice (e.g. 'RS2_2010')"""
+        if time not in self.times:
+            self.times.append(time)
+            self.sliceNames.append(sliceName)
+        return self.times.index(time)
+
+    def loadFeatureClass(self, fc, time=None, idField="targetID", whereClause=None, attributes=True, coordinates=True):
+        """Loads the polygons of a feature class (or the polygons meeting a where clause) into the store.
+
+        Parameters:
+            fc = Feature class or shapefile to load
+            time = Time (day or year) of the polygons. If None, the time is taken from the feature class name (e.g. 'RS2_2010' or 'RS2_2010Copy')
+            idField = Field containing the targetID of the polygons
+            whereClause = Optional SQL expression limiting the polygons loaded
+            attributes = Boolean value indicating whether attribute fields (other than the targetID) are loaded
+            coordinates = Boolean value indicating whether polygon coordinates are flattened and centroids calculated
+            (not required to only write the polygons back with new values, centroid and area left NaN)
+
+        Return:
+            No return, the polygons are appended to the store"""
+        fcName = fc.split('\\')[len(fc.split('\\'))-1]
+        if time is None:
+            if fcName.endswith("Copy"):
+                fcName = fcName[:-4]
+            time = fcName.split("_")[1]
+            sliceName = fcName
+        else:
+            sliceName = "dt_" + time
+        sliceIdx = self.addSlice(time, sliceName)
+        self.sources.append(fc)
+        sourceIdx = len(self.sources) - 1
+        if self.spatialReference is None:
+            self.spatialReference = arcpy.Describe(fc).spatialReference
+
+        # Determine attribute fields to load
+        fieldNames = []
+        if attributes:
+            for fld in arcpy.ListFields(fc):
+                if fld.type in SKIP_FIELD_TYPES or fld.name in SKIP_FIELD_NAMES or fld.name == idField:
+                    continue
+                fieldNames.append(fld.name)
+                if fld.name not in self.fieldTypes:
+                    self.fieldTypes[fld.name] = (fld.type, fld.length)
+                    self.fieldOrder.append(fld.name)
+
+        # Read every row once, keeping the polygon objects and flattening polygon coordinates
+        targetIDs, oidList, shapes = [], [], []
+        values = [[] for fld in fieldNames]
+        coords, ringCounts, partCounts, featureCounts = [], [], [], []
+        with arcpy.da.SearchCursor(fc, ["OID@", idField, "SHAPE@"] + fieldNames, whereClause) as cursor:
+            for row in cursor:
+                shape = row[2]
+                if shape is None:
+                    continue
+                oidList.append(row[0])
+                targetIDs.append(targetIDString(row[1]))
+                shapes.append(shape)
+                for i in range(len(fieldNames)):
+                    values[i].append(row[i + 3])
+                if coordinates:
+                    centroidEngine.appendPolygon(shape, coords, ringCounts, partCounts, featureCounts)
+        numRows = len(targetIDs)
+
+        # Calculate centroid and area of every polygon at once from the flattened coordinates (features without parts otherwise)
+        if not coordinates:
+            featureCounts = [0] * numRows
+        coords = np.array(coords, dtype=np.float64).reshape(-1, 2)
+        ringOffsets = centroidEngine.countsToOffsets(ringCounts)
+        partOffsets = centroidEngine.countsToOffsets(partCounts)
+        featureOffsets = centroidEngine.countsToOffsets(featureCounts)
+        if coordinates:
+            x, y, area = centroidEngine.polygonCentroids(coords, ringOffsets, partOffsets, featureOffsets)
+        else:
+            x, y, area = [np.repeat(np.nan, numRows) for i in range(3)]
+
+        for fld in self.fieldOrder:
+            if fld in fieldNames:
+                column = self.makeColumn(fld, values[fieldNames.index(fld)])
+            else:
+                column = self.makeColumn(fld, [None] * numRows)
+            if fld in self.columns:
+                self.columns[fld] = np.concatenate([self.columns[fld], column])
+            else:
+                self.columns[fld] = np.concatenate([self.makeColumn(fld, [None] * len(self)), column])
+
+        self.targetID = np.concatenate([self.targetID, self.makeObjectArray(targetIDs)])
+        self.oid = np.concatenate([self.oid, np.array(oidList, dtype=np.int64)])
+        self.slice = np.concatenate([self.slice, np.repeat(np.int32(sliceIdx), numRows)])
+        self.source = np.concatenate([self.source, np.repeat(np.int32(sourceIdx), numRows)])
+        self.x = np.concatenate([self.x, x])
+        self.y = np.concatenate([self.y, y])
+        self.area = np.concatenate([self.area, area])
+        self.selected = np.concatenate([self.selected, np.ones(numRows, dtype=bool)])
+        self.featureTarget = np.concatenate([self.featureTarget, np.repeat(-1, numRows)])
+        self.shapes.extend(shapes)
+        if numRows > 0:
+            # Offsets of the loaded polygons follow the coordinates, rings and parts already in the store
+            numCoords = len(self.coords)
+            numRings = len(self.ringOffsets) - 1
+            numParts = len(self.partOffsets) - 1
+            self.coords = np.concatenate([self.coords, coords])
+            self.ringOffsets = np.concatenate([self.ringOffsets, ringOffsets[1:] + numCoords])
+            self.partOffsets = np.concatenate([self.partOffsets, partOffsets[1:] + numRings])
+            self.featureOffsets = np.concatenate([self.featureOffsets, featureOffsets[1:] + numParts])
+
+    def makeColumn(self, fld, values):
+        """Converts a list of field values to a column array (floating point for numeric fields, object otherwise).
+
+        Parameters:
+            fld = Name of the field
+            values = List of field values
+
+        Return:
+            Returns column array"""
+        if self.fieldTypes[fld][0] in NUMERIC_FIELD_TYPES:
+            return np.array([np.nan if value is None else value for value in values], dtype=np.float64)
+        return self.makeObjectArray(values)
+
+    def makeObjectArray(self, values):
+        """Converts a list of values to an object array (without NumPy interpreting sequences as dimensions)."""
+        column = np.empty(len(values), dtype=object)
+        column[:] = values
+        return column
+
+    def selectByAttributes(self, fc, keepExpression=None, rejectExpression=None):
+        """Applies the attribute selection and rejection criteria to the polygons loaded from a feature class, recording the result in the 'selected' column.
+
+        The criteria are evaluated on the loaded attribute columns (see 'attributeCriteria.py'). Expressions
+        outside of the supported SQL subset are evaluated by the feature class instead (query of selected ObjectIDs).
+
+        Parameters:
+            fc = Feature class previously loaded in the store
+            keepExpression = SQL expression which the selected polygons must meet (all polygons if None)
+            rejectExpression = SQL expression of polygons removed from the selection (none if None)
+
+        Return:
+            No return"""
+        inSource = self.source == self.sources.index(fc)
+        numRows = int(inSource.sum())
+        try:
+            columns = {"targetID": self.targetID[inSource]}
+            for fld in self.fieldOrder:
+                columns[fld] = self.columns[fld][inSource]
+            selected = attributeCriteria.selectMask(columns, numRows, keepExpression, rejectExpression)
+        except (ValueError, TypeError) as e:
+            logging.info("Attribute Criteria: Criteria evaluated by '%s' feature class (%s)", fc, str(e))
+            selected = np.ones(numRows, dtype=bool)
+            if keepExpression is not None:
+                keepOIDs = arcpy.da.FeatureClassToNumPyArray(fc, ["OID@"], keepExpression)["OID@"]
+                selected &= np.in1d(self.oid[inSource], keepOIDs)
+            if rejectExpression is not None:
+                rejectOIDs = arcpy.da.FeatureClassToNumPyArray(fc, ["OID@"], rejectExpression)["OID@"]
+                selected &= ~np.in1d(self.oid[inSource], rejectOIDs)
+        self.selected[inSource] = selected
+
+    def criteriaMask(self, keepExpression=None, rejectExpression=None):
+        """Evaluates attribute criteria against every polygon of the store, without changing the 'selected' column (e.g. to compare criteria sets).
+
+        Parameters:
+            keepExpression = SQL expression which the selected polygons must meet (all polygons if None)
+            rejectExpression = SQL expression of polygons removed from the selection (none if None)
+
+        Return:
+            Returns boolean array, True for polygons meeting the criteria"""
+        columns = dict(self.columns)
+        columns["targetID"] = self.targetID
+        return attributeCriteria.selectMask(columns, len(self), keepExpression, rejectExpression)
+
+    def polygon(self, i):
+        """Returns the arcpy Polygon of a dark target polygon (SHAPE@ object read from its feature class).
+
+        Parameters:
+            i = Index of the polygon in the store
+
+        Return:
+            Returns arcpy Polygon object"""
+        return self.shapes[i]
+
+    def sliceKey(self, s):
+        """Returns the content key of the polygons of a time slice (coordinates, targetIDs and selection), used to cache values calculated per time slice.
+
+        Parameters:
+            s = Index of the time slice
+
+        Return:
+            Returns content key (see persistenceCache.contentKey)"""
+        inSlice = self.slice == s
+        coordOffsets = self.ringOffsets[self.partOffsets[self.featureOffsets]]
+        coordCounts = np.diff(coordOffsets)
+        targetIDs = "\n".join(["" if value is None else value for value in self.targetID[inSlice]])
+        return persistenceCache.contentKey(self.coords[np.repeat(inSlice, coordCounts)], coordCounts[inSlice],
+                                           targetIDs.encode("utf-8"), self.selected[inSlice])
+
+    def groupByTargetID(self):
+        """Groups the selected polygons by time slice and targetID (without dissolving their geometry).
+
+        Return:
+            Returns dictionary of arrays with one value per targetID:
+                targetID = targetID of the dark target
+                slice = Index of the time (day or year) of the dark target in the 'times' list
+            as well as the list of times ('times') and the selected polygons of each targetID:
+                members = Array of indices of the selected polygons, grouped by targetID (in store order within each targetID)
+                memberOffsets = Array of offsets of the polygons of each targetID in 'members' (polygons of targetID t
+                are members[memberOffsets[t]:memberOffsets[t+1]], one more offset than the number of targetIDs)
+            Targets are ordered by their first selected polygon. The target index of each
+            polygon is recorded in the 'featureTarget' column, including polygons not selected
+            whose targetID has selected polygons (as for a join on targetID), or -1 otherwise."""
+        # Integer key of every polygon from its time slice and targetID (null targetIDs, converted to 'None', distinct from 'None' strings)
+        idStrings = self.targetID.astype("U")
+        isNull = np.zeros(len(self), dtype=bool)
+        candidates = np.nonzero(idStrings == "None")[0]
+        isNull[candidates] = [self.targetID[i] is None for i in candidates]
+        idCodes = np.unique(idStrings, return_inverse=True)[1].reshape(-1)
+        numIDs = int(idCodes.max()) + 1 if len(self) > 0 else 1
+        keys = (self.slice.astype(np.int64) * 2 + isNull) * numIDs + idCodes
+
+        # Targets of the selected polygons, ordered by first selected polygon
+        selectedIdx = np.nonzero(self.selected)[0]
+        uniqueKeys, firstIdx, inverse = np.unique(keys[selectedIdx], return_index=True, return_inverse=True)
+        order = np.argsort(firstIdx, kind="mergesort")
+        rank = np.empty(len(order), dtype=np.int64)
+        rank[order] = np.arange(len(order))
+        memberTarget = rank[inverse.reshape(-1)]
+        numTargets = len(uniqueKeys)
+
+        # Polygons of each target (in store order) from the target of each selected polygon
+        memberOffsets = np.zeros(numTargets + 1, dtype=np.int64)
+        memberOffsets[1:] = np.cumsum(np.bincount(memberTarget, minlength=numTargets))
+        first = selectedIdx[firstIdx[order]]
+        targets = {"times": self.times,
+                   "targetID": self.targetID[first],
+                   "slice": self.slice[first].astype(np.int32),
+                   "members": selectedIdx[np.argsort(memberTarget, kind="mergesort")],
+                   "memberOffsets": memberOffsets}
+
+        # Target of every polygon of the store (selected or not) by key
+        position = np.searchsorted(uniqueKeys, keys)
+        found = position < numTargets
+        found[found] = uniqueKeys[position[found]] == keys[found]
+        self.featureTarget = np.repeat(-1, len(self))
+        self.featureTarget[found] = rank[position[found]]
+        return targets
+
+    def dissolveByTargetID(self, geometry=False, cache=None):
+        """Groups the selected polygons by time slice and targetID (in-memory equivalent of Dissolve on targetID).
+
+        Parameters:
+            geometry = Boolean value indicating whether the dissolved polygons (arcpy Polygon objects) are returned
+            cache = Optional persistence cache (persistenceCache.PersistenceCache) from which the centroids of
+            time slices with unchanged content are reused (not reused if the dissolved polygons are requested)
+
+        Return:
+            Returns the dictionary of groupByTargetID, with the following additional arrays:
+                x, y = Coordinates of the area-weighted centroid of the polygons of the targetID
+                (true centroid of the dissolved polygon, polygons of a targetID not overlapping)
+                geometry = Dissolved polygon (only if requested)
+                sliceKeys = Content key of each time slice (only if a cache is specified)"""
+        targets = self.groupByTargetID()
+        numTargets = len(targets["targetID"])
+        targets["x"] = np.zeros(numTargets, dtype=np.float64)
+        targets["y"] = np.zeros(numTargets, dtype=np.float64)
+        if geometry:
+            targets["geometry"] = [None] * numTargets
+
+        # Reuse centroids of time slices with the same content as a previous analysis
+        reused = np.zeros(numTargets, dtype=bool)
+        reusedSlices = []
+        if cache is not None:
+            targets["sliceKeys"] = [self.sliceKey(s) for s in range(len(self.times))]
+            for s in range(len(self.times)):
+                inSlice = targets["slice"] == s
+                cached = None if geometry else cache.get(targets["sliceKeys"][s])
+                if cached is not None and len(cached["x"]) == inSlice.sum():
+                    targets["x"][inSlice] = cached["x"]
+                    targets["y"][inSlice] = cached["y"]
+                    reused[inSlice] = True
+                    reusedSlices.append(s)
+
+        # Centroid of each targetID from the centroid and area of its polygons (polygons are not unioned)
+        if numTargets > 0 and not reused.all():
+            members = targets["members"]
+            memberTarget = np.repeat(np.arange(numTargets), np.diff(targets["memberOffsets"]))
+            x, y = centroidEngine.groupCentroids(self.x[members], self.y[members], self.area[members], memberTarget, numTargets)
+            targets["x"][~reused] = x[~reused]
+            targets["y"][~reused] = y[~reused]
+
+        # Polygons are only unioned when the dissolved polygons are requested (direct intersection analysis)
+        if geometry:
+            for t in range(numTargets):
+                group = targets["members"][targets["memberOffsets"][t]:targets["memberOffsets"][t + 1]]
+                dissolved = self.polygon(group[0])
+                for i in group[1:]:
+                    dissolved = dissolved.union(self.polygon(i))
+                targets["geometry"][t] = dissolved
+
+        # Record centroids of time slices which were not reused
+        if cache is not None:
+            for s in range(len(self.times)):
+                inSlice = targets["slice"] == s
+                if s not in reusedSlices:
+                    cache.put(targets["sliceKeys"][s], {"x": targets["x"][inSlice], "y": targets["y"][inSlice]},
+                              {"kind": "centroids", "slice": self.sliceNames[s]})
+        return targets
+
+    def targetExtents(self, targets):
+        """Calculates the envelope (bounding box) of the polygons of each dissolved targetID from the flattened coordinates.
+
+        Parameters:
+            targets = Dictionary of dark targets grouped by targetID (returned by groupByTargetID or dissolveByTargetID)
+
+        Return:
+            Returns four arrays with one value per targetID: minimum x, minimum y, maximum x
+            and maximum y coordinates (NaN for targetIDs without coordinates)"""
+        numTargets = len(targets["targetID"])
+        extents = [np.repeat(np.nan, numTargets) for i in range(4)]
+        if numTargets == 0:
+            return extents
+
+        # Envelope of every polygon with coordinates
+        coordOffsets = self.ringOffsets[self.partOffsets[self.featureOffsets]]
+        nonEmpty = np.nonzero(np.diff(coordOffsets) > 0)[0]
+        starts = coordOffsets[nonEmpty]
+        polygonExtents = [np.repeat(np.nan, len(self)) for i in range(4)]
+        for i, (reduce, col) in enumerate(((np.minimum, 0), (np.minimum, 1), (np.maximum, 0), (np.maximum, 1))):
+            if len(starts) > 0:
+                polygonExtents[i][nonEmpty] = reduce.reduceat(self.coords[:, col], starts)
+
+        # Envelope of the polygons of each targetID
+        members = targets["members"]
+        memberTarget = np.repeat(np.arange(numTargets), np.diff(targets["memberOffsets"]))
+        for i, reduce in enumerate((np.fmin, np.fmin, np.fmax, np.fmax)):
+            reduce.at(extents[i], memberTarget, polygonExtents[i][members])
+        return extents
+
+    def setTargetValues(self, name, values, fieldType):
+        """Records values calculated per dissolved targetID (applied to every polygon of the targetID when written).
+
+        Parameters:
+            name = Name of the field to which the values will be written
+            values = Array of values, one per targetID (as returned by groupByTargetID), NaN for null values
+            fieldType = Type of the field to create (e.g. 'SHORT' or 'LONG')
+
+        Return:
+            No return"""
+        self.targetValues[name] = np.asarray(values)
+        self.targetTypes[name] = fieldType
+
+    def writeFeatureClass(self, outFC, rows):
+        """Writes dark target polygons of the store, with their attribute fields and target values, to a new feature class.
+
+        Parameters:
+            outFC = Path of the feature class to create
+            rows = Array of indices of the polygons to write
+
+        Return:
+            No return"""
+        outPath = os.path.dirname(outFC)
+        outName = os.path.basename(outFC)
+        arcpy.CreateFeatureclass_management(outPath, outName, "POLYGON", spatial_reference=self.spatialReference)
+
+        # Create every attribute field of the loaded feature classes (as for a Merge, even if null for the polygons written), followed by targetID and target value fields
+        fieldNames = []
+        for fld in self.fieldOrder:
+            fieldType, fieldLength = self.fieldTypes[fld]
+            if fieldType == "String":
+                arcpy.AddField_management(outFC, fld, "TEXT", field_length=fieldLength)
+            else:
+                arcpy.AddField_management(outFC, fld, ADD_FIELD_TYPES[fieldType])
+            fieldNames.append(fld)
+        arcpy.AddField_management(outFC, "targetID", "TEXT")
+        valueNames = sorted(self.targetValues.keys())
+        for name in valueNames:
+            arcpy.AddField_management(outFC, name, self.targetTypes[name])
+
+        # Insert rows, converting NaN values back to null values
+        with arcpy.da.InsertCursor(outFC, ["SHAPE@"] + fieldNames + ["targetID"] + valueNames) as cursor:
+            for i in rows:
+                row = [self.polygon(i)]
+                for fld in fieldNames:
+                    value = self.columns[fld][i]
+                    if isinstance(value, float) and np.isnan(value):
+                        value = None
+                    row.append(value)
+                row.append(self.targetID[i])
+                target = self.featureTarget[i]
+                for name in valueNames:
+                    value = None if target < 0 else self.targetValues[name][target].item()
+                    if isinstance(value, float) and np.isnan(value):
+                        value = None
+                    row.append(value)
+                cursor.insertRow(row)
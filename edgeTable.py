@@ -0,0 +1,131 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#==============================================================================#
+# HISTORY                                                                      #
+# -------                                                                      #
+# Developed October 2026.                                                      #
+#==============================================================================#
+"""USAGE
+Module imported and used by the "temporalPersistence.py" script when the
+"Spatial Index" persistence engine is selected, to analyze persistence
+incrementally when new days or years are added to a previous analysis.
+
+SUMMARY
+At the end of each analysis, the neighbour pairs of the dark targets (edges
+between dark targets of different times, found at the largest persistence
+radius) are written to an edge table, along with the times, the content key of
+each time slice (see 'persistenceCache.py'), the persistence radii and the name
+of the consolidated output feature class.
+
+When the analysis is executed again after new time slices are added, and every
+time slice of the previous analysis is unchanged, the edges of the previous
+analysis are read from the edge table and only the edges involving the dark
+targets of the new time slices are searched (see
+persistenceEngine.findNewNeighbours).
+
+INPUT
+- Dissolved targets (automated input): Dictionary of dark targets dissolved by
+targetID (see darkTargetStore.dissolveByTargetID, with content keys of each time
+slice).
+
+OUTPUT
+- Edge table (automated output): '<source name>_edges.npz' file in the folder of
+the analysis GDB, with one row per pair of dark targets from different times
+within the largest persistence radius (time and targetID of both targets, and
+their distance).
+
+ADDITIONAL FUNCTIONS (explained in script below)
+- saveEdgeTable
+- loadEdgeTable
+- newSlices
+- mapEdges"""
+
+# Libraries
+# =========
+import os
+import logging
+import numpy as np
+
+# Name suffix of the edge table file (preceded by the name of the analysis source)
+EDGE_SUFFIX = "_edges.npz"
+
+
+def saveEdgeTable(edgeFile, targets, neighbours, radius, distances, output):
+    """Writes the neighbour pairs of the dissolved targets to an edge table (each pair recorded once).
+
+    Parameters:
+        edgeFile = Path of the edge table file
+        targets = Dictionary of dissolved targets (with 'times', 'sliceKeys', 'targetID' and 'slice')
+        neighbours = Tuple of neighbour pair arrays (target indices, neighbouring target indices, distances)
+        radius = Radius at which the neighbour pairs were found
+        distances = List of persistence radii of the analysis
+        output = Path of the consolidated output feature class of the analysis
+
+    Return:
+        No return"""
+    targetIdx, neighbourIdx, distance = neighbours
+    once = targetIdx < neighbourIdx
+    a = targetIdx[once]
+    b = neighbourIdx[once]
+    with open(edgeFile, "wb") as npzFile:
+        np.savez(npzFile, times=np.array(targets["times"], dtype="U"), sliceKeys=np.array(targets["sliceKeys"], dtype="U"),
+                 radius=np.float64(radius), distances=np.array(distances, dtype="U"), output=np.array(output, dtype="U"),
+                 targetA=np.array(targets["targetID"][a].tolist(), dtype="U"), sliceA=targets["slice"][a],
+                 targetB=np.array(targets["targetID"][b].tolist(), dtype="U"), sliceB=targets["slice"][b],
+                 distance=distance[once])
+    logging.info("Edge Table: '%d' edges within '%s' metres written to '%s'", len(a), str(radius), edgeFile)
+
+
+def loadEdgeTable(edgeFile):
+    """Reads an edge table, returning a dictionary of its arrays, or None if the edge table does not exist."""
+    if not os.path.exists(edgeFile):
+        return None
+    with np.load(edgeFile) as npzFile:
+        return dict((name, npzFile[name]) for name in npzFile.files)
+
+
+def newSlices(table, targets, radius, distances):
+    """Determines the time slices added since the analysis of an edge table.
+
+    Parameters:
+        table = Edge table (returned by loadEdgeTable)
+        targets = Dictionary of dissolved targets (with 'times' and 'sliceKeys')
+        radius = Largest persistence radius of the analysis
+        distances = List of persistence radii of the analysis
+
+    Return:
+        Returns list of indices of the time slices not present in the edge table, or None if the
+        edges cannot be reused (time slice of the edge table changed or missing, different
+        persistence radii, or edges found at a smaller radius)"""
+    if float(table["radius"]) < radius or sorted(table["distances"].tolist()) != sorted(distances):
+        return None
+    for time, key in zip(table["times"].tolist(), table["sliceKeys"].tolist()):
+        if time not in targets["times"] or targets["sliceKeys"][targets["times"].index(time)] != key:
+            return None
+    return [s for s in range(len(targets["times"])) if targets["times"][s] not in table["times"].tolist()]
+
+
+def mapEdges(table, targets):
+    """Maps the edges of an edge table to the indices of the dissolved targets.
+
+    Parameters:
+        table = Edge table (returned by loadEdgeTable)
+        targets = Dictionary of dissolved targets (with 'times', 'targetID' and 'slice')
+
+    Return:
+        Returns the three arrays of persistenceEngine.findNeighbours (each pair present in
+        both directions), or None if a target of the edge table is not found"""
+    targetKeys = np.array([targets["times"][s] + "|" + t for s, t in zip(targets["slice"], targets["targetID"])], dtype="U")
+    order = np.argsort(targetKeys, kind="mergesort")
+    sortedKeys = targetKeys[order]
+    indices = []
+    for side in ("A", "B"):
+        edgeKeys = np.char.add(np.char.add(table["times"][table["slice" + side]], "|"), table["target" + side])
+        pos = np.minimum(np.searchsorted(sortedKeys, edgeKeys), max(len(sortedKeys) - 1, 0))
+        if len(edgeKeys) > 0 and (len(sortedKeys) == 0 or not (sortedKeys[pos] == edgeKeys).all()):
+            return None
+        indices.append(order[pos] if len(edgeKeys) > 0 else np.zeros(0, np.int64))
+    a, b = indices
+    distance = table["distance"]
+    return np.concatenate([a, b]), np.concatenate([b, a]), np.concatenate([distance, distance])
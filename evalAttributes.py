@@ -41,6 +41,7 @@ This has the effect of merging the original polygon geometries with a single set
 import arcpy
 import os
 import logging
+import stageProfiler
 
 
 class evalAttributes(object):
@@ -86,6 +87,7 @@ class evalAttributes(object):
         parameter.  This method is called after internal validation."""
         return
 
+    @stageProfiler.profiledExecute
     def execute(self, parameters, messages):
         """The source code of the tool."""
         arcpy.AddMessage("\nEvaluating overlapping attributes...")
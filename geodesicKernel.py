@@ -0,0 +1,255 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#==============================================================================#
+# HISTORY                                                                      #
+# -------                                                                      #
+# Developed October 2026.                                                      #
+#==============================================================================#
+"""USAGE
+Module imported and used by the "temporalPersistence.py" script when the
+"Spatial Index" persistence engine is selected, so that dark targets are
+considered persistent at the same geodesic distances as the GEODESIC buffers of
+the "Buffer and Union" engine. The functions below do not require arcpy and
+operate on NumPy arrays of target centroids only.
+
+SUMMARY
+Calculates geodesic distances between batches of dark target centroids:
+    - Centroids in the planar coordinate system of the analysis (NAD 1983 Canada
+    Atlas Lambert, a Lambert Conformal Conic projection of the GRS 1980 ellipsoid)
+    are converted to longitude and latitude with the inverse projection.
+    - Distances are calculated with the haversine formula (sphere of the mean
+    radius of the ellipsoid, accurate to about 0.5%).
+    - Distances within the haversine error of a persistence radius are refined
+    with Vincenty's inverse formula on the ellipsoid (accurate to less than a
+    millimetre), so that every pair is classified exactly at each radius.
+
+Candidate pairs are found with the planar grid index (see 'persistenceEngine.py')
+at the persistence radius multiplied by the largest scale factor of the projection
+at the latitudes of the targets, so that no pair within the geodesic radius is
+missed, and only the candidate pairs are measured geodesically.
+
+INPUT
+- Centroid coordinates (x, y) of every dark target, in NAD 1983 Canada Atlas
+Lambert (meters).
+
+- Time slice index of every dark target, and persistence radii (meters).
+
+OUTPUT
+- Neighbour pairs: Same arrays as persistenceEngine.findNeighbours, with geodesic
+distances (meters).
+
+ADDITIONAL FUNCTIONS (explained in script below)
+- lambertConstants
+- lambertToGeographic
+- geographicToLambert
+- lambertScaleFactor
+- haversineDistance
+- vincentyDistance
+- geodesicDistance
+- findGeodesicNeighbours"""
+
+# Libraries
+# =========
+import numpy as np
+
+# Reload steps required to refresh memory if Catalog is open when changes are made
+import persistenceEngine                    # get module reference for reload
+reload(persistenceEngine)                   # reload step 1
+
+# GRS 1980 ellipsoid (NAD 1983 datum)
+SEMI_MAJOR_AXIS = 6378137.0
+FLATTENING = 1 / 298.257222101
+MEAN_RADIUS = SEMI_MAJOR_AXIS * (1 - FLATTENING / 3)
+
+# NAD 1983 Canada Atlas Lambert projection parameters (EPSG 3978)
+ATLAS_LAMBERT_WKID = 3978
+STANDARD_PARALLEL_1 = 49.0
+STANDARD_PARALLEL_2 = 77.0
+LATITUDE_OF_ORIGIN = 49.0
+CENTRAL_MERIDIAN = -95.0
+
+# Relative difference from a persistence radius within which haversine distances are refined with Vincenty's formula
+REFINE_TOLERANCE = 0.006
+
+# Relative margin added to the planar search radius of the candidate pairs
+PREFILTER_MARGIN = 0.001
+
+
+def lambertConstants():
+    """Returns the eccentricity and the constants (n, F, rho0) of the NAD 1983 Canada Atlas Lambert projection."""
+    e = np.sqrt(2 * FLATTENING - FLATTENING ** 2)
+
+    def m(phi):
+        return np.cos(phi) / np.sqrt(1 - (e * np.sin(phi)) ** 2)
+
+    def t(phi):
+        return np.tan(np.pi / 4 - phi / 2) / ((1 - e * np.sin(phi)) / (1 + e * np.sin(phi))) ** (e / 2)
+
+    phi1, phi2, phi0 = np.radians([STANDARD_PARALLEL_1, STANDARD_PARALLEL_2, LATITUDE_OF_ORIGIN])
+    n = (np.log(m(phi1)) - np.log(m(phi2))) / (np.log(t(phi1)) - np.log(t(phi2)))
+    F = m(phi1) / (n * t(phi1) ** n)
+    rho0 = SEMI_MAJOR_AXIS * F * t(phi0) ** n
+    return e, n, F, rho0
+
+
+def lambertToGeographic(x, y, iterations=8):
+    """Converts NAD 1983 Canada Atlas Lambert coordinates to longitude and latitude (inverse projection).
+
+    Parameters:
+        x = Array of x coordinates (meters)
+        y = Array of y coordinates (meters)
+        iterations = Number of iterations of the latitude (converges to less than 1e-12 degree in 5 iterations)
+
+    Return:
+        Returns arrays of longitude and latitude (decimal degrees, NAD 1983)"""
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    e, n, F, rho0 = lambertConstants()
+    rho = np.sign(n) * np.sqrt(x ** 2 + (rho0 - y) ** 2)
+    t = (rho / (SEMI_MAJOR_AXIS * F)) ** (1 / n)
+    theta = np.arctan2(np.sign(n) * x, np.sign(n) * (rho0 - y))
+    lon = np.degrees(theta / n) + CENTRAL_MERIDIAN
+    phi = np.pi / 2 - 2 * np.arctan(t)
+    for i in range(iterations):
+        esin = e * np.sin(phi)
+        phi = np.pi / 2 - 2 * np.arctan(t * ((1 - esin) / (1 + esin)) ** (e / 2))
+    return lon, np.degrees(phi)
+
+
+def geographicToLambert(lon, lat):
+    """Converts longitude and latitude (decimal degrees, NAD 1983) to NAD 1983 Canada Atlas Lambert coordinates (meters)."""
+    e, n, F, rho0 = lambertConstants()
+    phi = np.radians(np.asarray(lat, dtype=np.float64))
+    t = np.tan(np.pi / 4 - phi / 2) / ((1 - e * np.sin(phi)) / (1 + e * np.sin(phi))) ** (e / 2)
+    rho = SEMI_MAJOR_AXIS * F * t ** n
+    theta = n * np.radians(np.asarray(lon, dtype=np.float64) - CENTRAL_MERIDIAN)
+    return rho * np.sin(theta), rho0 - rho * np.cos(theta)
+
+
+def lambertScaleFactor(lat):
+    """Returns the scale factor of the NAD 1983 Canada Atlas Lambert projection (planar distance / true distance) at each latitude."""
+    e, n, F, rho0 = lambertConstants()
+    phi = np.radians(np.asarray(lat, dtype=np.float64))
+    t = np.tan(np.pi / 4 - phi / 2) / ((1 - e * np.sin(phi)) / (1 + e * np.sin(phi))) ** (e / 2)
+    m = np.cos(phi) / np.sqrt(1 - (e * np.sin(phi)) ** 2)
+    return n * F * t ** n / m
+
+
+def haversineDistance(lon1, lat1, lon2, lat2):
+    """Returns array of great circle distances (meters) between two sets of points (decimal degrees) on a sphere of the mean radius of the ellipsoid."""
+    lon1, lat1, lon2, lat2 = [np.radians(np.asarray(v, dtype=np.float64)) for v in (lon1, lat1, lon2, lat2)]
+    h = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * MEAN_RADIUS * np.arcsin(np.sqrt(np.minimum(h, 1.0)))
+
+
+def vincentyDistance(lon1, lat1, lon2, lat2, maxIterations=100, tolerance=1e-12):
+    """Returns geodesic distances (meters) between two sets of points (decimal degrees) on the GRS 1980 ellipsoid (Vincenty's inverse formula).
+
+    Parameters:
+        lon1, lat1 = Arrays of longitude and latitude of the first points
+        lon2, lat2 = Arrays of longitude and latitude of the second points
+        maxIterations = Maximum number of iterations of the longitude difference on the auxiliary sphere
+        tolerance = Convergence tolerance of the longitude difference (radians)
+
+    Return:
+        Returns array of distances and boolean array indicating which distances converged
+        (distances between nearly antipodal points may not converge)"""
+    a = SEMI_MAJOR_AXIS
+    f = FLATTENING
+    b = a * (1 - f)
+    lon1, lat1, lon2, lat2 = [np.radians(np.asarray(v, dtype=np.float64)) for v in (lon1, lat1, lon2, lat2)]
+    L = lon2 - lon1
+    U1 = np.arctan((1 - f) * np.tan(lat1))
+    U2 = np.arctan((1 - f) * np.tan(lat2))
+    sinU1, cosU1 = np.sin(U1), np.cos(U1)
+    sinU2, cosU2 = np.sin(U2), np.cos(U2)
+
+    lam = L.copy()
+    converged = np.zeros(len(L), dtype=bool)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        for i in range(maxIterations):
+            sinLam, cosLam = np.sin(lam), np.cos(lam)
+            sinSigma = np.sqrt((cosU2 * sinLam) ** 2 + (cosU1 * sinU2 - sinU1 * cosU2 * cosLam) ** 2)
+            cosSigma = sinU1 * sinU2 + cosU1 * cosU2 * cosLam
+            sigma = np.arctan2(sinSigma, cosSigma)
+            sinAlpha = np.where(sinSigma > 0, cosU1 * cosU2 * sinLam / sinSigma, 0.0)
+            cos2Alpha = 1 - sinAlpha ** 2
+            cos2SigmaM = np.where(cos2Alpha > 0, cosSigma - 2 * sinU1 * sinU2 / cos2Alpha, 0.0)
+            C = f / 16 * cos2Alpha * (4 + f * (4 - 3 * cos2Alpha))
+            lamPrevious = lam
+            lam = L + (1 - C) * f * sinAlpha * (sigma + C * sinSigma * (cos2SigmaM + C * cosSigma * (-1 + 2 * cos2SigmaM ** 2)))
+            converged = np.abs(lam - lamPrevious) < tolerance
+            if converged.all():
+                break
+
+        u2 = cos2Alpha * (a ** 2 - b ** 2) / b ** 2
+        A = 1 + u2 / 16384 * (4096 + u2 * (-768 + u2 * (320 - 175 * u2)))
+        B = u2 / 1024 * (256 + u2 * (-128 + u2 * (74 - 47 * u2)))
+        deltaSigma = B * sinSigma * (cos2SigmaM + B / 4 * (cosSigma * (-1 + 2 * cos2SigmaM ** 2) -
+                                                           B / 6 * cos2SigmaM * (-3 + 4 * sinSigma ** 2) * (-3 + 4 * cos2SigmaM ** 2)))
+        distance = b * A * (sigma - deltaSigma)
+    return distance, converged & np.isfinite(distance)
+
+
+def geodesicDistance(lon1, lat1, lon2, lat2, radii=None):
+    """Returns geodesic distances (meters) between two sets of points (decimal degrees).
+
+    Distances are calculated with the haversine formula. If persistence radii are
+    specified, distances within the haversine error (REFINE_TOLERANCE) of any radius
+    are refined with Vincenty's formula, so that their comparison to each radius is
+    exact. Every distance is refined if no radius is specified.
+
+    Parameters:
+        lon1, lat1 = Arrays of longitude and latitude of the first points
+        lon2, lat2 = Arrays of longitude and latitude of the second points
+        radii = List of persistence radii (meters), or None
+
+    Return:
+        Returns array of distances"""
+    distance = haversineDistance(lon1, lat1, lon2, lat2)
+    if radii is None:
+        refine = np.ones(len(distance), dtype=bool)
+    else:
+        refine = np.zeros(len(distance), dtype=bool)
+        for radius in radii:
+            refine |= np.abs(distance - float(radius)) <= REFINE_TOLERANCE * float(radius)
+    if refine.any():
+        idx = np.nonzero(refine)[0]
+        refined, converged = vincentyDistance(np.asarray(lon1)[idx], np.asarray(lat1)[idx], np.asarray(lon2)[idx], np.asarray(lat2)[idx])
+        distance[idx[converged]] = refined[converged]
+    return distance
+
+
+def findGeodesicNeighbours(x, y, slices, radii, newSlices=None):
+    """Finds every pair of targets from different time slices located within the largest radius of each other (geodesic distance).
+
+    Parameters:
+        x = Array of target centroid x coordinates (NAD 1983 Canada Atlas Lambert)
+        y = Array of target centroid y coordinates (NAD 1983 Canada Atlas Lambert)
+        slices = Array of time slice index of each target
+        radii = List of persistence radii (pairs are found at the largest radius, distances are exact at every radius)
+        newSlices = List of indices of new time slices (see persistenceEngine.findNewNeighbours), or None for every pair
+
+    Return:
+        Returns the three arrays of persistenceEngine.findNeighbours (each pair present in
+        both directions), with geodesic distances"""
+    radii = [float(radius) for radius in radii]
+    radius = max(radii)
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    if len(x) == 0:
+        return np.zeros(0, np.int64), np.zeros(0, np.int64), np.zeros(0, np.float64)
+    lon, lat = lambertToGeographic(x, y)
+
+    # Planar prefilter: search radius enlarged by the largest scale factor at the latitudes of the targets
+    planarRadius = radius * max(1.0, float(lambertScaleFactor(lat).max())) * (1 + PREFILTER_MARGIN)
+    if newSlices is None:
+        targetIdx, neighbourIdx, planar = persistenceEngine.findNeighbours(x, y, slices, planarRadius)
+    else:
+        targetIdx, neighbourIdx, planar = persistenceEngine.findNewNeighbours(x, y, slices, newSlices, planarRadius)
+
+    # Geodesic distance of candidate pairs
+    distance = geodesicDistance(lon[targetIdx], lat[targetIdx], lon[neighbourIdx], lat[neighbourIdx], radii)
+    keep = distance <= radius
+    return targetIdx[keep], neighbourIdx[keep], distance[keep]
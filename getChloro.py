@@ -51,6 +51,7 @@ import ftplib
 from ftplib import FTP
 import logging
 import time
+import stageProfiler
 
 
 class getChloro(object):
@@ -107,6 +108,7 @@ class getChloro(object):
         parameter.  This method is called after internal validation."""
         return
 
+    @stageProfiler.profiledExecute
     def execute(self, parameters, messages):
         """The source code of the tool."""
         # Set log configuration
@@ -31,6 +31,7 @@ import os
 import sys
 import datetime
 import logging
+import stageProfiler
 
 
 class getRSImageInfo(object):
@@ -80,6 +81,7 @@ class getRSImageInfo(object):
         parameter.  This method is called after internal validation."""
         return
 
+    @stageProfiler.profiledExecute
     def execute(self, parameters, messages):
         arcpy.env.overwriteOutput = True
 
@@ -0,0 +1,185 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#==============================================================================#
+# HISTORY                                                                      #
+# -------                                                                      #
+# Developed October 2026.                                                      #
+#==============================================================================#
+"""USAGE
+Module imported and used by the "temporalPersistence.py", "persistenceAnalysis.py",
+"joinAttrFromCSV.py" and "Join_Field.py" scripts to join
+attribute fields from a table to a feature class (or table), as a replacement to
+the Join Field geoprocessing tool, which suffers from exceedingly lengthy
+processing times.
+
+SUMMARY
+Replaces the join functions adapted from Esri's Join_Field.py (joindataGen,
+percentile and join_field), which sorted both tables in the database (DISTINCT and
+ORDER BY cursors) and stopped joining at the end of the join table. The values of
+the join table are read once into a dictionary indexed by the join key, and the
+input table is updated with a single unsorted cursor iteration. Join keys may be
+composed of multiple fields.
+
+INPUT
+- Input table (automated input): Feature class or table to which the fields are joined.
+
+- Join table (automated input): Table (or feature class) containing the fields to join.
+
+- Join fields (automated input): Key field(s) of the input table and of the join
+table, and the fields of the join table to join.
+
+OUTPUT
+- Joined fields (automated output): Fields created in the input table (with the
+field type of the join table) and updated with the values of the join table for
+every matching key. Rows without a matching key are left unchanged. If a key is
+present more than once in the join table, the values of its first row are used.
+
+ADDITIONAL FUNCTIONS (explained in script below)
+- fieldList
+- addJoinFields
+- readJoinTable
+- buildJoinDict
+- joinField"""
+
+# Libraries
+# =========
+import stageProfiler
+
+# arcpy is only required to read and update tables (buildJoinDict does not require it)
+try:
+    import arcpy
+except ImportError:
+    arcpy = None
+
+# Field types created for each join table field type
+JOIN_FIELD_TYPES = {"OID": "LONG", "Integer": "LONG", "SmallInteger": "SHORT", "Double": "DOUBLE",
+                    "Single": "FLOAT", "String": "TEXT", "Date": "DATE"}
+
+
+def fieldList(fields):
+    """Returns list of field names from a list or a semicolon delimited string of field names."""
+    if isinstance(fields, (list, tuple)):
+        return list(fields)
+    return [fld for fld in fields.split(";") if fld != ""]
+
+
+def addJoinFields(inTable, joinTable, joinFields):
+    """Creates the join fields in the input table, with the field type of the join table fields.
+
+    Fields already present in the input table are kept (their values are replaced by
+    the join). All fields are added with a single AddFields call when available (ArcGIS Pro),
+    otherwise one AddField call per field.
+
+    Parameters:
+        inTable = Feature class or table to which the fields are joined
+        joinTable = Table containing the fields to join
+        joinFields = List of names of the fields to join
+
+    Return:
+        No return"""
+    arcpy.AddMessage('\nAdding join fields...')
+    existingFields = [f.name.upper() for f in arcpy.ListFields(inTable)]
+    joinFieldsUpper = [fld.upper() for fld in joinFields]
+    fieldDescriptions = []
+    for f in arcpy.ListFields(joinTable):
+        if f.name.upper() not in joinFieldsUpper or f.name.upper() in existingFields:
+            continue
+        if f.type not in JOIN_FIELD_TYPES:
+            arcpy.AddError('\nUnknown field type: {0} for field: {1}'.format(f.type, f.name))
+            continue
+        if f.type == "String":
+            fieldDescriptions.append([f.name, JOIN_FIELD_TYPES[f.type], "", f.length])
+        else:
+            fieldDescriptions.append([f.name, JOIN_FIELD_TYPES[f.type]])
+
+    if fieldDescriptions == []:
+        return
+    if hasattr(arcpy.management, "AddFields"):
+        arcpy.management.AddFields(inTable, fieldDescriptions)
+    else:
+        for description in fieldDescriptions:
+            if len(description) == 4:
+                arcpy.AddField_management(inTable, description[0], field_type=description[1], field_length=description[3])
+            else:
+                arcpy.AddField_management(inTable, description[0], field_type=description[1])
+
+
+def readJoinTable(joinTable, keyFields, joinFields):
+    """Reads the join table into a dictionary of joined values indexed by key.
+
+    Parameters:
+        joinTable = Table containing the fields to join
+        keyFields = List of key field names of the join table
+        joinFields = List of names of the fields to join
+
+    Return:
+        Returns dictionary of tuples of joined values, indexed by key value (or tuple
+        of key values for multiple key fields). The first row of each key is kept."""
+    with arcpy.da.SearchCursor(joinTable, keyFields + joinFields) as cursor:
+        return buildJoinDict(cursor, len(keyFields))
+
+
+def buildJoinDict(rows, numKeys):
+    """Indexes rows of joined values by key (the first numKeys values of each row).
+
+    Parameters:
+        rows = Iterable of rows (key values followed by joined values)
+        numKeys = Number of key values at the start of each row
+
+    Return:
+        Returns dictionary of tuples of joined values, indexed by key value (or tuple
+        of key values for multiple key fields). The first row of each key is kept."""
+    joinDict = {}
+    for row in rows:
+        key = row[0] if numKeys == 1 else tuple(row[:numKeys])
+        if key not in joinDict:
+            joinDict[key] = tuple(row[numKeys:])
+    return joinDict
+
+
+def joinField(inTable, inJoinField, joinTable, outJoinField, joinFields):
+    """Joins fields from a join table to an input table by matching key values.
+
+    Parameters:
+        inTable = Feature class or table to which the fields are joined
+        inJoinField = Key field(s) of the input table (name, list or semicolon delimited string)
+        joinTable = Table containing the fields to join
+        outJoinField = Key field(s) of the join table, in the same order as inJoinField
+        joinFields = Fields of the join table to join (list or semicolon delimited string)
+
+    Return:
+        Returns number of rows of the input table updated with joined values"""
+    inKeys = fieldList(inJoinField)
+    outKeys = fieldList(outJoinField)
+    joinFields = fieldList(joinFields)
+    if len(inKeys) != len(outKeys):
+        raise ValueError("Number of input key fields ({0}) does not match number of join key fields ({1})".format(len(inKeys), len(outKeys)))
+
+    addJoinFields(inTable, joinTable, joinFields)
+
+    # Read join table once into dictionary indexed by key
+    arcpy.AddMessage('\nReading join table...')
+    with stageProfiler.stage("join_field: read join table") as record:
+        joinDict = readJoinTable(joinTable, outKeys, joinFields)
+        record["rows"] = len(joinDict)
+
+    # Write values to join fields with a single cursor iteration through the input table
+    arcpy.AddMessage('\nJoining data...')
+    numKeys = len(inKeys)
+    count = int(arcpy.GetCount_management(inTable).getOutput(0))
+    breaks = [int(float(count) * b / 100.0) for b in range(10, 100, 10)]
+    j = 0
+    updated = 0
+    with stageProfiler.stage("join_field: update cursor", count):
+        with arcpy.da.UpdateCursor(inTable, inKeys + joinFields) as cursor:
+            for row in cursor:
+                j += 1
+                if j in breaks:
+                    arcpy.AddMessage(str(int(round(j * 100.0 / count))) + ' percent complete...')
+                key = row[0] if numKeys == 1 else tuple(row[:numKeys])
+                values = joinDict.get(key)
+                if values is not None:
+                    cursor.updateRow(list(row[:numKeys]) + list(values))
+                    updated += 1
+    return updated
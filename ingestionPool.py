@@ -0,0 +1,236 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#==============================================================================#
+# HISTORY                                                                      #
+# -------                                                                      #
+# Developed October 2026.                                                      #
+#==============================================================================#
+"""USAGE
+Module imported and used by the "loadDarkTargets.py" script to condition the
+dark target shapefile of each RADARSAT-2 image folder, either one image folder
+after another or in parallel with a pool of worker processes.
+
+SUMMARY
+The conditioning of each image folder (Dissolve on "Pid", field renaming,
+DateTime and targetID fields) is independent of the other image folders. With
+more than one worker process, the image folders are distributed to a pool of
+processes (multiprocessing). Each worker process conditions its image folders
+into its own scratch file geodatabase (avoiding schema locks on the output
+geodatabase), with the coordinate system of the dark features dataset as output
+coordinate system. Once every image folder is conditioned, the feature classes
+are bulk loaded into the dark features dataset and the scratch geodatabases are
+deleted.
+
+INPUT
+- Image folders (automated input): RADARSAT-2 image folders of the Year Folder,
+each with a dark target shapefile in its "Features" folder.
+
+- Worker count (user input): Number of worker processes (1 to condition the
+image folders one after another, directly in the dark features dataset).
+
+OUTPUT
+- Dark Targets Feature Classes (automated output): One feature class per image
+folder in the dark features dataset (see 'loadDarkTargets.py').
+
+ADDITIONAL FUNCTIONS (explained in script below)
+- conditionImage
+- conditionImageWorker
+- runPool"""
+
+# Libraries
+# =========
+import os
+import time
+import shutil
+import datetime
+import logging
+import traceback
+import multiprocessing
+import arcpy
+import stageProfiler
+
+# Reload steps required to refresh memory if Catalog is open when changes are made
+import processPool                          # get module reference for reload
+reload(processPool)                         # reload step 1
+import hashJoin                             # get module reference for reload
+reload(hashJoin)                            # reload step 1
+
+# Name of the folder of the scratch geodatabases of the worker processes (created beside the output geodatabase)
+SCRATCH_FOLDER = "ingestion_scratch"
+
+
+def conditionImage(image, outWorkspace):
+    """Imports and conditions the dark target shapefile of a RADARSAT-2 image folder.
+
+    Parameters:
+        image = Path of the image folder (with the dark target shapefile in its "Features" folder)
+        outWorkspace = Workspace or feature dataset in which the feature class is created
+
+    Return:
+        Returns path of the conditioned feature class"""
+    logging.info("Processing '%s' source image", image)
+    # Set workspace to "Features" folder inside current image folder
+    arcpy.env.workspace = os.path.join(image,"Features")
+
+    # Detect shapefile to import
+    fcList = arcpy.ListFeatureClasses()
+    fc = fcList[0]
+    path_split = image.split("\\")
+    imageName = path_split[len(path_split)-1]
+    arcpy.AddMessage("\nProcessing " + imageName + " -- " + fc)
+
+    # Create feature layer from shapefile, excluding ocean polygon
+    # ============================================================== #
+    # Attribute assumption: Background ocean polygon's "Pid" = 1     #
+    # ============================================================== #
+    tempLayer = "darkTargetsLyr"
+    arcpy.MakeFeatureLayer_management(fc, tempLayer)
+    logging.info("Make Feature Layer: '%s' layer created from '%s' feature class", tempLayer, fc)
+
+    # Parse datetime from folder name
+    folder_split = imageName.split("_")
+    fcName = folder_split[0] + "_" + folder_split[5] + "_" + folder_split[6]
+    outFeatureClass = os.path.join(outWorkspace, fcName)
+
+    # Acquisition date and time parsed once from the folder name (targetID suffix and DateTime value of every dark target)
+    acquisition = datetime.datetime.strptime(folder_split[5] + folder_split[6], "%Y%m%d%H%M%S")
+    targetSuffix = "_" + folder_split[5] + "_" + folder_split[6]
+
+    # Dissolve feature layer in memory to collapse polygons with identical attributes together
+    arcpy.AddMessage("Dissolving...")
+    fieldList = arcpy.ListFields(fc)
+    statsFields = []
+    for field in fieldList:
+        if "FID" in field.name or "Shape" in field.name or "Pid" in field.name or field.name == "ID":
+            continue
+        statsField = [field.name,"FIRST"]
+        statsFields.append(statsField)
+    dissolveFC = os.path.join("in_memory", fcName)
+    if arcpy.Exists(dissolveFC):
+        arcpy.Delete_management(dissolveFC)
+    with stageProfiler.stage("Dissolve"):
+        arcpy.Dissolve_management(tempLayer, dissolveFC, "Pid", statsFields)
+    logging.info("Dissolve: '%s' feature class created from '%s' layer dissolve", dissolveFC, tempLayer)
+
+    # Create feature class with the original field names (FIRST_ prefix of the dissolve statistics removed), DateTime and targetID fields
+    arcpy.AddMessage("Creating feature class with datetime and targetID fields...")
+    outDesc = arcpy.Describe(outWorkspace)
+    if hasattr(outDesc, "spatialReference"):
+        outSR = outDesc.spatialReference
+    elif arcpy.env.outputCoordinateSystem is not None:
+        outSR = arcpy.env.outputCoordinateSystem
+    else:
+        outSR = arcpy.Describe(dissolveFC).spatialReference
+    arcpy.CreateFeatureclass_management(outWorkspace, fcName, "POLYGON", spatial_reference=outSR)
+    fields = [fld for fld in arcpy.ListFields(dissolveFC) if fld.type in hashJoin.JOIN_FIELD_TYPES and fld.type != "OID" and
+              fld.name.upper() not in ("SHAPE_LENGTH", "SHAPE_AREA")]
+    outFields = []
+    for fld in fields:
+        newName = fld.name[6:] if fld.name.startswith("FIRST_") else fld.name
+        if fld.type == "String":
+            arcpy.AddField_management(outFeatureClass, newName, "TEXT", field_length=fld.length)
+        else:
+            arcpy.AddField_management(outFeatureClass, newName, hashJoin.JOIN_FIELD_TYPES[fld.type])
+        outFields.append(newName)
+    arcpy.AddField_management(outFeatureClass, "DateTime", "DATE")
+    arcpy.AddField_management(outFeatureClass, "targetID", "TEXT")
+    logging.info("Add Field: 'DateTime' field (date data type) and 'targetID' field (string data type) added to '%s' feature class", outFeatureClass)
+
+    # Write dissolved dark targets (projected to the output coordinate system) with their DateTime and targetID values
+    arcpy.AddMessage("Writing dark targets with datetime and targetID values...")
+    pidIndex = outFields.index("Pid") + 1
+    with stageProfiler.stage("Write dark targets") as record, \
+            arcpy.da.SearchCursor(dissolveFC, ["SHAPE@"] + [fld.name for fld in fields], spatial_reference=outSR) as searchCursor, \
+            arcpy.da.InsertCursor(outFeatureClass, ["SHAPE@"] + outFields + ["DateTime", "targetID"]) as insertCursor:
+        numRows = 0
+        for row in searchCursor:
+            insertCursor.insertRow(row + (acquisition, str(row[pidIndex])[:-2] + targetSuffix))
+            numRows += 1
+        record["rows"] = numRows
+    arcpy.Delete_management(dissolveFC)
+    logging.info("Insert Cursor: '%d' dark targets written to '%s' feature class with 'DateTime' value '%s' and 'targetID' values", numRows, outFeatureClass, str(acquisition))
+
+    logging.info("Processing for '%s' source image complete\n", image)
+    return outFeatureClass
+
+
+def conditionImageWorker(task):
+    """Executes conditionImage in a worker process, in the scratch geodatabase of the worker process (created if necessary).
+
+    Parameters:
+        task = Tuple of the image folder, scratch folder and dark features dataset (providing the output coordinate system)
+
+    Return:
+        Returns tuple of the image folder, path of the conditioned feature class and processing
+        time (seconds). Errors are raised as RuntimeError with the traceback of the worker."""
+    try:
+        startTime = time.time()
+        image, scratchFolder, featWorkspace = task
+        scratchGDB = os.path.join(scratchFolder, "scratch_" + str(os.getpid()) + ".gdb")
+        if not arcpy.Exists(scratchGDB):
+            arcpy.CreateFileGDB_management(scratchFolder, os.path.basename(scratchGDB))
+        desc = arcpy.Describe(featWorkspace)
+        if hasattr(desc, "spatialReference"):
+            arcpy.env.outputCoordinateSystem = desc.spatialReference
+        outFeatureClass = conditionImage(image, scratchGDB)
+        return image, outFeatureClass, time.time() - startTime
+    except Exception:
+        raise RuntimeError(traceback.format_exc())
+
+
+def runPool(images, featWorkspace, workers):
+    """Conditions image folders with a pool of worker processes and bulk loads the feature classes into the dark features dataset.
+
+    Parameters:
+        images = List of paths of the image folders
+        featWorkspace = Dark features dataset (or workspace), beside the geodatabase of which the scratch geodatabases are created
+        workers = Number of worker processes (limited to the number of image folders and processors)
+
+    Return:
+        Returns list of paths of the feature classes loaded into the dark features dataset"""
+    gdb = featWorkspace if featWorkspace.lower().endswith(".gdb") else os.path.dirname(featWorkspace)
+    scratchFolder = os.path.join(os.path.dirname(gdb), SCRATCH_FOLDER)
+    if os.path.exists(scratchFolder):
+        shutil.rmtree(scratchFolder)
+    os.makedirs(scratchFolder)
+
+    workers = max(1, min(int(workers), len(images), multiprocessing.cpu_count()))
+    executable = processPool.pythonExecutable()
+    if executable is not None:
+        multiprocessing.set_executable(executable)
+    arcpy.AddMessage("Conditioning " + str(len(images)) + " image folders with " + str(workers) + " worker processes...")
+    logging.info("Worker Pool: '%d' image folders distributed to '%d' worker processes", len(images), workers)
+
+    # Condition image folders in the scratch geodatabases of the worker processes
+    scratchList = []
+    pool = multiprocessing.Pool(workers)
+    try:
+        for image, scratchFC, elapsed in pool.imap_unordered(conditionImageWorker, [(image, scratchFolder, featWorkspace) for image in images]):
+            scratchList.append(scratchFC)
+            arcpy.AddMessage("Conditioning of '" + os.path.basename(image) + "' complete (" + str(len(scratchList)) + " of " + str(len(images)) + ")...")
+            logging.info("Worker Pool: '%s' feature class conditioned from '%s' image folder in %.1f seconds", scratchFC, image, elapsed)
+        pool.close()
+    except Exception:
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+
+    # Bulk load conditioned feature classes into the dark features dataset
+    arcpy.AddMessage("Loading " + str(len(scratchList)) + " feature classes into " + featWorkspace + "...")
+    featList = []
+    with stageProfiler.stage("Bulk load", len(scratchList)):
+        for scratchFC in sorted(scratchList):
+            fcName = os.path.basename(scratchFC)
+            arcpy.FeatureClassToFeatureClass_conversion(scratchFC, featWorkspace, fcName)
+            featList.append(os.path.join(featWorkspace, fcName))
+            logging.info("Feature Class to Feature Class: '%s' feature class loaded from '%s'", featList[-1], scratchFC)
+
+    # Delete scratch geodatabases
+    for scratchGDB in set(os.path.dirname(scratchFC) for scratchFC in scratchList):
+        if arcpy.Exists(scratchGDB):
+            arcpy.Delete_management(scratchGDB)
+    shutil.rmtree(scratchFolder, ignore_errors=True)
+    logging.info("Worker Pool: Scratch geodatabases deleted from '%s'\n", scratchFolder)
+    return featList
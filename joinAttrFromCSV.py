@@ -1,8 +1,8 @@
 #-------------------------------------------------------------------------------
 # Name:        joinAttrFromCSV.py
 #
-# Author:      David Hennessy, with code snippets from Esri's Join_Field.py (as
-#              a replacement to the Join Field geoprocessing tool, which suffers
+# Author:      David Hennessy, with the join performed by hashJoin.py (as a
+#              replacement to the Join Field geoprocessing tool, which suffers
 #              from exceedingly lengthy processing times.)
 #
 # Created:     07-03-2017
@@ -28,10 +28,10 @@ Requirements:
      list of fields to add from the CSV to the feature class"""
 
 # Import libraries
-print "Importing python libraries (arcpy, os, sys)..."
+print "Importing python libraries (arcpy, os, hashJoin)..."
 import arcpy
 import os
-import sys
+import hashJoin
 
 # ASSIGN VARIABLE VALUES HERE---------------------------------------------------
 # Name of input csv file
@@ -49,19 +49,6 @@ addFields = ["testpy"]
 ##              "fld_3"]
 # ------------------------------------------------------------------------------
 
-# Define generator for join data (copied from Esri's Join_Field.py)-------------
-def joindataGen(joinTable,fieldList,sortField):
-    with arcpy.da.SearchCursor(joinTable,fieldList,sql_clause=['DISTINCT',
-                                                               'ORDER BY '+sortField]) as cursor:
-        for row in cursor:
-            yield row
-# ------------------------------------------------------------------------------
-
-# Function for progress reporting (copied from Esri's Join_Field.py)------------
-def percentile(n,pct):
-    return int(float(n)*float(pct)/100.0)
-# ------------------------------------------------------------------------------
-
 def main():
     # Determine arcpy workspace
     analysisGDB = "GEM2_Temporal_Analysis.gdb"
@@ -82,60 +69,9 @@ def main():
     joinField = "OBJECTID"
 ##    inTable = "persistent_targets"
 
-    # Add join fields (adapted from Esri's Join_Field.py)-----------------------
-    print '\nAdding join fields...'
-    fList = [f for f in arcpy.ListFields(joinTable) if f.name in addFields]
-    for i in range(len(fList)):
-        name = fList[i].name
-        type = fList[i].type
-        if type in ['Integer','OID']:
-            arcpy.AddField_management(inTable,name,field_type='LONG')
-        elif type == 'String':
-            arcpy.AddField_management(inTable,name,field_type='TEXT',field_length=fList[i].length)
-        elif type == 'Double':
-            arcpy.AddField_management(inTable,name,field_type='DOUBLE')
-        elif type == 'Date':
-            arcpy.AddField_management(inTable,name,field_type='DATE')
-        else:
-            arcpy.AddError('\nUnknown field type: {0} for field: {1}'.format(type,name))
-    # --------------------------------------------------------------------------
-
-    # Write values to join fields (adapted from Esri's Join_Field.py)-----------
+    # Join fields (dictionary of CSV values indexed by join field, single cursor iteration through feature class)
     print '\nJoining data...'
-    # Create generator for values
-    fieldList = [joinField] + addFields
-    joinDataGen = joindataGen(joinTable,fieldList,joinField)
-    version = sys.version_info[0]
-    if version == 2:
-        joinTuple = joinDataGen.next()
-    else:
-        joinTuple = next(joinDataGen)
-    #
-    count = int(arcpy.GetCount_management(inTable).getOutput(0))
-    breaks = [percentile(count,b) for b in range(10,100,10)]
-    j = 0
-    with arcpy.da.UpdateCursor(inTable,fieldList,sql_clause=(None,'ORDER BY '+joinField)) as cursor:
-        for row in cursor:
-            j+=1
-            if j in breaks:
-                arcpy.AddMessage(str(int(round(j*100.0/count))) + ' percent complete...')
-            row = list(row)
-            key = row[0]
-            try:
-                while joinTuple[0] < key:
-                    if version == 2:
-                        joinTuple = joinDataGen.next()
-                    else:
-                        joinTuple = next(joinDataGen)
-                if key == joinTuple[0]:
-                    for i in range(len(joinTuple))[1:]:
-                        row[i] = joinTuple[i]
-                    row = tuple(row)
-                    cursor.updateRow(row)
-            except StopIteration:
-                arcpy.AddWarning('\nEnd of join table.')
-                break
-    # --------------------------------------------------------------------------
+    hashJoin.joinField(inTable, joinField, joinTable, joinField, addFields)
 
     # Delete gdb table (working file) from analysis GDB
     print "\nDeleting CSV table in Analysis GDB..."
@@ -26,6 +26,12 @@ INPUT
 - Dark Feature Dataset (automated input): Feature dataset in the output file
 geodatabase in which the shapefiles are directly converted to feature classes.
 
+- Worker Processes (default user input): Number of processes among which the
+image folders are distributed (1 to process the image folders one after another).
+Each process conditions its image folders in its own scratch geodatabase, from
+which the feature classes are bulk loaded into the dark features dataset. See
+'ingestionPool.py'.
+
 OUTPUT
 - Dark Targets Feature Classes (automated output): Feature classes converted
 from the input shapefiles. Each feature class is projected and placed in the
@@ -37,8 +43,12 @@ a concatenation of each target's "Pid" and datetime stamp."""
 # Libraries
 # =========
 import arcpy
-import os
 import logging
+import stageProfiler
+
+# Reload steps required to refresh memory if Catalog is open when changes are made
+import ingestionPool                        # get module reference for reload
+reload(ingestionPool)                       # reload step 1
 
 
 class loadDarkTargets(object):
@@ -51,7 +61,7 @@ class loadDarkTargets(object):
 
     def getParameterInfo(self):
         """Define parameter definitions"""
-        params = [None]*2
+        params = [None]*3
 
         params[0] = arcpy.Parameter(
             displayName="Year Folder",
@@ -67,6 +77,15 @@ class loadDarkTargets(object):
             parameterType="Required",
             direction="Input")
 
+        params[2] = arcpy.Parameter(
+            displayName="Worker Processes",
+            name="workerCount",
+            datatype="GPLong",
+            parameterType="Optional",
+            direction="Input")
+
+        params[2].value = 1
+
         return params
 
     def isLicensed(self):
@@ -84,6 +103,7 @@ class loadDarkTargets(object):
         parameter.  This method is called after internal validation."""
         return
 
+    @stageProfiler.profiledExecute
     def execute(self, parameters, messages):
         """The source code of the tool."""
         arcpy.AddMessage("\nLoading dark target shapefiles...")
@@ -91,84 +111,20 @@ class loadDarkTargets(object):
         # Define variables from parameters
         arcpy.env.workspace = parameters[0].valueAsText
         featWorkspace = parameters[1].valueAsText
+        workerCount = 1
+        if len(parameters) > 2 and parameters[2].value is not None:
+            workerCount = max(1, int(parameters[2].value))
 
         # Determine list of RADARSAT-2 image folder workspaces
         image_list = arcpy.ListWorkspaces()
         arcpy.AddMessage("Workspace contains " + str(len(image_list)) + " image folders to import.")
 
-        # Iterate through image folders
-        for image in image_list:
-            logging.info("Processing '%s' source image", image)
-            # Set workspace to "Features" folder inside current image folder
-            arcpy.env.workspace = os.path.join(image,"Features")
-
-            # Detect shapefile to import
-            fcList = arcpy.ListFeatureClasses()
-            fc = fcList[0]
-            path_split = image.split("\\")
-            imageName = path_split[len(path_split)-1]
-            arcpy.AddMessage("\nProcessing " + imageName + " -- " + fc)
-
-            # Create feature layer from shapefile, excluding ocean polygon
-            # ============================================================== #
-            # Attribute assumption: Background ocean polygon's "Pid" = 1     #
-            # ============================================================== #
-            tempLayer = "darkTargetsLyr"
-            arcpy.MakeFeatureLayer_management(fc, tempLayer)
-            logging.info("Make Feature Layer: '%s' layer created from '%s' feature class", tempLayer, fc)
-
-            # Parse datetime from folder name
-            folder_split = imageName.split("_")
-            fcName = folder_split[0] + "_" + folder_split[5] + "_" + folder_split[6]
-            outFeatureClass = os.path.join(featWorkspace, fcName)
-
-            # Dissolve feature layer to collapse polygons with identical attributes together
-            arcpy.AddMessage("Dissolving...")
-            fieldList = arcpy.ListFields(fc)
-            statsFields = []
-            for field in fieldList:
-                if "FID" in field.name or "Shape" in field.name or "Pid" in field.name or field.name == "ID":
-                    continue
-                statsField = [field.name,"FIRST"]
-                statsFields.append(statsField)
-            arcpy.Dissolve_management(tempLayer, outFeatureClass, "Pid", statsFields)
-            logging.info("Dissolve: '%s' feature class created from '%s' layer dissolve", outFeatureClass, tempLayer)
-
-            # Rename attribute fields to revert to original field names
-            arcpy.AddMessage("Renaming attribute fields...")
-            fieldList = arcpy.ListFields(outFeatureClass)
-            for field in fieldList:
-                if field.name.startswith("FIRST_"):
-                    newName = field.name[6:]
-                    arcpy.AlterField_management(outFeatureClass, field.name, newName)
-
-            # Add Date field
-            arcpy.AddMessage("Adding datetime field...")
-            arcpy.AddField_management(outFeatureClass, "DateTime", "DATE")
-            logging.info("Add Field: 'DateTime' field (date data type) added to '%s' feature class", outFeatureClass)
-            year = folder_split[5][:4]
-            month = folder_split[5][4:6].lstrip("0")
-            day = folder_split[5][-2:].lstrip("0")
-            hour = folder_split[6][:2].lstrip("0")
-            minute = folder_split[6][2:4].lstrip("0")
-            if minute == "":
-                minute = "0"
-            second = folder_split[6][-2:].lstrip("0")
-            if second == "" :
-                second = "0"
-            expression = "datetime.datetime(" + year + "," + month + "," + day + "," + hour + "," + minute + "," + second + ")"
-            arcpy.CalculateField_management(outFeatureClass, "DateTime", expression, "PYTHON_9.3")
-            logging.info("Calculate Field: 'DateTime' field value calculated for '%s' feature class", outFeatureClass)
-
-            # Add target ID field to uniquely identify dark targets
-            arcpy.AddMessage("Adding targetID field...")
-            arcpy.AddField_management(outFeatureClass, "targetID", "TEXT")
-            logging.info("Add Field: 'targetID' field (string data type) added to '%s' feature class", outFeatureClass)
-            expression = "str(!Pid!)[:-2] + '_' + str(" + folder_split[5] + ") + '_' + str(" + folder_split[6] + ")"
-            arcpy.CalculateField_management(outFeatureClass, "targetID", expression, "PYTHON_9.3")
-            logging.info("Calculate Field: 'targetID' field value calculated for '%s' feature class", outFeatureClass)
-
-            logging.info("Processing for '%s' source image complete\n", image)
+        # Condition image folders in parallel worker processes, or one after another directly in the dark features dataset
+        if workerCount > 1 and len(image_list) > 1:
+            ingestionPool.runPool(image_list, featWorkspace, workerCount)
+        else:
+            for image in image_list:
+                ingestionPool.conditionImage(image, featWorkspace)
 
         logging.info("loadDarkTargets.py script finished\n\n")
 
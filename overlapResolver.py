@@ -0,0 +1,177 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#==============================================================================#
+# HISTORY                                                                      #
+# -------                                                                      #
+# Developed October 2026.                                                      #
+#==============================================================================#
+"""USAGE
+Module imported and used by the "parseOverlap.py" script to create the Overlap
+feature class of two dark targets feature classes of the same acquisition date,
+as a replacement to the Union, Select, Dissolve, Alter Field and Calculate Field
+geoprocessing chain.
+
+SUMMARY
+The dark targets of both feature classes are read once into memory. The
+candidate pairs of dark targets (one of each feature class) are found with an
+STR tree of the envelopes of the dark targets of the second feature class (see
+'strTree.py'), and the intersection of each candidate pair is calculated
+directly. Each pair of dark targets ("Pid" and "Pid_1") with an intersection
+area is written once to the Overlap feature class, with the attribute values of
+both dark targets (fields of the second feature class suffixed with "_1", as in
+the Union output) and their combined targetID, in a single InsertCursor.
+
+INPUT
+- Dark Targets Feature Classes (automated input): Two feature classes of the same
+acquisition date (see 'loadDarkTargets.py').
+
+OUTPUT
+- Overlap Feature Class (automated output): One polygon per pair of overlapping
+dark targets (area of their intersection), with the fields of the Dissolve of
+the former geoprocessing chain: "Pid", "Pid_1", the attribute fields of the
+first feature class and the attribute fields of the second feature class
+(suffixed with "_1", except "targetID_1"), and the combined targetID
+('<Pid>_<Pid_1>_<date>_<time>_<time_1>').
+
+ADDITIONAL FUNCTIONS (explained in script below)
+- overlapFields
+- readTargets
+- combinedTargetID
+- resolveOverlaps"""
+
+# Libraries
+# =========
+import os
+import logging
+import numpy as np
+import arcpy
+
+# Reload steps required to refresh memory if Catalog is open when changes are made
+import hashJoin                             # get module reference for reload
+reload(hashJoin)                            # reload step 1
+import strTree                              # get module reference for reload
+reload(strTree)                             # reload step 1
+
+
+def overlapFields(fc, fc2):
+    """Determines the attribute fields of the Overlap feature class of two feature classes.
+
+    Parameters:
+        fc = First dark targets feature class
+        fc2 = Second dark targets feature class
+
+    Return:
+        Returns two lists of (field, output field name) tuples, for the attribute fields of
+        each feature class copied to the Overlap feature class (excluding the "Pid" fields)"""
+    fields = [fld for fld in arcpy.ListFields(fc) if fld.type in hashJoin.JOIN_FIELD_TYPES and fld.type != "OID"]
+    fields2 = [fld for fld in arcpy.ListFields(fc2) if fld.type in hashJoin.JOIN_FIELD_TYPES and fld.type != "OID"]
+    names = [fld.name for fld in fields]
+
+    # Fields of the second feature class named as in the Union output (suffixed if also present in the first feature class)
+    outFields = []
+    outFields2 = []
+    for fld in fields:
+        if not ("OBJECTID" in fld.name or "FID" in fld.name or "Shape" in fld.name or "Pid" in fld.name):
+            outFields.append((fld, fld.name))
+    for fld in fields2:
+        outName = fld.name + "_1" if fld.name in names else fld.name
+        if not ("OBJECTID" in outName or "FID" in outName or "Shape" in outName or "Pid" in outName or "targetID_1" in outName):
+            outFields2.append((fld, outName))
+    return outFields, outFields2
+
+
+def readTargets(fc, fieldNames):
+    """Reads the dark targets of a feature class with their envelopes.
+
+    Parameters:
+        fc = Dark targets feature class
+        fieldNames = List of attribute fields to read (the first field being "Pid")
+
+    Return:
+        Returns tuple of the list of polygons, list of attribute value tuples and the four
+        arrays of envelope coordinates (minimum x, minimum y, maximum x, maximum y)"""
+    shapes = []
+    values = []
+    with arcpy.da.SearchCursor(fc, ["SHAPE@"] + fieldNames) as cursor:
+        for row in cursor:
+            if row[0] is None:
+                continue
+            shapes.append(row[0])
+            values.append(row[1:])
+    extents = np.array([[s.extent.XMin, s.extent.YMin, s.extent.XMax, s.extent.YMax] for s in shapes], dtype=np.float64).reshape(-1, 4)
+    return shapes, values, extents[:, 0], extents[:, 1], extents[:, 2], extents[:, 3]
+
+
+def combinedTargetID(pid, pid1, rsat, rsat1):
+    """Returns the common targetID of two overlapping dark targets ('<Pid>_<Pid_1>_<date>_<time>_<time_1>', date and times from their RsatID)."""
+    rsatSplit = rsat.split('_')
+    rsatSplit1 = rsat1.split('_')
+    date = rsatSplit[5] + '_' + rsatSplit[6] + '_' + rsatSplit1[6]
+    return str(pid)[:-2] + '_' + str(pid1)[:-2] + '_' + date
+
+
+def resolveOverlaps(fc, fc2, outFC):
+    """Creates the Overlap feature class of the overlapping dark targets of two feature classes.
+
+    Parameters:
+        fc = First dark targets feature class
+        fc2 = Second dark targets feature class
+        outFC = Path of the Overlap feature class to create
+
+    Return:
+        Returns number of pairs of overlapping dark targets written to the Overlap feature class"""
+    outFields, outFields2 = overlapFields(fc, fc2)
+    fieldNames = ["Pid"] + [fld.name for fld, outName in outFields]
+    fieldNames2 = ["Pid"] + [fld.name for fld, outName in outFields2]
+    shapes, values, xmin, ymin, xmax, ymax = readTargets(fc, fieldNames)
+    shapes2, values2, xmin2, ymin2, xmax2, ymax2 = readTargets(fc2, fieldNames2)
+
+    # Candidate pairs of dark targets with overlapping envelopes
+    first, second = strTree.STRTree(xmin2, ymin2, xmax2, ymax2).queryBoxes(xmin, ymin, xmax, ymax)
+    logging.info("STR Tree: '%d' pairs of dark targets from '%s' and '%s' with overlapping extents", len(first), fc, fc2)
+
+    # Intersection of each candidate pair, combined by pair of Pid values (as the Dissolve on "Pid" and "Pid_1")
+    pairDict = {}
+    pairList = []
+    for a, b in zip(first, second):
+        if shapes[a].disjoint(shapes2[b]):
+            continue
+        intersection = shapes[a].intersect(shapes2[b], 4)
+        if intersection.area <= 0:
+            continue
+        key = (values[a][0], values2[b][0])
+        if key in pairDict:
+            pairDict[key][0] = pairDict[key][0].union(intersection)
+        else:
+            pairDict[key] = [intersection, a, b]
+            pairList.append(key)
+
+    # Create Overlap feature class with the fields of both feature classes
+    arcpy.CreateFeatureclass_management(os.path.dirname(outFC), os.path.basename(outFC), "POLYGON",
+                                        spatial_reference=arcpy.Describe(fc).spatialReference)
+    pidType = [fld.type for fld in arcpy.ListFields(fc, "Pid")]
+    pidType = hashJoin.JOIN_FIELD_TYPES.get(pidType[0], "DOUBLE") if pidType else "DOUBLE"
+    arcpy.AddField_management(outFC, "Pid", pidType)
+    arcpy.AddField_management(outFC, "Pid_1", pidType)
+    for fld, outName in outFields + outFields2:
+        if fld.type == "String":
+            arcpy.AddField_management(outFC, outName, "TEXT", field_length=fld.length)
+        else:
+            arcpy.AddField_management(outFC, outName, hashJoin.JOIN_FIELD_TYPES[fld.type])
+
+    # Write each pair of overlapping dark targets once, with its combined targetID
+    outNames = [outName for fld, outName in outFields]
+    outNames2 = [outName for fld, outName in outFields2]
+    targetIndex = outNames.index("targetID") if "targetID" in outNames else None
+    rsatIndex = outNames.index("RsatID") + 1
+    rsatIndex2 = outNames2.index("RsatID_1") + 1
+    with arcpy.da.InsertCursor(outFC, ["SHAPE@", "Pid", "Pid_1"] + outNames + outNames2) as cursor:
+        for key in pairList:
+            intersection, a, b = pairDict[key]
+            row = list(values[a][1:])
+            if targetIndex is not None:
+                row[targetIndex] = combinedTargetID(key[0], key[1], values[a][rsatIndex], values2[b][rsatIndex2])
+            cursor.insertRow([intersection, key[0], key[1]] + row + list(values2[b][1:]))
+    logging.info("Overlap Resolver: '%s' feature class created with '%d' pairs of overlapping dark targets from '%s' and '%s'", outFC, len(pairList), fc, fc2)
+    return len(pairList)
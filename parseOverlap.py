@@ -13,30 +13,36 @@ executed after "loadDarkTargets.py" and is followed by "parseNoOverlap.py".
 
 SUMMARY
 Isolates regions of overlapping polygons within an acquisition swathe and
-preserves both sets of attribute values by executing the Union tool.
+preserves both sets of attribute values.
+
+The footprint (convex hull of the dark targets) of each feature class is
+calculated once, and the footprints of each acquisition date are indexed by
+envelope (see 'strTree.py'). Only the pairs of feature classes whose footprints
+intersect are compared. The overlapping dark targets of each pair of feature
+classes are resolved in memory (see 'overlapResolver.py'): candidate pairs of
+dark targets are found by envelope, their intersections are calculated
+directly and written with both sets of attribute values and their common
+targetID in a single pass, instead of the Union, Select, Dissolve, Alter Field
+and Calculate Field geoprocessing.
 
 INPUT
 - Dark Targets Feature Classes (automated input): Feature classes previously
 converted from the input shapefiles by the "loadDarkTargets.py" script.
 
 - Union Dataset (automated input): Feature dataset in the output file
-geodatabase in which the results of the Union geoprocessing are output.
+geodatabase, formerly receiving the results of the Union geoprocessing (no
+longer written, kept as parameter of the tool).
 
 - Overlap Dataset (automated input): Feature dataset in the output file
 geodatabase in which the overlap geoprocessing and results are stored.
 
 OUTPUT
-- Union Feature Classes (automated output): Output feature classes resulting
-from the Union from those input Dark Targets feature classes that have
-overlapping polygons. As a result of the Union geoprocessing, new polygons with
-two sets of attributes are created for those regions of overlap. These feature
-classes are stored in the "features_union" feature dataset.
-
 - Overlap Feature Classes (automated output): Output feature classes containing
-overlapping polygons from two adjacent image acquisitions. These feature classes
-are created by selecting and exporting those polygons with two sets of attribute
-values from a Union feature class. These feature classes are stored in the
-"features_overlap" feature dataset.
+overlapping polygons from two adjacent image acquisitions. Each polygon is the
+region of overlap of two dark targets, with both sets of attribute values (the
+fields of the second feature class suffixed with "_1") and their common
+targetID. These feature classes are stored in the "features_overlap" feature
+dataset.
 
 - Total Overlap Feature Classes (automated output): Output feature classes
 containing all Overlap Feature Classes merged from a single acquisition day.
@@ -48,14 +54,20 @@ import arcpy
 import os
 import logging
 
+# Reload steps required to refresh memory if Catalog is open when changes are made
+import strTree                              # get module reference for reload
+reload(strTree)                             # reload step 1
+import overlapResolver                      # get module reference for reload
+reload(overlapResolver)                     # reload step 1
+
 
 class parseOverlap(object):
     def __init__(self):
         """Define the tool (tool name is the name of the class)."""
         self.label = "parseOverlap"
         self.description = "Isolates overlapping polygons within an acquisition\
-         swathe and executes Union on affected feature classes to isolate \
-         regions of overlap and preserve both sets of attribute values."
+         swathe and resolves the regions of overlap of affected feature \
+         classes, preserving both sets of attribute values."
         self.canRunInBackground = False
 
     def getParameterInfo(self):
@@ -106,7 +118,6 @@ class parseOverlap(object):
         logging.info("Starting parseOverlap.py script...\n")
         # Define variables from parameters
         featWorkspace = parameters[0].valueAsText
-        unionWorkspace = parameters[1].valueAsText
         overlapWorkspace = parameters[2].valueAsText
 
         # Initialize noUnion list (to contain pairs of feature classes that no longer require Union)
@@ -117,6 +128,11 @@ class parseOverlap(object):
         fcList = arcpy.ListFeatureClasses()
         arcpy.AddMessage("Workspace contains the following " + str(len(fcList)) + " feature classes: " + str(fcList))
 
+        # Calculate footprint of each feature class once
+        footprints = {}
+        for fc in fcList:
+            footprints[fc] = self.swathFootprint(fc)
+
         # Organize dark targets feature classes by date
         fcDictByDate = {}
         for fc in fcList:
@@ -130,6 +146,20 @@ class parseOverlap(object):
         for key in fcDictByDate:
             arcpy.env.workspace = featWorkspace
 
+            # Determine pairs of feature classes with intersecting footprints (candidates for overlap) from the envelopes of their footprints
+            candidates = dict((fc, set()) for fc in fcDictByDate[key])
+            dateList = [fc for fc in fcDictByDate[key] if footprints[fc] is not None]
+            if len(dateList) > 1:
+                extents = [footprints[fc].extent for fc in dateList]
+                tree = strTree.STRTree([e.XMin for e in extents], [e.YMin for e in extents], [e.XMax for e in extents], [e.YMax for e in extents])
+                first, second = tree.queryPairs()
+                for a, b in zip(first, second):
+                    if not footprints[dateList[a]].disjoint(footprints[dateList[b]]):
+                        candidates[dateList[a]].add(dateList[b])
+                        candidates[dateList[b]].add(dateList[a])
+                numPairs = sum(len(candidates[fc]) for fc in candidates) // 2
+                logging.info("Swath Footprints: '%d' of '%d' pairs of feature classes with intersecting footprints on '%s'", numPairs, len(dateList) * (len(dateList) - 1) // 2, key)
+
             # Iterate through feature classes within acquisition date
             for fc in fcDictByDate[key]:
                 arcpy.AddMessage("\nProcessing " + fc)
@@ -137,86 +167,32 @@ class parseOverlap(object):
 
                 # Check for multiple dark targets feature classes within acquisition date
                 if len(fcDictByDate[key]) == 1:
-                    arcpy.AddMessage("Only one feature class for this date, no Union necessary!")
+                    arcpy.AddMessage("Only one feature class for this date, no overlap resolution necessary!")
+                elif len(candidates[fc]) == 0:
+                    arcpy.AddMessage("No other feature class footprint intersects for this date, no overlap resolution necessary!")
                 else:
-                    # Create feature layer from feature class for subsequent geoprocessing
-                    arcpy.MakeFeatureLayer_management(fc,'fc_lyr')
-                    logging.info("Make Feature Layer: 'fc_lyr' layer created from '%s' feature class", fc)
-
                     # Second iteration through feature classes for pairing within acquisition date
                     for fc2 in fcDictByDate[key]:
-                        # Check to skip pairing of same dark targets feature class
-                        if fc2 != fc:
-                            # Compare paired feature classes to detect spatial intersection of dark targets
-                            arcpy.SelectLayerByLocation_management('fc_lyr','intersect',fc2)
-                            logging.info("Select Layer by Location: Selected features from 'fc_lyr' which intersect with '%s'", fc2)
-                            selectioncount = int(arcpy.GetCount_management('fc_lyr')[0])
-                            logging.info("Get Count: Counted '%d' features in selection from 'fc_lyr'", selectioncount)
-                            arcpy.AddMessage(str(selectioncount) + " features intersect between " + fc + " and " + fc2)
-
-                            # Check selection count (at least 1 selection) to detect overlap between paired feature classes
-                            if selectioncount != 0:
-                                # Check noUnion list to determine if paired feature classes have already performed Union on a previous iteration
-                                if fc2 in noUnion:
-                                    arcpy.AddMessage("Already performed Union for these feature classes!")
-                                else:
-                                    # Perform Union on paired feature classes
-                                    arcpy.AddMessage("Performing Union for " + fc + " and " + fc2)
-                                    unionOutputString = fc + "_" + fc2 + "_Union"
-                                    unionOutput = os.path.join(unionWorkspace, unionOutputString)
-                                    arcpy.Union_analysis([fc, fc2], unionOutput)
-                                    logging.info("Union: Created '%s' feature class from union of '%s' and '%s' feature classes", unionOutput, fc, fc2)
-
-                                    # Append overlapping paired feature class to noUnion list to skip on subsequent iterations
-                                    noUnion.append(fc)
-
-                                    # Select polygons in Union feature class that have two sets of attribute values (overlapping regions of dark targets)
-                                    selectOutputString = fc + "_" + fc2 + "_Select"
-                                    selectOutput = os.path.join(overlapWorkspace, selectOutputString)
-                                    where_clause = 'NOT FID_' + fc + ' = -1 AND NOT FID_' + fc2 + ' = -1'
-                                    arcpy.Select_analysis(unionOutput, selectOutput, where_clause)
-                                    logging.info("Select: '%s' feature class created from '%s' selection", selectOutput, unionOutput)
-
-                                    # Dissolve selected polygons to remove attribute value duplicates
-                                    arcpy.AddMessage("Dissolving " + selectOutputString)
-                                    selectLayer = "selectLyr"
-                                    overlapOutputString = fc + "_" + fc2 + "_Overlap"
-                                    overlapOutput = os.path.join(overlapWorkspace, overlapOutputString)
-                                    dissolveFields = ["Pid", "Pid_1"]
-                                    fieldList = arcpy.ListFields(selectOutput)
-                                    statsFields = []
-                                    for field in fieldList:
-                                        if "OBJECTID" in field.name or "FID" in field.name or "Shape" in field.name or "Pid" in field.name or "targetID_1" in field.name:
-                                            continue
-                                        statsField = [field.name,"FIRST"]
-                                        statsFields.append(statsField)
-                                    arcpy.MakeFeatureLayer_management(selectOutput, selectLayer)
-                                    logging.info("Make Feature Layer: '%s' layer created from '%s' feature class", selectLayer, selectOutput)
-                                    arcpy.Dissolve_management(selectLayer, overlapOutput, dissolveFields, statsFields)
-                                    logging.info("Dissolve: '%s' feature class created from '%s' layer dissolve", overlapOutput, selectLayer)
-
-                                    # Delete selection output feature class
-                                    arcpy.Delete_management(selectOutput)
-                                    logging.info("Delete: '%s' feature class deleted", selectOutput)
-
-                                    # Rename attribute fields to revert to original field names
-                                    arcpy.AddMessage("Renaming attribute fields...")
-                                    fieldList = arcpy.ListFields(overlapOutput)
-                                    for field in fieldList:
-                                        if field.name.startswith("FIRST_"):
-                                            newName = field.name[6:]
-                                            arcpy.AlterField_management(overlapOutput, field.name, newName)
-
-                                    # Modify and update targetID of overlapping dark targets to a common targetID for overlapping targets
-                                    expression = "calcTargetID(str(!Pid!)[:-2],str(!Pid_1!)[:-2],!RsatID!,!RsatID_1!)"
-                                    codeblock = """def calcTargetID(pid,pid1,rsat,rsat1):
-                                        rsatSplit = rsat.split('_')
-                                        rsatSplit1 = rsat1.split('_')
-                                        date = rsatSplit[5] + '_' + rsatSplit[6] + '_' + rsatSplit1[6]
-                                        targetID = pid + '_' + pid1 + '_' + date
-                                        return targetID"""
-                                    arcpy.CalculateField_management(overlapOutput, "targetID", expression, "PYTHON_9.3", codeblock)
-                                    logging.info("Calculate Field: 'targetID' field value calculated for '%s' feature class", overlapOutput)
+                        # Check to skip pairing of same dark targets feature class and of feature classes with disjoint footprints
+                        if fc2 in candidates[fc]:
+                            # Check noUnion list to determine if paired feature classes have already been resolved on a previous iteration
+                            if fc2 in noUnion:
+                                arcpy.AddMessage("Already resolved overlap for these feature classes!")
+                            else:
+                                # Resolve overlapping dark targets of paired feature classes (intersections with both sets of attribute values and common targetID)
+                                arcpy.AddMessage("Resolving overlap for " + fc + " and " + fc2)
+                                overlapOutputString = fc + "_" + fc2 + "_Overlap"
+                                overlapOutput = os.path.join(overlapWorkspace, overlapOutputString)
+                                overlapCount = overlapResolver.resolveOverlaps(os.path.join(featWorkspace, fc), os.path.join(featWorkspace, fc2), overlapOutput)
+                                arcpy.AddMessage(str(overlapCount) + " pairs of features overlap between " + fc + " and " + fc2)
+
+                                # Append paired feature class to noUnion list to skip on subsequent iterations
+                                noUnion.append(fc)
+
+                                # Delete overlap feature class if no dark targets overlap
+                                if overlapCount == 0:
+                                    arcpy.Delete_management(overlapOutput)
+                                    logging.info("Delete: '%s' feature class deleted (no overlapping dark targets)", overlapOutput)
 
                 logging.info("Processing for '%s' feature class complete\n", fc)
 
@@ -236,4 +212,29 @@ class parseOverlap(object):
 
         logging.info("parseOverlap.py script finished\n\n")
 
-        return
\ No newline at end of file
+        return
+
+    def swathFootprint(self, fc):
+        """Calculates the footprint of the dark targets of a feature class (convex hull of every dark target).
+
+        Parameters:
+            fc = Dark targets feature class
+
+        Return:
+            Returns arcpy Polygon of the convex hull, or None if the feature class has no dark targets"""
+        hullPoints = arcpy.Array()
+        spatialReference = None
+        with arcpy.da.SearchCursor(fc, ["SHAPE@"]) as cursor:
+            for row in cursor:
+                if row[0] is None:
+                    continue
+                spatialReference = row[0].spatialReference
+                for part in row[0].convexHull():
+                    for pnt in part:
+                        if pnt is not None:
+                            hullPoints.add(pnt)
+        if hullPoints.count == 0:
+            return None
+        footprint = arcpy.Multipoint(hullPoints, spatialReference).convexHull()
+        logging.info("Swath Footprint: Convex hull of '%s' feature class calculated from '%d' points", fc, hullPoints.count)
+        return footprint
\ No newline at end of file
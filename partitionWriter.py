@@ -0,0 +1,101 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#==============================================================================#
+# HISTORY                                                                      #
+# -------                                                                      #
+# Developed October 2026.                                                      #
+#==============================================================================#
+"""USAGE
+Module imported and used by the "convertGEM1toGEM2.py" script to split the NOS
+file into one dark target shapefile per Radarsat-2 image in a single reading of
+the NOS file.
+
+SUMMARY
+Rows read from a source feature class are routed to the output feature class of
+their partition (e.g. the 'dark_target' shapefile of their image), instead of
+selecting the rows of each partition with a new scan of the source. Rows are
+buffered in memory per partition and written with one InsertCursor per
+partition when the number of buffered rows reaches a limit, and once the source
+has been read, so that memory remains bounded and a single output is open at
+any time. The output feature class of a partition is created (with the fields
+of the source as template) when its first rows are written.
+
+INPUT
+- Source feature class (automated input): Feature class or shapefile providing
+the geometry type, fields and spatial reference of the outputs.
+
+- Rows (automated input): Rows of the source read with the fields of the writer
+(see fields), each with the key of its partition.
+
+OUTPUT
+- Partition feature classes (automated output): One feature class per
+partition, at the path returned for its key by the output path function.
+
+ADDITIONAL FUNCTIONS (explained in script below)
+- PartitionWriter"""
+
+# Libraries
+# =========
+import os
+import logging
+import arcpy
+
+# Number of rows buffered in memory (all partitions) before the buffered rows are written
+MAX_BUFFERED_ROWS = 100000
+
+
+class PartitionWriter(object):
+    """Routes rows of a source feature class to one output feature class per partition key."""
+    def __init__(self, source, outputPath, maxBufferedRows=MAX_BUFFERED_ROWS):
+        """Reads the schema of the source.
+
+        Parameters:
+            source = Source feature class or shapefile (template of the outputs)
+            outputPath = Function returning the path of the output feature class of a partition key
+            maxBufferedRows = Number of rows buffered in memory before the buffered rows are written"""
+        desc = arcpy.Describe(source)
+        self.source = source
+        self.geometryType = desc.shapeType.upper()
+        self.spatialReference = desc.spatialReference
+        self.outputPath = outputPath
+        self.maxBufferedRows = maxBufferedRows
+
+        # Attribute fields copied to the outputs (object ID and geometry fields are created with the outputs)
+        self.fields = ["SHAPE@"] + [fld.name for fld in arcpy.ListFields(source) if fld.type not in ("OID", "Geometry")]
+        self.buffers = {}
+        self.counts = {}
+        self.numBuffered = 0
+
+    def add(self, key, row):
+        """Buffers a row (values of the writer fields) for the output of its partition, writing the buffered rows if the limit is reached."""
+        if key not in self.buffers:
+            self.buffers[key] = []
+        self.buffers[key].append(row)
+        self.numBuffered += 1
+        if self.numBuffered >= self.maxBufferedRows:
+            self.flush()
+
+    def flush(self):
+        """Writes the buffered rows of every partition to its output feature class (created on its first write)."""
+        for key in sorted(self.buffers):
+            outFC = self.outputPath(key)
+            if key not in self.counts:
+                if arcpy.Exists(outFC):
+                    arcpy.Delete_management(outFC)
+                arcpy.CreateFeatureclass_management(os.path.dirname(outFC), os.path.basename(outFC), self.geometryType,
+                                                    self.source, spatial_reference=self.spatialReference)
+                self.counts[key] = 0
+            with arcpy.da.InsertCursor(outFC, self.fields) as cursor:
+                for row in self.buffers[key]:
+                    cursor.insertRow(row)
+            self.counts[key] += len(self.buffers[key])
+        self.buffers = {}
+        self.numBuffered = 0
+
+    def close(self):
+        """Writes the remaining buffered rows and returns dictionary of number of rows written by partition key."""
+        self.flush()
+        for key in sorted(self.counts):
+            logging.info("Partition Writer: '%d' rows of '%s' written to '%s'", self.counts[key], self.source, self.outputPath(key))
+        return self.counts
@@ -16,6 +16,10 @@ from datetime import datetime
 import logging
 import sys
 
+# Reload steps required to refresh memory if Catalog is open when changes are made
+import hashJoin                             # get module reference for reload
+reload(hashJoin)                            # reload step 1
+
 
 class temporalPersistence(object):
     def __init__(self):
@@ -513,7 +517,7 @@ class temporalPersistence(object):
                         arcpy.DeleteField_management(finalOutput, wghtFieldName)
                     addFields.append(persisFieldName)
                     addFields.append(wghtFieldName)
-                self.join_field(finalOutput, "targetID", outputMerge, "targetID", ";".join(addFields))
+                hashJoin.joinField(finalOutput, "targetID", outputMerge, "targetID", addFields)
                 logging.info("Joined new values to '%s' feature class for the following fields: '%s'\n", finalOutput, str(addFields))
 
             # If no previous output feature class, rename merge output to final day or year analysis output
@@ -886,76 +890,4 @@ class temporalPersistence(object):
             logging.info("Delete: '%s' feature class deleted", fc)
         arcpy.AddMessage("Deleting pre-dissolved merge feature class...")
         arcpy.Delete_management(mergeFC)
-        logging.info("Delete: '%s' feature class deleted", mergeFC)
-
-    def joindataGen(self,joinTable,fieldList,sortField):
-        """Code snippet from Esri's Join_Field.py (as a replacement to the Join Field geoprocessing tool, which suffers from exceedingly lengthy processing times.)
-
-        Define generator for join data"""
-        with arcpy.da.SearchCursor(joinTable,fieldList,sql_clause=['DISTINCT',
-                                                                   'ORDER BY '+sortField]) as cursor:
-            for row in cursor:
-                yield row
-
-    def percentile(self,n,pct):
-        """Code snippet from Esri's Join_Field.py (as a replacement to the Join Field geoprocessing tool, which suffers from exceedingly lengthy processing times.)
-
-        Function for progress reporting"""
-        return int(float(n)*float(pct)/100.0)
-
-    def join_field(self, inTable, inJoinField, joinTable, outJoinField, joinFields):
-        """Code snippet from Esri's Join_Field.py (as a replacement to the Join Field geoprocessing tool, which suffers from exceedingly lengthy processing times.)
-
-        Add join fields"""
-        arcpy.AddMessage('\nAdding join fields...')
-        fList = [f for f in arcpy.ListFields(joinTable) if f.name in joinFields.split(';')]
-        for i in range(len(fList)):
-            name = fList[i].name
-            type = fList[i].type
-            if type in ['Integer','OID']:
-                arcpy.AddField_management(inTable,name,field_type='LONG')
-            elif type == 'String':
-                arcpy.AddField_management(inTable,name,field_type='TEXT',field_length=fList[i].length)
-            elif type == 'Double':
-                arcpy.AddField_management(inTable,name,field_type='DOUBLE')
-            elif type == 'Date':
-                arcpy.AddField_management(inTable,name,field_type='DATE')
-            else:
-                arcpy.AddError('\nUnknown field type: {0} for field: {1}'.format(type,name))
-
-        # Write values to join fields
-        arcpy.AddMessage('\nJoining data...')
-        # Create generator for values
-        fieldList = [outJoinField] + joinFields.split(';')
-        joinDataGen = self.joindataGen(joinTable,fieldList,outJoinField)
-        version = sys.version_info[0]
-        if version == 2:
-            joinTuple = joinDataGen.next()
-        else:
-            joinTuple = next(joinDataGen)
-        #
-        fieldList = [inJoinField] + joinFields.split(';')
-        count = int(arcpy.GetCount_management(inTable).getOutput(0))
-        breaks = [self.percentile(count,b) for b in range(10,100,10)]
-        j = 0
-        with arcpy.da.UpdateCursor(inTable,fieldList,sql_clause=(None,'ORDER BY '+inJoinField)) as cursor:
-            for row in cursor:
-                j+=1
-                if j in breaks:
-                    arcpy.AddMessage(str(int(round(j*100.0/count))) + ' percent complete...')
-                row = list(row)
-                key = row[0]
-                try:
-                    while joinTuple[0] < key:
-                        if version == 2:
-                            joinTuple = joinDataGen.next()
-                        else:
-                            joinTuple = next(joinDataGen)
-                    if key == joinTuple[0]:
-                        for i in range(len(joinTuple))[1:]:
-                            row[i] = joinTuple[i]
-                        row = tuple(row)
-                        cursor.updateRow(row)
-                except StopIteration:
-                    arcpy.AddWarning('\nEnd of join table.')
-                    break
\ No newline at end of file
+        logging.info("Delete: '%s' feature class deleted", mergeFC)
\ No newline at end of file
@@ -0,0 +1,183 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#==============================================================================#
+# HISTORY                                                                      #
+# -------                                                                      #
+# Developed October 2026.                                                      #
+#==============================================================================#
+"""USAGE
+Module imported and used by the "temporalPersistence.py" script (and by the
+dark target store, see 'darkTargetStore.py') when the "Spatial Index" persistence
+engine is selected, to reuse the intermediate results of previous analyses.
+
+SUMMARY
+Content-addressed cache of persistence intermediates, stored as NumPy (.npz)
+files in a cache folder beside the analysis GDB. Each entry is keyed by a hash of
+its inputs:
+    - Dissolved centroids of a time slice: keyed by the content of the polygons of
+    the time slice (coordinates, targetIDs and selection resulting from the
+    attribute criteria), so that a rerun with the same layers reuses the centroids
+    of every slice whose selection is unchanged.
+    - Neighbour pairs: keyed by the content keys of every time slice and the
+    persistence radius at which they were found. Neighbour pairs found at a larger
+    radius are reused for any smaller radius.
+
+The total size of the cache is limited (CACHE_SIZE_MB). When exceeded, the least
+recently used entries are deleted.
+
+INPUT
+- Cache entries (automated input): Dictionaries of numeric NumPy arrays, with
+their content key.
+
+OUTPUT
+- Cache folder (automated output): 'persistence_cache' folder in the folder of
+the analysis GDB, with one .npz file per entry and an 'index.json' file recording
+the size, last use and tags of each entry.
+
+ADDITIONAL FUNCTIONS (explained in script below)
+- contentKey
+- PersistenceCache"""
+
+# Libraries
+# =========
+import os
+import json
+import time
+import hashlib
+import logging
+import numpy as np
+
+# Name of the cache folder (created in the folder of the analysis GDB)
+CACHE_FOLDER = "persistence_cache"
+
+# Maximum total size of the cache entries, least recently used entries are deleted beyond this size
+CACHE_SIZE_MB = 2048
+
+INDEX_FILE = "index.json"
+
+
+def contentKey(*parts):
+    """Returns the SHA-1 hexadecimal digest of arrays and JSON serializable values.
+
+    Parameters:
+        parts = NumPy arrays (numeric or boolean), byte strings or JSON serializable values
+
+    Return:
+        Returns content key (string of 40 hexadecimal characters)"""
+    digest = hashlib.sha1()
+    for part in parts:
+        if isinstance(part, np.ndarray):
+            part = np.ascontiguousarray(part)
+            digest.update((part.dtype.str + str(part.shape)).encode("utf-8"))
+            digest.update(part.tobytes())
+        elif isinstance(part, bytes):
+            digest.update(part)
+        else:
+            digest.update(json.dumps(part, sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class PersistenceCache(object):
+    """Folder of cached arrays indexed by content key, with least recently used eviction."""
+
+    def __init__(self, folder, maxSizeMB=CACHE_SIZE_MB):
+        """Opens the cache folder (created if necessary) and reads its index.
+
+        Parameters:
+            folder = Path of the cache folder
+            maxSizeMB = Maximum total size of the cache entries (MB)
+
+        Return:
+            No return"""
+        self.folder = folder
+        self.maxSize = int(maxSizeMB * 1048576)
+        self.index = {}
+        if not os.path.exists(folder):
+            os.makedirs(folder)
+        indexFile = os.path.join(folder, INDEX_FILE)
+        if os.path.exists(indexFile):
+            try:
+                with open(indexFile, "r") as jsonFile:
+                    self.index = json.load(jsonFile)
+            except ValueError:
+                self.index = {}
+
+        # Entries without a file (deleted outside of the cache) are removed from the index
+        for key in list(self.index.keys()):
+            if not os.path.exists(self.entryFile(key)):
+                del self.index[key]
+
+    def entryFile(self, key):
+        """Returns path of the .npz file of a cache entry."""
+        return os.path.join(self.folder, key + ".npz")
+
+    def saveIndex(self):
+        """Writes the index of the cache entries."""
+        with open(os.path.join(self.folder, INDEX_FILE), "w") as jsonFile:
+            json.dump(self.index, jsonFile, indent=2)
+
+    def get(self, key):
+        """Returns the arrays of a cache entry (dictionary of arrays), or None if the key is not cached."""
+        if key not in self.index:
+            return None
+        with np.load(self.entryFile(key)) as entry:
+            arrays = dict((name, entry[name]) for name in entry.files)
+        self.index[key]["lastUsed"] = time.time()
+        self.saveIndex()
+        logging.info("Persistence Cache: Entry '%s' reused (%s)", key, str(self.index[key]["tags"]))
+        return arrays
+
+    def put(self, key, arrays, tags=None):
+        """Writes a cache entry and deletes the least recently used entries if the cache exceeds its maximum size.
+
+        Parameters:
+            key = Content key of the entry
+            arrays = Dictionary of numeric NumPy arrays
+            tags = Dictionary of JSON serializable values describing the entry (used by find)
+
+        Return:
+            No return"""
+        with open(self.entryFile(key), "wb") as npzFile:
+            np.savez(npzFile, **arrays)
+        self.index[key] = {"size": os.path.getsize(self.entryFile(key)), "lastUsed": time.time(), "tags": tags or {}}
+        self.evict()
+        self.saveIndex()
+
+    def find(self, **tags):
+        """Returns list of keys of the cache entries whose tags include the given tag values."""
+        return [key for key, entry in self.index.items()
+                if all(entry["tags"].get(name) == value for name, value in tags.items())]
+
+    def evict(self):
+        """Deletes the least recently used entries until the total size of the cache does not exceed its maximum size."""
+        totalSize = sum(entry["size"] for entry in self.index.values())
+        for key in sorted(self.index, key=lambda k: self.index[k]["lastUsed"]):
+            if totalSize <= self.maxSize:
+                break
+            totalSize -= self.index[key]["size"]
+            os.remove(self.entryFile(key))
+            del self.index[key]
+            logging.info("Persistence Cache: Entry '%s' evicted (least recently used)", key)
+
+    def getNeighbours(self, targetsKey, radius):
+        """Returns cached neighbour pairs of the targets found at the smallest cached radius equal or greater than the radius.
+
+        Parameters:
+            targetsKey = Content key of the dissolved targets (content keys of every time slice)
+            radius = Persistence radius of the neighbour pairs
+
+        Return:
+            Returns tuple of neighbour pair arrays sorted by distance (see persistenceEngine.sortNeighbours),
+            or None if no neighbour pairs are cached at a sufficient radius"""
+        keys = [key for key in self.find(kind="neighbours", targets=targetsKey) if self.index[key]["tags"]["radius"] >= radius]
+        if keys == []:
+            return None
+        key = min(keys, key=lambda k: self.index[k]["tags"]["radius"])
+        arrays = self.get(key)
+        return arrays["targetIdx"], arrays["neighbourIdx"], arrays["distance"]
+
+    def putNeighbours(self, targetsKey, radius, neighbours):
+        """Writes neighbour pairs (sorted by distance) of the targets found at the radius in the cache."""
+        arrays = {"targetIdx": neighbours[0], "neighbourIdx": neighbours[1], "distance": neighbours[2]}
+        self.put(contentKey("neighbours", targetsKey, radius), arrays, {"kind": "neighbours", "targets": targetsKey, "radius": radius})
@@ -0,0 +1,358 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#==============================================================================#
+# HISTORY                                                                      #
+# -------                                                                      #
+# Developed October 2026.                                                      #
+#==============================================================================#
+"""USAGE
+Module imported and used by the "temporalPersistence.py" script when the
+"Spatial Index" persistence engine is selected in the "3_Temporal Persistence
+Analysis" tool. The functions below do not require arcpy and operate on NumPy
+arrays of target centroids only.
+
+SUMMARY
+Calculates the persistence and weight values of dark targets from neighbour
+queries between target centroids of different times (days or years), instead
+of buffering, unioning and dissolving the dark target feature classes. The
+centroids of each time slice are organized in a uniform grid index whose cell
+size is equal to the persistence radius, so that only the targets located in
+the 3 x 3 block of grid cells surrounding a target need to be compared to it.
+
+INPUT
+- Centroid coordinates (x, y) of every dark target (by targetID), in the planar
+coordinate system of the analysis (NAD 1983 Canada Atlas Lambert, meters).
+
+- Time slice index of every dark target (one integer value per day or year).
+
+- Persistence radius (meters).
+
+OUTPUT
+- Persistence value: Number of different times (days or years) which have at
+least one dark target centroid within the persistence radius of the dark target.
+
+- Weight value: 1 for the dark target itself, plus 1 for each dark target from
+a different time within the persistence radius of the dark target.
+
+- Neighbour pairs: Indices of every pair of dark targets from different times
+located within the persistence radius of each other, and their distance (used for
+clustering). Neighbour pairs are found once at the largest persistence radius and
+sorted by distance, so that every smaller radius is answered from the same pairs.
+When time slices are added to a previous analysis, only the neighbour pairs
+involving the targets of the new time slices are searched (see 'edgeTable.py').
+
+- Clusters: Groups of dark targets connected to each other by neighbour pairs,
+determined with a disjoint-set (union-find) structure.
+
+ADDITIONAL FUNCTIONS (explained in script below)
+- buildGridIndex
+- queryGridIndex
+- findNeighbours
+- findNewNeighbours
+- calcPersistence
+- sortNeighbours
+- withinRadius
+- DisjointSet
+- buildClusters"""
+
+# Libraries
+# =========
+import numpy as np
+
+# Offset and stride used to combine the column and row of a grid cell into a single integer key
+CELL_OFFSET = 2 ** 30
+CELL_STRIDE = 2 ** 31
+
+
+def cellKey(col, row):
+    """Combines grid cell column and row numbers into a single sortable integer key.
+
+    Parameters:
+        col = Array of grid cell column numbers
+        row = Array of grid cell row numbers
+
+    Return:
+        Returns array of 64 bit integer keys, one per grid cell"""
+    return (col.astype(np.int64) + CELL_OFFSET) * CELL_STRIDE + (row.astype(np.int64) + CELL_OFFSET)
+
+
+def buildGridIndex(x, y, cellSize):
+    """Builds a uniform grid index over a set of points.
+
+    Parameters:
+        x = Array of point x coordinates
+        y = Array of point y coordinates
+        cellSize = Width and height of the grid cells (same units as the coordinates)
+
+    Return:
+        Returns dictionary containing the point coordinates, the cell size, the
+        sorted cell keys and the order of the points sorted by cell key"""
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    cellSize = float(cellSize)
+    keys = cellKey(np.floor(x / cellSize), np.floor(y / cellSize))
+    order = np.argsort(keys, kind="mergesort")
+    return {"x": x, "y": y, "cellSize": cellSize, "keys": keys[order], "order": order}
+
+
+def queryGridIndex(index, qx, qy, radius):
+    """Finds every indexed point located within the radius of each query point.
+
+    Parameters:
+        index = Grid index created by buildGridIndex
+        qx = Array of query point x coordinates
+        qy = Array of query point y coordinates
+        radius = Search radius (must not exceed the cell size of the grid index)
+
+    Return:
+        Returns three arrays of equal length describing each pair found: index of
+        the query point, index of the indexed point and distance between both points"""
+    qx = np.asarray(qx, dtype=np.float64)
+    qy = np.asarray(qy, dtype=np.float64)
+    cellSize = index["cellSize"]
+    if radius > cellSize:
+        raise ValueError("Search radius of {0} exceeds grid index cell size of {1}".format(radius, cellSize))
+
+    qCol = np.floor(qx / cellSize)
+    qRow = np.floor(qy / cellSize)
+    queryIdx = np.arange(len(qx))
+    qList, tList, dList = [], [], []
+
+    # Iterate through the 3 x 3 block of grid cells surrounding each query point
+    for dCol in (-1, 0, 1):
+        for dRow in (-1, 0, 1):
+            keys = cellKey(qCol + dCol, qRow + dRow)
+            lo = np.searchsorted(index["keys"], keys, "left")
+            hi = np.searchsorted(index["keys"], keys, "right")
+            counts = hi - lo
+            total = counts.sum()
+            if total == 0:
+                continue
+
+            # Expand the range of sorted positions found for each query point into individual candidate pairs
+            qi = np.repeat(queryIdx, counts)
+            offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+            ti = index["order"][np.repeat(lo, counts) + offsets]
+            dist = np.hypot(qx[qi] - index["x"][ti], qy[qi] - index["y"][ti])
+            keep = dist <= radius
+            qList.append(qi[keep])
+            tList.append(ti[keep])
+            dList.append(dist[keep])
+
+    if qList == []:
+        return np.zeros(0, np.int64), np.zeros(0, np.int64), np.zeros(0, np.float64)
+    return np.concatenate(qList), np.concatenate(tList), np.concatenate(dList)
+
+
+def findNeighbours(x, y, slices, radius):
+    """Finds every pair of targets from different time slices located within the radius of each other.
+
+    A grid index is built for each time slice and queried with the targets of every other time slice.
+
+    Parameters:
+        x = Array of target centroid x coordinates
+        y = Array of target centroid y coordinates
+        slices = Array of time slice index of each target
+        radius = Persistence radius
+
+    Return:
+        Returns three arrays of equal length describing each ordered pair found:
+        index of the target, index of the neighbouring target and distance between
+        both targets (each pair is present in both directions)"""
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    slices = np.asarray(slices)
+    qList, tList, dList = [], [], []
+    for s in np.unique(slices):
+        inSlice = np.nonzero(slices == s)[0]
+        outSlice = np.nonzero(slices != s)[0]
+        if len(outSlice) == 0:
+            continue
+        index = buildGridIndex(x[inSlice], y[inSlice], radius)
+        qi, ti, dist = queryGridIndex(index, x[outSlice], y[outSlice], radius)
+        qList.append(outSlice[qi])
+        tList.append(inSlice[ti])
+        dList.append(dist)
+
+    if qList == []:
+        return np.zeros(0, np.int64), np.zeros(0, np.int64), np.zeros(0, np.float64)
+    return np.concatenate(qList), np.concatenate(tList), np.concatenate(dList)
+
+
+def findNewNeighbours(x, y, slices, newSlices, radius):
+    """Finds every pair of targets from different time slices located within the radius of each other, involving a target of a new time slice.
+
+    Pairs between targets of existing time slices (recorded by a previous analysis) are not searched.
+
+    Parameters:
+        x = Array of target centroid x coordinates
+        y = Array of target centroid y coordinates
+        slices = Array of time slice index of each target
+        newSlices = List of indices of the new time slices
+        radius = Persistence radius
+
+    Return:
+        Returns the three arrays of findNeighbours (each pair present in both directions),
+        limited to the pairs with at least one target of a new time slice"""
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    slices = np.asarray(slices)
+    isNew = np.in1d(slices, newSlices)
+    qList, tList, dList = [], [], []
+    for s in np.unique(slices[isNew]):
+        inSlice = np.nonzero(slices == s)[0]
+        outSlice = np.nonzero(slices != s)[0]
+        if len(outSlice) == 0:
+            continue
+        index = buildGridIndex(x[inSlice], y[inSlice], radius)
+        qi, ti, dist = queryGridIndex(index, x[outSlice], y[outSlice], radius)
+        qList.append(outSlice[qi])
+        tList.append(inSlice[ti])
+        dList.append(dist)
+
+        # Pairs with targets of existing time slices are added in the reverse direction (pairs between new time slices are found from both slices)
+        existing = ~isNew[outSlice[qi]]
+        qList.append(inSlice[ti][existing])
+        tList.append(outSlice[qi][existing])
+        dList.append(dist[existing])
+
+    if qList == []:
+        return np.zeros(0, np.int64), np.zeros(0, np.int64), np.zeros(0, np.float64)
+    return np.concatenate(qList), np.concatenate(tList), np.concatenate(dList)
+
+
+def calcPersistence(slices, targetIdx, neighbourIdx):
+    """Calculates the persistence and weight values of each target from its neighbour pairs.
+
+    Parameters:
+        slices = Array of time slice index of each target
+        targetIdx = Array of target indices of the neighbour pairs
+        neighbourIdx = Array of neighbouring target indices of the neighbour pairs
+
+    Return:
+        Returns two arrays with one value per target: persistence value (number of
+        different time slices with a neighbouring target) and weight value (1 for
+        the target itself plus 1 for each neighbouring target)"""
+    slices = np.asarray(slices)
+    numTargets = len(slices)
+    sliceValues, sliceIdx = np.unique(slices, return_inverse=True)
+    numSlices = len(sliceValues)
+
+    # Count distinct time slices of neighbouring targets for each target
+    targetSlice = np.unique(np.asarray(targetIdx, dtype=np.int64) * numSlices + sliceIdx[neighbourIdx])
+    persis = np.bincount(targetSlice // numSlices, minlength=numTargets)
+
+    # Count neighbouring targets for each target, in addition to the target itself
+    weight = np.bincount(targetIdx, minlength=numTargets) + 1
+
+    return persis, weight
+
+
+def sortNeighbours(targetIdx, neighbourIdx, distance):
+    """Sorts neighbour pairs by increasing distance.
+
+    Neighbour pairs found once at the largest persistence radius can then be
+    reduced to any smaller radius with withinRadius, without querying the grid
+    index again.
+
+    Parameters:
+        targetIdx = Array of target indices of the neighbour pairs
+        neighbourIdx = Array of neighbouring target indices of the neighbour pairs
+        distance = Array of distances between the targets of the neighbour pairs
+
+    Return:
+        Returns the three arrays sorted by increasing distance"""
+    order = np.argsort(distance, kind="mergesort")
+    return targetIdx[order], neighbourIdx[order], distance[order]
+
+
+def withinRadius(sortedNeighbours, radius):
+    """Reduces neighbour pairs sorted by distance to those within the specified radius.
+
+    Parameters:
+        sortedNeighbours = Tuple of neighbour pair arrays (target indices, neighbouring
+        target indices, distances) sorted by sortNeighbours
+        radius = Persistence radius (not exceeding the radius used to find the neighbour pairs)
+
+    Return:
+        Returns the three arrays reduced to the neighbour pairs within the radius"""
+    targetIdx, neighbourIdx, distance = sortedNeighbours
+    end = np.searchsorted(distance, radius, "right")
+    return targetIdx[:end], neighbourIdx[:end], distance[:end]
+
+
+class DisjointSet(object):
+    """Disjoint-set (union-find) structure used to group clustered targetIDs.
+
+    Implements path compression (in find) and union by rank (in union), so that
+    grouping any number of targets is performed in near-linear time."""
+    def __init__(self):
+        """Initialize empty parent, rank and insertion order records."""
+        self.parent = {}
+        self.rank = {}
+        self.order = []
+
+    def add(self, item):
+        """Adds an item as its own single-member set, if not already recorded."""
+        if item not in self.parent:
+            self.parent[item] = item
+            self.rank[item] = 0
+            self.order.append(item)
+
+    def find(self, item):
+        """Returns the representative item of the set containing the item, compressing the path to it."""
+        root = item
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[item] != root:
+            nextItem = self.parent[item]
+            self.parent[item] = root
+            item = nextItem
+        return root
+
+    def union(self, item1, item2):
+        """Merges the sets containing both items, attaching the lower ranked set under the higher ranked set."""
+        root1 = self.find(item1)
+        root2 = self.find(item2)
+        if root1 == root2:
+            return
+        if self.rank[root1] < self.rank[root2]:
+            root1, root2 = root2, root1
+        self.parent[root2] = root1
+        if self.rank[root1] == self.rank[root2]:
+            self.rank[root1] += 1
+
+    def groups(self):
+        """Returns list of sets (as lists of items), ordered by the first recorded item of each set."""
+        groupDict = {}
+        groupList = []
+        for item in self.order:
+            root = self.find(item)
+            if root not in groupDict:
+                groupDict[root] = []
+                groupList.append(groupDict[root])
+            groupDict[root].append(item)
+        return groupList
+
+
+def buildClusters(targetList):
+    """Groups clustered targetIDs into clusters of connected targets.
+
+    Parameters:
+        targetList = List of initial clusters, each a list of targetIDs found together
+        (a row of the dissolved union, or a pair of neighbouring targets)
+
+    Return:
+        Returns list of clusters (lists of unique targetIDs). Targets appearing in
+        initial clusters that share at least one targetID, directly or through
+        other initial clusters, are grouped in the same cluster. Clusters are
+        ordered by the first appearance of any of their targetIDs in targetList."""
+    clusters = DisjointSet()
+    for item in targetList:
+        first = item[0]
+        clusters.add(first)
+        for target in item[1:]:
+            clusters.add(target)
+            clusters.union(first, target)
+    return clusters.groups()
@@ -0,0 +1,234 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#==============================================================================#
+# HISTORY                                                                      #
+# -------                                                                      #
+# Developed October 2026.                                                      #
+#==============================================================================#
+"""USAGE
+Module imported and used by the "temporalPersistence.py" script (calcPersis) to
+calculate the persistence statistics of each time slice with the "Buffer and
+Union" persistence engine, either one time slice after another or in parallel
+with a pool of worker processes.
+
+SUMMARY
+The Union, Dissolve, persistence UpdateCursor and Statistics geoprocessing chain
+of each buffer (or targetID) feature class is independent of the chains of the
+other time slices. With more than one worker process, the time slices are
+distributed to a pool of processes (multiprocessing), each writing its Union,
+Dissolve and statistics outputs to its own scratch file geodatabase (avoiding
+schema locks on the analysis GDB). Once every time slice is processed, the
+statistics tables and Dissolve feature classes (from which the clusters are
+determined) are copied to the analysis GDB and the scratch geodatabases are
+deleted.
+
+When executed from ArcMap or ArcCatalog (in-process), the worker processes are
+started with the Python executable of the ArcGIS installation rather than the
+application executable (see 'processPool.py').
+
+INPUT
+- Union tasks (automated input): Buffer (or targetID) feature class of each time
+slice and the targetID feature classes of the other time slices.
+
+- Worker count (user input): Number of worker processes (1 to process the time
+slices one after another in the analysis GDB).
+
+OUTPUT
+- Statistics tables (automated output): 'targetID_<time>_<distance>_stats' table
+of each time slice in the analysis GDB, with the maximum persistence value and
+the weight value of each dark target.
+
+- Dissolve feature classes (automated output): '<prefix>_<time>_<distance>_Union_dissolve'
+feature class of each time slice in the analysis GDB, with the targetIDs of the
+overlapping dark targets of each polygon.
+
+ADDITIONAL FUNCTIONS (explained in script below)
+- unionStats
+- unionStatsWorker
+- runPool"""
+
+# Libraries
+# =========
+import os
+import time
+import shutil
+import logging
+import traceback
+import multiprocessing
+import arcpy
+import stageProfiler
+
+# Reload steps required to refresh memory if Catalog is open when changes are made
+import processPool                          # get module reference for reload
+reload(processPool)                         # reload step 1
+
+# Name of the folder of the scratch geodatabases of the worker processes (created in the folder of the analysis GDB)
+SCRATCH_FOLDER = "persistence_scratch"
+
+
+def unionStats(workspace, outWorkspace, fc, targetIDfeatList, yrPersisBool, bufferDist):
+    """Calculates the persistence statistics of the dark targets of one time slice.
+
+    Parameters:
+        workspace = Analysis GDB containing the buffer (or targetID) and targetID feature classes
+        outWorkspace = Workspace to which the Union, Dissolve and statistics outputs are written
+        fc = Buffer (or targetID, in case of analysis by direct intersection) feature class of the time slice
+        targetIDfeatList = List of feature classes in which dark targets are dissolved by targetID
+        yrPersisBool = Boolean value indicating whether type of analysis is day-to-day within the year or overall year-to-year
+        bufferDist = Buffer distance at which to carry out the persistence analysis
+
+    Return:
+        Returns tuple of the path of the statistics table, with the maximum persistence value and weight value of
+        each dark target, and the path of the Dissolve feature class, with the targetIDs of the overlapping dark targets"""
+    # Determine time (day or year) of current buffer feature class and use current buffer feature class to start list of feature classes to union
+    fcTime = fc.split("_")[1]
+    unionList = [os.path.join(workspace, fc)]
+
+    # Determine field and feature class names for union depending of type of analysis (day-to-day or year-to-year)
+    if yrPersisBool:
+        union = os.path.join(outWorkspace, "persistent_targets_" + fcTime + "_"+ str(bufferDist) + "_Union")
+        persisFieldName = "Ypers" + str(bufferDist)
+        weightFieldName = "Ywght" + str(bufferDist)
+    else:
+        union = os.path.join(outWorkspace, "RS2_" + fcTime + "_" + str(bufferDist) + "_Union")
+        persisFieldName = "pers" + str(bufferDist)
+        weightFieldName = "wght" + str(bufferDist)
+
+    # Append targetID feature classes from times other than current buffer feature class to list of feature classes to union
+    for targetFc in targetIDfeatList:
+        if fcTime != targetFc.split("_")[1]:
+            unionList.append(os.path.join(workspace, targetFc))
+
+    # Perform union of feature classes to determine dark target persistence between layers
+    with stageProfiler.stage("Union"):
+        arcpy.Union_analysis(unionList, union)
+    logging.info("Union: Created '%s' feature class from union of following feature classes: '%s'", union, str(unionList))
+
+    # Dissolve union features by targetID to remove possible duplicate features
+    arcpy.AddMessage("Dissolving...")
+    dissolve = union + "_dissolve"
+    dissolveFields = []
+    fldList = arcpy.ListFields(union)
+    for fld in fldList:
+        if fld.name.startswith("targetID"):
+            dissolveFields.append(fld.name)
+    with stageProfiler.stage("Dissolve"):
+        arcpy.Dissolve_management(union, dissolve, dissolveFields)
+    logging.info("Dissolve: '%s' feature class created from '%s' feature class dissolve", dissolve, union)
+
+    # Add and calculate persistence values
+    arcpy.AddMessage("Calculating persistence value...")
+    arcpy.AddField_management(dissolve, persisFieldName, "SHORT")
+    logging.info("Add Field: '%s' field added to '%s' feature class", persisFieldName, dissolve)
+    cursorFields = dissolveFields
+    cursorFields.append(persisFieldName)
+    with stageProfiler.stage("Persistence update cursor") as record, arcpy.da.UpdateCursor(dissolve, cursorFields) as cursor:
+
+        # Calculate persistence of targets by checking for polygons with multiple targetIDs (indicating an overlap occurring after the Union of feature classes)
+        numRows = 0
+        for row in cursor:
+            persis_count = -1
+            for item in row[:-1]:
+                if item != "":
+                    persis_count += 1
+            row[len(row)-1] = persis_count
+            cursor.updateRow(row)
+            numRows += 1
+        record["rows"] = numRows
+    logging.info("Update Cursor: Persistence values calculated for '%s' feature class", dissolve)
+
+    # Summarize persistence statistics (count maximum persistence value and determine weight value for each dark target)
+    arcpy.AddMessage("Summarizing persistence statistics and determining weight value...")
+    outTable = os.path.join(outWorkspace, "targetID_" + fcTime + "_" + str(bufferDist) + "_stats")
+    stats = persisFieldName + " MAX"
+    casefield = "targetID_" + fcTime
+    with stageProfiler.stage("Statistics"):
+        arcpy.Statistics_analysis(dissolve, outTable, stats, casefield)
+    logging.info("Statistics: '%s' table created with maximum persistence value and weight value (frequency) calculations from '%s' feature class", outTable, dissolve)
+    arcpy.AlterField_management(outTable, "FREQUENCY", weightFieldName)
+    return outTable, dissolve
+
+
+def unionStatsWorker(task):
+    """Executes unionStats in a worker process, in the scratch geodatabase of the task (created if necessary).
+
+    Parameters:
+        task = Tuple of the unionStats parameters, with the path of a scratch file geodatabase as outWorkspace
+
+    Return:
+        Returns tuple of the buffer (or targetID) feature class, path of the statistics table, path of
+        the Dissolve feature class and processing time (seconds). Errors are raised as RuntimeError with the traceback of the worker."""
+    try:
+        startTime = time.time()
+        workspace, scratchGDB, fc = task[0], task[1], task[2]
+        if not arcpy.Exists(scratchGDB):
+            arcpy.CreateFileGDB_management(os.path.dirname(scratchGDB), os.path.basename(scratchGDB))
+        arcpy.env.workspace = workspace
+        outTable, dissolve = unionStats(*task)
+        return fc, outTable, dissolve, time.time() - startTime
+    except Exception:
+        raise RuntimeError(traceback.format_exc())
+
+
+def runPool(workspace, tasks, workers):
+    """Processes union tasks with a pool of worker processes and copies the statistics tables and Dissolve feature classes to the analysis GDB.
+
+    Parameters:
+        workspace = Analysis GDB, in the folder of which the scratch geodatabases are created
+        tasks = List of tuples (fc, targetIDfeatList, yrPersisBool, bufferDist) of each time slice
+        workers = Number of worker processes (limited to the number of tasks and processors)
+
+    Return:
+        Returns list of paths of the statistics tables copied to the analysis GDB (in the order of the tasks)"""
+    scratchFolder = os.path.join(os.path.dirname(workspace), SCRATCH_FOLDER)
+    if os.path.exists(scratchFolder):
+        shutil.rmtree(scratchFolder)
+    os.makedirs(scratchFolder)
+
+    # Each task writes to its own scratch geodatabase
+    poolTasks = []
+    for i in range(len(tasks)):
+        scratchGDB = os.path.join(scratchFolder, "scratch_" + str(i) + ".gdb")
+        poolTasks.append((workspace, scratchGDB) + tuple(tasks[i]))
+
+    workers = max(1, min(int(workers), len(tasks), multiprocessing.cpu_count()))
+    executable = processPool.pythonExecutable()
+    if executable is not None:
+        multiprocessing.set_executable(executable)
+    arcpy.AddMessage("Processing " + str(len(tasks)) + " layers with " + str(workers) + " worker processes...")
+    logging.info("Worker Pool: '%d' union tasks distributed to '%d' worker processes", len(tasks), workers)
+
+    # Outputs of each task recorded as it is completed
+    results = {}
+    pool = multiprocessing.Pool(workers)
+    try:
+        for fc, scratchTable, scratchDissolve, elapsed in pool.imap_unordered(unionStatsWorker, poolTasks):
+            results[fc] = (scratchTable, scratchDissolve)
+            arcpy.AddMessage("Persistence statistics of '" + fc + "' complete (" + str(len(results)) + " of " + str(len(tasks)) + ")...")
+            logging.info("Worker Pool: '%s' table and '%s' feature class created from '%s' feature class in %.1f seconds", scratchTable, scratchDissolve, fc, elapsed)
+        pool.close()
+    except Exception:
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+
+    # Copy statistics table and Dissolve feature class of each task to the analysis GDB, in the order of the tasks (as created by a serial run)
+    statsList = []
+    for task in tasks:
+        scratchTable, scratchDissolve = results[task[0]]
+        outTable = os.path.join(workspace, os.path.basename(scratchTable))
+        arcpy.Copy_management(scratchTable, outTable)
+        statsList.append(outTable)
+        outDissolve = os.path.join(workspace, os.path.basename(scratchDissolve))
+        arcpy.Copy_management(scratchDissolve, outDissolve)
+        logging.info("Copy: '%s' table and '%s' feature class copied to '%s'", scratchTable, scratchDissolve, workspace)
+
+    # Delete scratch geodatabases
+    for i in range(len(poolTasks)):
+        if arcpy.Exists(poolTasks[i][1]):
+            arcpy.Delete_management(poolTasks[i][1])
+    shutil.rmtree(scratchFolder, ignore_errors=True)
+    logging.info("Worker Pool: Scratch geodatabases deleted from '%s'\n", scratchFolder)
+    return statsList
@@ -0,0 +1,46 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#==============================================================================#
+# HISTORY                                                                      #
+# -------                                                                      #
+# Developed October 2026.                                                      #
+#==============================================================================#
+"""USAGE
+Module imported and used by the "persistencePool.py" and "ingestionPool.py"
+scripts to start their pools of worker processes. Does not require arcpy.
+
+SUMMARY
+ArcMap, ArcCatalog and ArcGIS Pro execute tools in-process, in which case the
+current executable is the application rather than Python. The worker processes
+(multiprocessing) are then started with the Python executable of the ArcGIS
+installation.
+
+INPUT
+- Current executable (automated input): Executable of the current process.
+
+OUTPUT
+- Python executable (automated output): Path of the Python executable with which
+to start the worker processes.
+
+ADDITIONAL FUNCTIONS (explained in script below)
+- pythonExecutable"""
+
+# Libraries
+# =========
+import os
+import sys
+
+
+def pythonExecutable():
+    """Returns path of the Python executable with which to start worker processes, or None if the current executable is Python.
+
+    ArcMap, ArcCatalog and ArcGIS Pro execute tools in-process, in which case the current
+    executable is the application rather than Python."""
+    if os.path.basename(sys.executable).lower().startswith("python"):
+        return None
+    for name in ("pythonw.exe", "python.exe"):
+        executable = os.path.join(sys.exec_prefix, name)
+        if os.path.exists(executable):
+            return executable
+    return None
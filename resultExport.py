@@ -0,0 +1,212 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#==============================================================================#
+# HISTORY                                                                      #
+# -------                                                                      #
+# Developed October 2026.                                                      #
+#==============================================================================#
+"""USAGE
+Module imported and used by the "temporalPersistence.py" script to export the
+attribute table of the consolidated persistent targets feature class, as a
+replacement to the Export Feature Attribute to ASCII (ExportXYv) geoprocessing
+tool.
+
+SUMMARY
+Streams the rows of a feature class (or table) with a single cursor iteration and
+writes them in chunks to a CSV file or to a Parquet file, without holding the
+whole table in memory. The Parquet file is columnar and compressed, with typed
+numeric and date columns (one row group per chunk), and requires the optional
+'pyarrow' library. If 'pyarrow' is not available, a CSV file is written instead.
+
+As for ExportXYv, the X and Y coordinates of each feature (centroid) are written
+in the 'XCoord' and 'YCoord' columns, followed by every attribute field other
+than the geometry fields.
+
+INPUT
+- Feature class (automated input): Feature class (or table) to export.
+
+- Export format (user input): 'CSV' or 'Parquet'.
+
+OUTPUT
+- CSV or Parquet file (automated output): File with the same name as the output
+path and the extension of the export format ('.csv' or '.parquet').
+
+ADDITIONAL FUNCTIONS (explained in script below)
+- exportFields
+- readChunks
+- writeCSV
+- writeParquet
+- exportTable"""
+
+# Libraries
+# =========
+import os
+import sys
+import csv
+import logging
+import arcpy
+import stageProfiler
+
+# pyarrow is optional, only required for the Parquet export format
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+# Export format parameter values
+CSV_FORMAT = "CSV"
+PARQUET_FORMAT = "Parquet"
+
+# Number of rows read and written per chunk
+CHUNK_SIZE = 50000
+
+# Field types not exported
+SKIP_FIELD_TYPES = ["Geometry", "Blob", "Raster"]
+
+# Parquet column types for each field type (other field types are written as strings)
+PARQUET_TYPES = {"OID": "int64", "Integer": "int32", "SmallInteger": "int16", "Double": "float64",
+                 "Single": "float32", "Date": "timestamp", "String": "string"}
+
+
+def exportFields(table):
+    """Determines the fields to export (coordinates, then attribute fields other than geometry fields).
+
+    Parameters:
+        table = Feature class or table to export
+
+    Return:
+        Returns list of cursor field names, list of column names and list of field types"""
+    cursorFields, columnNames, fieldTypes = [], [], []
+    if hasattr(arcpy.Describe(table), "shapeType"):
+        cursorFields = ["SHAPE@X", "SHAPE@Y"]
+        columnNames = ["XCoord", "YCoord"]
+        fieldTypes = ["Double", "Double"]
+    for fld in arcpy.ListFields(table):
+        if fld.type in SKIP_FIELD_TYPES or fld.name.upper() in ("SHAPE_LENGTH", "SHAPE_AREA"):
+            continue
+        cursorFields.append(fld.name)
+        columnNames.append(fld.name)
+        fieldTypes.append(fld.type)
+    return cursorFields, columnNames, fieldTypes
+
+
+def readChunks(table, cursorFields, chunkSize=CHUNK_SIZE):
+    """Generator of lists of rows read from the table with a single cursor iteration.
+
+    Parameters:
+        table = Feature class or table to read
+        cursorFields = List of cursor field names
+        chunkSize = Maximum number of rows per chunk
+
+    Return:
+        Yields lists of at most chunkSize rows (tuples)"""
+    chunk = []
+    with arcpy.da.SearchCursor(table, cursorFields) as cursor:
+        for row in cursor:
+            chunk.append(row)
+            if len(chunk) == chunkSize:
+                yield chunk
+                chunk = []
+    if chunk != []:
+        yield chunk
+
+
+def writeCSV(chunks, outFile, columnNames):
+    """Writes chunks of rows to a CSV file, with a header row of column names.
+
+    Parameters:
+        chunks = Iterable of lists of rows
+        outFile = Path of the CSV file to create
+        columnNames = List of column names
+
+    Return:
+        Returns number of rows written"""
+    count = 0
+    if sys.version_info[0] == 2:
+        csvFile = open(outFile, "wb")
+    else:
+        csvFile = open(outFile, "w", newline="")
+    with csvFile:
+        writer = csv.writer(csvFile)
+        writer.writerow(columnNames)
+        for chunk in chunks:
+            rows = []
+            for row in chunk:
+                values = []
+                for value in row:
+                    if value is None:
+                        value = ""
+                    elif hasattr(value, "isoformat"):
+                        value = value.isoformat(" ")
+                    elif sys.version_info[0] == 2 and isinstance(value, unicode):
+                        value = value.encode("utf-8")
+                    values.append(value)
+                rows.append(values)
+            writer.writerows(rows)
+            count += len(chunk)
+    return count
+
+
+def writeParquet(chunks, outFile, columnNames, fieldTypes):
+    """Writes chunks of rows to a compressed Parquet file, with one row group per chunk.
+
+    Parameters:
+        chunks = Iterable of lists of rows
+        outFile = Path of the Parquet file to create
+        columnNames = List of column names
+        fieldTypes = List of field types of the columns (determines Parquet column types)
+
+    Return:
+        Returns number of rows written"""
+    types = {"int64": pyarrow.int64(), "int32": pyarrow.int32(), "int16": pyarrow.int16(),
+             "float64": pyarrow.float64(), "float32": pyarrow.float32(),
+             "timestamp": pyarrow.timestamp("ms"), "string": pyarrow.string()}
+    arrowTypes = [types[PARQUET_TYPES.get(fieldType, "string")] for fieldType in fieldTypes]
+    schema = pyarrow.schema([pyarrow.field(columnNames[i], arrowTypes[i]) for i in range(len(columnNames))])
+    count = 0
+    writer = pyarrow.parquet.ParquetWriter(outFile, schema, compression="snappy")
+    try:
+        for chunk in chunks:
+            columns = []
+            for i in range(len(columnNames)):
+                values = [row[i] for row in chunk]
+                if PARQUET_TYPES.get(fieldTypes[i]) is None:
+                    values = [None if value is None else str(value) for value in values]
+                columns.append(pyarrow.array(values, type=arrowTypes[i]))
+            writer.write_table(pyarrow.Table.from_arrays(columns, schema=schema))
+            count += len(chunk)
+    finally:
+        writer.close()
+    return count
+
+
+def exportTable(table, outPath, exportFormat=CSV_FORMAT, chunkSize=CHUNK_SIZE):
+    """Exports the coordinates and attribute fields of a feature class (or table) to a CSV or Parquet file.
+
+    Parameters:
+        table = Feature class or table to export
+        outPath = Path of the file to create, without extension
+        exportFormat = 'CSV' or 'Parquet' (CSV is written if 'pyarrow' is not available)
+        chunkSize = Number of rows read and written per chunk
+
+    Return:
+        Returns path of the file created"""
+    if exportFormat == PARQUET_FORMAT and pyarrow is None:
+        arcpy.AddWarning("The 'pyarrow' library is not available, exporting as CSV file instead of Parquet file...")
+        logging.info("Export: 'pyarrow' library not available, CSV format used instead of Parquet format")
+        exportFormat = CSV_FORMAT
+
+    cursorFields, columnNames, fieldTypes = exportFields(table)
+    chunks = readChunks(table, cursorFields, chunkSize)
+    with stageProfiler.stage("Export " + exportFormat) as record:
+        if exportFormat == PARQUET_FORMAT:
+            outFile = outPath + ".parquet"
+            count = writeParquet(chunks, outFile, columnNames, fieldTypes)
+        else:
+            outFile = outPath + ".csv"
+            count = writeCSV(chunks, outFile, columnNames)
+        record["rows"] = count
+    logging.info("Export: '%d' rows of '%s' exported to '%s' file", count, table, os.path.basename(outFile))
+    return outFile
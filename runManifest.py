@@ -0,0 +1,178 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#==============================================================================#
+# HISTORY                                                                      #
+# -------                                                                      #
+# Developed October 2026.                                                      #
+#==============================================================================#
+"""USAGE
+Module imported and used by the "temporalPersistence.py" script to checkpoint the
+stages of a temporal persistence run, so that a run interrupted part-way through
+(e.g. during the clustering stage, after every Union was completed) can be resumed
+from its first incomplete stage.
+
+SUMMARY
+A stage manifest (JSON file) is written in the folder of the analysis GDB and is
+updated as each stage of the run is completed (filter and dissolve of each source
+feature class, other sources split, points, persistence at each radius, join,
+merge, clustering and export). Each stage is recorded with a fingerprint of its
+inputs (source feature classes, parameters of the run and parameters of the stage)
+and a small state dictionary (values required by the subsequent stages).
+
+When the run is executed again with the same inputs, stages are skipped in their
+original order as long as they are recorded as completed with the same
+fingerprint. The first stage which is not recorded (or whose fingerprint differs)
+and every subsequent stage are executed again. The manifest is discarded if the
+source feature classes or run parameters have changed, and is deleted once the
+run is complete.
+
+INPUT
+- Run fingerprint (automated input): Fingerprint of the source feature classes
+(name, feature count and extent) and of the run parameters.
+
+OUTPUT
+- Stage manifest (automated output): '<source name>_manifest.json' file in the
+folder of the analysis GDB, with the run fingerprint and the list of completed
+stages (name, fingerprint, completion time and state).
+
+ADDITIONAL FUNCTIONS (explained in script below)
+- fingerprint
+- datasetFingerprint"""
+
+# Libraries
+# =========
+import os
+import json
+import hashlib
+import logging
+from datetime import datetime
+
+# arcpy is only required to fingerprint feature classes (the manifest itself does not require it)
+try:
+    import arcpy
+except ImportError:
+    arcpy = None
+
+
+def fingerprint(values):
+    """Returns the MD5 hexadecimal digest of a JSON serializable value (list, dictionary, string or number)."""
+    return hashlib.md5(json.dumps(values, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def datasetFingerprint(dataset):
+    """Returns the fingerprint values of a feature class or table (path, feature count and extent)."""
+    count = int(arcpy.GetCount_management(dataset).getOutput(0))
+    desc = arcpy.Describe(dataset)
+    extent = None
+    if hasattr(desc, "extent") and desc.extent is not None:
+        extent = [round(desc.extent.XMin, 6), round(desc.extent.YMin, 6), round(desc.extent.XMax, 6), round(desc.extent.YMax, 6)]
+    return [dataset, count, extent]
+
+
+class RunManifest(object):
+    """Ordered record of the completed stages of a run, saved as a JSON file after each completed stage."""
+
+    def __init__(self, manifestFile, runFingerprint, resume=True):
+        """Loads the stages of a previous run with the same fingerprint (if present and resume is True).
+
+        Parameters:
+            manifestFile = Path of the JSON manifest file
+            runFingerprint = Fingerprint of the inputs of the run (see fingerprint)
+            resume = Boolean value indicating whether completed stages of a previous run may be skipped
+
+        Return:
+            No return"""
+        self.manifestFile = manifestFile
+        self.runFingerprint = runFingerprint
+        self.stages = []
+        self.confirmed = 0
+        self.resuming = False
+        if resume and os.path.exists(manifestFile):
+            try:
+                with open(manifestFile, "r") as jsonFile:
+                    manifest = json.load(jsonFile)
+            except ValueError:
+                manifest = {}
+            if manifest.get("runFingerprint") == runFingerprint:
+                self.stages = manifest.get("stages", [])
+                self.resuming = self.stages != []
+                logging.info("Run Manifest: '%d' completed stages recorded in '%s'", len(self.stages), manifestFile)
+            else:
+                logging.info("Run Manifest: Inputs of '%s' have changed, previous stages discarded", manifestFile)
+
+    def stageFingerprint(self, name, params):
+        """Returns the fingerprint of a stage (run fingerprint, stage name and stage parameters)."""
+        return fingerprint([self.runFingerprint, name, params])
+
+    def isComplete(self, name, params=None):
+        """Determines whether a stage was completed by a previous run and may be skipped.
+
+        Stages must be checked in the order in which they are completed. A stage is
+        skipped only if every stage checked before it was also skipped.
+
+        Parameters:
+            name = Name of the stage
+            params = List of parameters of the stage (included in its fingerprint)
+
+        Return:
+            Returns True if the stage is the next stage recorded in the manifest, with the same fingerprint"""
+        params = list(params or [])
+        if not self.resuming:
+            return False
+        if self.confirmed < len(self.stages):
+            entry = self.stages[self.confirmed]
+            if entry["stage"] == name and entry["fingerprint"] == self.stageFingerprint(name, params):
+                self.confirmed += 1
+                if arcpy is not None:
+                    arcpy.AddMessage("Stage '" + name + "' completed by previous run, skipping...")
+                logging.info("Run Manifest: Stage '%s' %s completed by previous run, skipped", name, str(params))
+                return True
+        self.restart()
+        return False
+
+    def isRecorded(self, name):
+        """Returns True if a stage with the given name is recorded in the manifest (regardless of order and fingerprint)."""
+        return any(entry["stage"] == name for entry in self.stages)
+
+    def restart(self):
+        """Discards the stages which were not skipped, every subsequent stage is executed."""
+        if self.resuming:
+            logging.info("Run Manifest: Resuming run after '%d' completed stages", self.confirmed)
+        self.resuming = False
+        self.stages = self.stages[:self.confirmed]
+
+    def state(self, name):
+        """Returns the state dictionary recorded with a completed stage (empty dictionary if not recorded)."""
+        for entry in self.stages:
+            if entry["stage"] == name:
+                return entry["state"]
+        return {}
+
+    def complete(self, name, params=None, state=None):
+        """Records a completed stage and writes the manifest file.
+
+        Parameters:
+            name = Name of the stage
+            params = List of parameters of the stage (included in its fingerprint)
+            state = Dictionary of JSON serializable values required by subsequent stages (optional)
+
+        Return:
+            No return"""
+        params = list(params or [])
+        self.restart()
+        self.stages.append({"stage": name, "params": params, "fingerprint": self.stageFingerprint(name, params),
+                            "completed": datetime.now().strftime("%Y-%m-%d %H:%M:%S"), "state": state or {}})
+        self.confirmed = len(self.stages)
+        tempFile = self.manifestFile + ".tmp"
+        with open(tempFile, "w") as jsonFile:
+            json.dump({"runFingerprint": self.runFingerprint, "stages": self.stages}, jsonFile, indent=2)
+        if os.path.exists(self.manifestFile):
+            os.remove(self.manifestFile)
+        os.rename(tempFile, self.manifestFile)
+
+    def remove(self):
+        """Deletes the manifest file (once the run is complete)."""
+        if os.path.exists(self.manifestFile):
+            os.remove(self.manifestFile)
+            logging.info("Run Manifest: '%s' deleted, run complete", self.manifestFile)
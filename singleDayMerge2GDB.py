@@ -30,6 +30,7 @@ placed in the Yearly Dark Targets geodatabase for the specified year."""
 import arcpy
 import os
 import logging
+import stageProfiler
 
 
 class singleDayMerge2GDB(object):
@@ -68,6 +69,7 @@ class singleDayMerge2GDB(object):
         parameter.  This method is called after internal validation."""
         return
 
+    @stageProfiler.profiledExecute
     def execute(self, parameters, messages):
         """The source code of the tool."""
         # Define variables from parameters
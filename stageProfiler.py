@@ -0,0 +1,224 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#==============================================================================#
+# HISTORY                                                                      #
+# -------                                                                      #
+# Developed October 2026.                                                      #
+#==============================================================================#
+"""USAGE
+Module imported by the toolbox scripts to measure the duration of each tool and
+of the main stages (geoprocessing calls and cursor iterations) within each tool:
+
+    @stageProfiler.profiledExecute
+    def execute(self, parameters, messages):
+        ...
+        with stageProfiler.stage("Dissolve") as record:
+            arcpy.Dissolve_management(...)
+            record["rows"] = numRows
+
+SUMMARY
+Records the wall time, CPU time (user and system), number of rows processed (when
+specified) and memory of every stage: the increase of the peak resident set size of
+the process over the stage (memory used by the stage beyond the previous peak of the
+process, 0 if the stage stays below it) and the peak resident set size of the
+process at the end of the stage (since the start of the process, including memory
+used by earlier stages and tools).
+A tool executed by another tool (e.g. "temporalPersistence.py" executed by
+"temporalPersisDay.py") is recorded as a stage of the calling tool. Stages outside
+of a profiled tool execution are not recorded.
+
+When the outermost tool execution is complete, the profile is written as a JSON
+file in the 'logs' folder of the tool (folder of the log file configured with
+logging.basicConfig). A Chrome trace file (viewable in chrome://tracing or
+Perfetto) is also written if CHROME_TRACE is set to True, or if the
+'GEM2_CHROME_TRACE' environment variable is set to '1'.
+
+INPUT
+- Stages (automated input): Stage names and number of rows processed, recorded by
+the toolbox scripts.
+
+OUTPUT
+- Profile (automated output): 'profile_<tool>_<YYYYMMDD_HHMMSS>.json' file with the
+tool name, start time, and list of stages (name, nesting depth, start offset,
+wall time, CPU time, rows, increase of the process peak memory over the stage in
+MB ('peakGrowthMB') and process peak memory at the end of the stage in MB
+('processPeakMB')).
+
+- Chrome trace (optional output): 'profile_<tool>_<YYYYMMDD_HHMMSS>.trace.json' file.
+
+ADDITIONAL FUNCTIONS (explained in script below)
+- peakMemory
+- cpuTime
+- stage
+- profiledExecute
+- logFolder
+- writeProfile"""
+
+# Libraries
+# =========
+import os
+import sys
+import json
+import time
+import logging
+from datetime import datetime
+from contextlib import contextmanager
+from functools import wraps
+
+# Chrome trace output (also enabled with the GEM2_CHROME_TRACE environment variable)
+CHROME_TRACE = False
+
+# Profile of the tool execution in progress (None when no tool is profiled)
+activeRun = None
+
+
+def peakMemory():
+    """Returns the peak resident set size (MB) of the process since its start, or None if it cannot be determined."""
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS and in kilobytes on Linux
+        if sys.platform == "darwin":
+            return peak / 1048576.0
+        return peak / 1024.0
+    except ImportError:
+        pass
+    try:
+        import psutil
+        memoryInfo = psutil.Process().memory_info()
+        return getattr(memoryInfo, "peak_wset", memoryInfo.rss) / 1048576.0
+    except ImportError:
+        pass
+    if sys.platform == "win32":
+        import ctypes
+        from ctypes import wintypes
+
+        class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+            _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD),
+                        ("PeakWorkingSetSize", ctypes.c_size_t), ("WorkingSetSize", ctypes.c_size_t),
+                        ("QuotaPeakPagedPoolUsage", ctypes.c_size_t), ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                        ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t), ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                        ("PagefileUsage", ctypes.c_size_t), ("PeakPagefileUsage", ctypes.c_size_t)]
+        counters = PROCESS_MEMORY_COUNTERS()
+        counters.cb = ctypes.sizeof(counters)
+        process = ctypes.windll.kernel32.GetCurrentProcess()
+        if ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+            return counters.PeakWorkingSetSize / 1048576.0
+    return None
+
+
+def cpuTime():
+    """Returns the CPU time (user and system, in seconds) used by the process."""
+    times = os.times()
+    return times[0] + times[1]
+
+
+@contextmanager
+def stage(name, rows=None):
+    """Context manager recording a stage of the tool execution in progress.
+
+    Parameters:
+        name = Name of the stage (e.g. geoprocessing tool name)
+        rows = Number of rows processed by the stage (can also be set on the yielded record)
+
+    Return:
+        Yields the stage record (dictionary), whose 'rows' value may be updated within the stage"""
+    record = {"name": name, "rows": rows}
+    run = activeRun
+    if run is None:
+        yield record
+        return
+
+    record["depth"] = len(run["stack"])
+    record["start"] = time.time() - run["startTime"]
+    run["stack"].append(name)
+    run["stages"].append(record)
+    startWall = time.time()
+    startCPU = cpuTime()
+    startPeak = peakMemory()
+    try:
+        yield record
+    finally:
+        record["wall"] = round(time.time() - startWall, 4)
+        record["cpu"] = round(cpuTime() - startCPU, 4)
+        peak = peakMemory()
+        # Process peak only increases when the stage exceeds the memory used so far (clamped, current RSS if no peak available)
+        record["peakGrowthMB"] = None if peak is None or startPeak is None else round(max(0.0, peak - startPeak), 1)
+        record["processPeakMB"] = None if peak is None else round(peak, 1)
+        record["start"] = round(record["start"], 4)
+        run["stack"].pop()
+
+
+def profiledExecute(function):
+    """Decorator of tool execute methods, recording the tool execution as a run (or as a stage of the calling tool).
+
+    Parameters:
+        function = execute method of a tool class
+
+    Return:
+        Returns the decorated method. The profile is written once the outermost tool execution is complete."""
+    @wraps(function)
+    def execute(self, *args, **kwargs):
+        global activeRun
+        toolName = self.__class__.__name__
+        if activeRun is not None:
+            with stage(toolName):
+                return function(self, *args, **kwargs)
+
+        activeRun = {"tool": toolName, "startTime": time.time(), "started": datetime.now(), "stack": [], "stages": []}
+        try:
+            with stage(toolName):
+                return function(self, *args, **kwargs)
+        finally:
+            run = activeRun
+            activeRun = None
+            try:
+                writeProfile(run)
+            except (IOError, OSError) as e:
+                logging.info("Stage Profiler: Profile could not be written (%s)", str(e))
+    return execute
+
+
+def logFolder():
+    """Returns the folder of the log file configured with logging.basicConfig, or None if no log file is configured."""
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, logging.FileHandler):
+            return os.path.dirname(handler.baseFilename)
+    return None
+
+
+def writeProfile(run):
+    """Writes the profile of a tool execution as a JSON file (and Chrome trace file if enabled) in the log folder.
+
+    Parameters:
+        run = Profile of the tool execution (recorded by profiledExecute)
+
+    Return:
+        Returns path of the JSON profile file, or None if no log folder is configured"""
+    folder = logFolder()
+    if folder is None:
+        return None
+    baseName = "profile_" + run["tool"] + "_" + run["started"].strftime("%Y%m%d_%H%M%S")
+    stages = []
+    for record in run["stages"]:
+        stages.append(dict((key, record.get(key)) for key in ("name", "depth", "start", "wall", "cpu", "rows", "peakGrowthMB", "processPeakMB")))
+    profile = {"tool": run["tool"], "started": run["started"].strftime("%Y-%m-%d %H:%M:%S"),
+               "python": sys.version.split()[0], "stages": stages}
+    profileFile = os.path.join(folder, baseName + ".json")
+    with open(profileFile, "w") as jsonFile:
+        json.dump(profile, jsonFile, indent=2)
+    logging.info("Stage Profiler: Profile of '%s' written to '%s'", run["tool"], profileFile)
+
+    # Chrome trace of complete events (timestamps and durations in microseconds)
+    if CHROME_TRACE or os.environ.get("GEM2_CHROME_TRACE") == "1":
+        events = []
+        for record in stages:
+            args = {"cpu": record["cpu"], "rows": record["rows"], "peakGrowthMB": record["peakGrowthMB"], "processPeakMB": record["processPeakMB"]}
+            events.append({"name": record["name"], "ph": "X", "pid": 1, "tid": 1,
+                           "ts": int(record["start"] * 1e6), "dur": int((record["wall"] or 0) * 1e6), "args": args})
+        traceFile = os.path.join(folder, baseName + ".trace.json")
+        with open(traceFile, "w") as jsonFile:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, jsonFile)
+        logging.info("Stage Profiler: Chrome trace of '%s' written to '%s'", run["tool"], traceFile)
+    return profileFile
@@ -0,0 +1,158 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#==============================================================================#
+# HISTORY                                                                      #
+# -------                                                                      #
+# Developed October 2026.                                                      #
+#==============================================================================#
+"""USAGE
+Module imported and used by the "temporalPersistence.py" script (direct
+intersection analysis with the "Spatial Index" persistence engine), the
+"parseOverlap.py" script and the "overlapResolver.py" module to find the
+pairs of polygons whose envelopes (bounding boxes) overlap, so that exact
+geometric tests are only performed on candidate pairs. Does not require arcpy.
+
+SUMMARY
+Sort-Tile-Recursive (STR) packed R-tree of envelopes. The envelopes are sorted
+into vertical slabs by the x coordinate of their centre, and within each slab by
+the y coordinate of their centre, then grouped into leaf nodes of a fixed
+capacity. The nodes of each level are packed the same way into the nodes of the
+next level, until a single level of nodes remains at the root.
+
+The tree is queried with many envelopes at once: the (query, node) pairs whose
+envelopes overlap are expanded level by level into the pairs of the children of
+each node, so that only the branches of the tree overlapping a query envelope
+are visited, without a Python loop over the query envelopes.
+
+INPUT
+- Envelopes (automated input): Arrays of minimum and maximum x and y coordinates.
+
+OUTPUT
+- Candidate pairs (automated output): Arrays of query and item indices of the
+overlapping envelopes (envelopes touching at their boundary are included).
+
+ADDITIONAL FUNCTIONS (explained in script below)
+- strOrder
+- overlaps
+- STRTree"""
+
+# Libraries
+# =========
+import numpy as np
+
+# Maximum number of children of each node of the tree
+NODE_CAPACITY = 10
+
+
+def strOrder(boxes, capacity):
+    """Sorts envelopes in Sort-Tile-Recursive order (vertical slabs by x, then by y within each slab).
+
+    Parameters:
+        boxes = Array of envelopes (N x 4: xmin, ymin, xmax, ymax)
+        capacity = Number of envelopes grouped in each node
+
+    Return:
+        Returns array of indices of the envelopes in STR order"""
+    numBoxes = len(boxes)
+    numNodes = int(np.ceil(numBoxes / float(capacity)))
+    numSlabs = max(int(np.ceil(np.sqrt(numNodes))), 1)
+    slabSize = numSlabs * capacity
+    centreX = (boxes[:, 0] + boxes[:, 2]) / 2.0
+    centreY = (boxes[:, 1] + boxes[:, 3]) / 2.0
+    slab = np.empty(numBoxes, dtype=np.int64)
+    slab[np.argsort(centreX, kind="mergesort")] = np.arange(numBoxes) // slabSize
+    return np.lexsort((centreY, slab))
+
+
+def overlaps(queries, boxes, queryIdx, boxIdx):
+    """Reduces pairs of query envelopes and envelopes to those overlapping or touching each other.
+
+    Parameters:
+        queries = Tuple of query envelope coordinate arrays (xmin, ymin, xmax, ymax)
+        boxes = Tuple of envelope coordinate arrays (xmin, ymin, xmax, ymax)
+        queryIdx = Array of query index of each pair
+        boxIdx = Array of envelope index of each pair
+
+    Return:
+        Returns the two arrays reduced to the overlapping pairs (each coordinate is
+        compared on the pairs remaining after the previous comparison)"""
+    for queryCol, boxCol, sign in ((0, 2, 1), (2, 0, -1), (1, 3, 1), (3, 1, -1)):
+        keep = sign * queries[queryCol][queryIdx] <= sign * boxes[boxCol][boxIdx]
+        queryIdx = queryIdx[keep]
+        boxIdx = boxIdx[keep]
+    return queryIdx, boxIdx
+
+
+class STRTree(object):
+    """Sort-Tile-Recursive packed R-tree of envelopes, queried with arrays of envelopes.
+
+    Envelopes with NaN coordinates (e.g. empty polygons) never overlap any envelope."""
+    def __init__(self, xmin, ymin, xmax, ymax, capacity=NODE_CAPACITY):
+        """Packs the envelopes into the levels of the tree.
+
+        Parameters:
+            xmin, ymin, xmax, ymax = Arrays of envelope coordinates of the items
+            capacity = Maximum number of children of each node"""
+        boxes = np.column_stack([xmin, ymin, xmax, ymax]).astype(np.float64).reshape(-1, 4)
+        self.capacity = capacity
+
+        # Items sorted in STR order (level 0), and nodes of each level covering a range of the level below
+        # (coordinates of each level held as separate contiguous arrays)
+        self.items = strOrder(boxes, capacity)
+        boxes = boxes[self.items]
+        self.levels = [(tuple(boxes[:, i].copy() for i in range(4)), None, None)]
+        while len(boxes) > capacity:
+            start = np.arange(0, len(boxes), capacity)
+            end = np.minimum(start + capacity, len(boxes))
+            with np.errstate(invalid="ignore"):
+                nodes = np.column_stack([np.fmin.reduceat(boxes[:, 0], start), np.fmin.reduceat(boxes[:, 1], start),
+                                         np.fmax.reduceat(boxes[:, 2], start), np.fmax.reduceat(boxes[:, 3], start)])
+            order = strOrder(nodes, capacity)
+            boxes = nodes[order]
+            self.levels.append((tuple(boxes[:, i].copy() for i in range(4)), start[order], end[order]))
+
+    def __len__(self):
+        """Returns number of items of the tree."""
+        return len(self.items)
+
+    def queryBoxes(self, xmin, ymin, xmax, ymax):
+        """Finds the items whose envelopes overlap each query envelope.
+
+        Parameters:
+            xmin, ymin, xmax, ymax = Arrays of query envelope coordinates
+
+        Return:
+            Returns two arrays with one value per overlapping (query, item) pair: query
+            index and item index"""
+        queries = tuple(np.asarray(col, dtype=np.float64).ravel() for col in (xmin, ymin, xmax, ymax))
+        top = len(self.levels) - 1
+        numTop = len(self.levels[top][0][0])
+
+        # Pairs of every query with every node of the root level
+        queryIdx = np.repeat(np.arange(len(queries[0])), numTop)
+        nodeIdx = np.tile(np.arange(numTop), len(queries[0]))
+        with np.errstate(invalid="ignore"):
+            queryIdx, nodeIdx = overlaps(queries, self.levels[top][0], queryIdx, nodeIdx)
+
+            # Expand overlapping (query, node) pairs into (query, child) pairs down to the items
+            for level in range(top, 0, -1):
+                boxes, start, end = self.levels[level]
+                counts = end[nodeIdx] - start[nodeIdx]
+                offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+                queryIdx = np.repeat(queryIdx, counts)
+                nodeIdx = np.repeat(start[nodeIdx], counts) + offsets
+                queryIdx, nodeIdx = overlaps(queries, self.levels[level - 1][0], queryIdx, nodeIdx)
+        return queryIdx, self.items[nodeIdx]
+
+    def queryPairs(self):
+        """Finds the pairs of items whose envelopes overlap each other.
+
+        Return:
+            Returns two arrays with one value per pair of overlapping items (each pair
+            once, first item index smaller than the second)"""
+        # Items queried in STR order (neighbouring queries visit the same nodes)
+        first, second = self.queryBoxes(*self.levels[0][0])
+        first = self.items[first]
+        once = first < second
+        return first[once], second[once]
@@ -31,6 +31,17 @@ feature classes for that year.
 with which the spatial portion of the analysis will be performed (in meters).
 Any number of distance values may be entered.
 
+- Persistence Engine (default user input): Method used to calculate persistence,
+ either "Buffer and Union" (buffer and Union geoprocessing) or "Spatial Index"
+ (neighbour queries between dark target centroids). See 'temporalPersistence.py'.
+
+- Worker Processes (default user input): Number of processes among which the
+ time slices are distributed with the "Buffer and Union" engine (1 to process
+ the time slices one after another). See 'persistencePool.py'.
+
+- Results Export Format (default user input): Format of the exported attribute table,
+ either "CSV" or "Parquet" (columnar and compressed, requires the 'pyarrow' library).
+
 OUTPUT
 - Consolidated feature class (automated output): Final output feature class which
 consolidates all dark targets from every acquisition day together in a single
@@ -44,11 +55,14 @@ import os
 from datetime import datetime
 import logging
 import sys
+import stageProfiler
 
 # Reload steps required to refresh memory if Catalog is open when changes are made
 import temporalPersistence                      # get module reference for reload
 reload(temporalPersistence)                     # reload step 1
 from temporalPersistence import temporalPersistence # reload step 2
+from temporalPersistence import BUFFER_ENGINE, INDEX_ENGINE
+import resultExport
 
 
 class temporalPersisDay(object):
@@ -96,7 +110,38 @@ class temporalPersisDay(object):
 
         params3.columns = [["GPLong", "Distances at which persistence will be calculated:"]]
 
-        params = [params0, params1, params2, params3]
+        params4 = arcpy.Parameter(
+            displayName="Input: Persistence Engine",
+            name="persisEngine",
+            datatype="GPString",
+            parameterType="Optional",
+            direction="Input")
+
+        params4.filter.type = "ValueList"
+        params4.filter.list = [BUFFER_ENGINE, INDEX_ENGINE]
+        params4.value = BUFFER_ENGINE
+
+        params5 = arcpy.Parameter(
+            displayName="Output: Results Export Format",
+            name="exportFormat",
+            datatype="GPString",
+            parameterType="Optional",
+            direction="Input")
+
+        params5.filter.type = "ValueList"
+        params5.filter.list = [resultExport.CSV_FORMAT, resultExport.PARQUET_FORMAT]
+        params5.value = resultExport.CSV_FORMAT
+
+        params6 = arcpy.Parameter(
+            displayName="Input: Worker Processes (Buffer and Union)",
+            name="workerCount",
+            datatype="GPLong",
+            parameterType="Optional",
+            direction="Input")
+
+        params6.value = 1
+
+        params = [params0, params1, params2, params3, params4, params5, params6]
 
         return params
 
@@ -115,6 +160,7 @@ class temporalPersisDay(object):
         parameter.  This method is called after internal validation."""
         return
 
+    @stageProfiler.profiledExecute
     def execute(self, parameters, messages):
         """The source code of the tool."""
 ##        # Set log configuration
@@ -136,6 +182,12 @@ class temporalPersisDay(object):
 
         temporalPersisParams[3] = parameters[3]
 
+        temporalPersisParams[5] = parameters[4]
+
+        temporalPersisParams[6] = parameters[5]
+
+        temporalPersisParams[7] = parameters[6]
+
         temporalPersis.execute(temporalPersisParams, None)
 
         return
\ No newline at end of file
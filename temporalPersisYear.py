@@ -40,6 +40,17 @@ A shapefile or feature class of dark targets produced outside of this toolbox to
   column for the other source must be identified, along with an attribute field
   which indicates the year of the dark target.
 
+- Persistence Engine (default user input): Method used to calculate persistence,
+ either "Buffer and Union" (buffer and Union geoprocessing) or "Spatial Index"
+ (neighbour queries between dark target centroids). See 'temporalPersistence.py'.
+
+- Worker Processes (default user input): Number of processes among which the
+ time slices are distributed with the "Buffer and Union" engine (1 to process
+ the time slices one after another). See 'persistencePool.py'.
+
+- Results Export Format (default user input): Format of the exported attribute table,
+ either "CSV" or "Parquet" (columnar and compressed, requires the 'pyarrow' library).
+
 OUTPUT
 - Consolidated feature class (automated output): Final output feature class which
 consolidates all dark targets from every acquisition year together in a single
@@ -54,11 +65,14 @@ import os
 from datetime import datetime
 import logging
 import sys
+import stageProfiler
 
 # Reload steps required to refresh memory if Catalog is open when changes are made
 import temporalPersistence                      # get module reference for reload
 reload(temporalPersistence)                     # reload step 1
 from temporalPersistence import temporalPersistence # reload step 2
+from temporalPersistence import BUFFER_ENGINE, INDEX_ENGINE
+import resultExport
 
 
 class temporalPersisYear(object):
@@ -115,7 +129,38 @@ class temporalPersisYear(object):
         params4.filters[2].type = "ValueList"
         params4.filters[2].list = [" "]
 
-        params = [params0, params1, params2, params3, params4]
+        params5 = arcpy.Parameter(
+            displayName="Input: Persistence Engine",
+            name="persisEngine",
+            datatype="GPString",
+            parameterType="Optional",
+            direction="Input")
+
+        params5.filter.type = "ValueList"
+        params5.filter.list = [BUFFER_ENGINE, INDEX_ENGINE]
+        params5.value = BUFFER_ENGINE
+
+        params6 = arcpy.Parameter(
+            displayName="Output: Results Export Format",
+            name="exportFormat",
+            datatype="GPString",
+            parameterType="Optional",
+            direction="Input")
+
+        params6.filter.type = "ValueList"
+        params6.filter.list = [resultExport.CSV_FORMAT, resultExport.PARQUET_FORMAT]
+        params6.value = resultExport.CSV_FORMAT
+
+        params7 = arcpy.Parameter(
+            displayName="Input: Worker Processes (Buffer and Union)",
+            name="workerCount",
+            datatype="GPLong",
+            parameterType="Optional",
+            direction="Input")
+
+        params7.value = 1
+
+        params = [params0, params1, params2, params3, params4, params5, params6, params7]
 
         return params
 
@@ -154,6 +199,7 @@ class temporalPersisYear(object):
         parameter.  This method is called after internal validation."""
         return
 
+    @stageProfiler.profiledExecute
     def execute(self, parameters, messages):
         """The source code of the tool."""
 ##        # Set log configuration
@@ -177,6 +223,12 @@ class temporalPersisYear(object):
 
         temporalPersisParams[4] = parameters[4]
 
+        temporalPersisParams[5] = parameters[5]
+
+        temporalPersisParams[6] = parameters[6]
+
+        temporalPersisParams[7] = parameters[7]
+
         temporalPersis.execute(temporalPersisParams, None)
 
         return
\ No newline at end of file
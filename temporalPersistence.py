@@ -38,6 +38,47 @@ A shapefile or feature class of dark targets produced outside of this toolbox to
   which indicates the year of the dark target. This is only used for a year to year
   analysis.
 
+- Persistence Engine (default user input): Method used to calculate persistence.
+ "Buffer and Union" buffers the centroid of each dark target and performs a Union
+ with the dark targets of every other time. "Spatial Index" is a centroid-distance
+ approximation whose persistence and weight values are not comparable with those
+ of "Buffer and Union": the persistence value is the number of other times with a
+ dark target centroid within the persistence radius, and the weight value is 1 plus
+ the number of such centroids (dark targets whose polygon reaches the buffer but
+ whose centroid is beyond the radius are not counted). It loads all dark targets
+ once into an in-memory store (see 'darkTargetStore.py'), in which the attribute
+ criteria are evaluated on the loaded attribute values (see 'attributeCriteria.py')
+ and dark targets are dissolved by targetID, and counts the dark targets from other
+ times located within the persistence radius of each centroid with a grid index
+ (see 'persistenceEngine.py'). Distances between centroids are geodesic, as the
+ GEODESIC buffers of "Buffer and Union", with a planar prefilter of the candidate
+ pairs in NAD 1983 Canada Atlas Lambert (see 'geodesicKernel.py'). Neighbouring dark targets
+ are found in a single pass at the largest persistence radius, and every smaller
+ radius is answered from the same pairs sorted by distance. Dissolved centroids
+ and neighbour pairs are cached beside the analysis GDB, keyed by the content of
+ the selected dark targets and the radius, and reused by subsequent analyses
+ (see 'persistenceCache.py'). No interim filter,
+ point, buffer, union, dissolve or statistics outputs are written. When new days or
+ years are added to a previous analysis with unchanged time slices and radii, the
+ analysis is incremental: the neighbour pairs of the previous analysis are read from
+ its edge table and only pairs involving the new dark targets are searched (see
+ 'edgeTable.py'). The new dark targets are appended to the previous consolidated
+ feature class, and only the persistence, weight and cluster ID values of the
+ dark targets affected by the new dark targets are updated. For the direct
+ intersection analysis (radius of 0 meters), only the dissolved dark targets of
+ different times with overlapping extents (found with an STR tree, see
+ 'strTree.py') are tested for intersection and split into the areas of the Union,
+ giving the same values as "Buffer and Union" at a radius of 0 meters.
+
+- Worker Processes (default user input): Number of processes among which the Union,
+ Dissolve and Statistics of each time slice are distributed with the "Buffer and
+ Union" engine (1 to process the time slices one after another). See
+ 'persistencePool.py'.
+
+- Results Export Format (default user input): Format of the exported attribute table
+ of the consolidated feature class, either "CSV" or "Parquet" (columnar and
+ compressed, requires the 'pyarrow' library). See 'resultExport.py'.
+
 OUTPUT
 - Persistence Field (automated output): Attribute field created as 'pers*' for a
 day-to-day analysis within the year and 'Ypers*' for a year-to-year overall analysis.
@@ -77,15 +118,38 @@ meters)
 
 - Consolidated feature class (automated output): Final output feature class which
 consolidates all the input dark targets together in a single output feature class,
-with their associated persistence values.
+with their associated persistence values. The dark targets of every input feature
+class are written once, with standardized attribute fields and persistence values
+(see 'darkTargetStore.py'), instead of joining, exporting, renaming fields and
+merging each feature class.
+
+- Stage manifest (automated output): '<source name>_manifest.json' file in the
+folder of the analysis GDB, recording each completed stage of the analysis with a
+fingerprint of its inputs (see 'runManifest.py'). If the analysis is interrupted,
+executing it again with the same inputs skips the completed stages and resumes
+from the first incomplete stage (interim outputs of the incomplete stage are
+deleted first). The manifest is deleted once the analysis is complete. With the
+"Spatial Index" engine, dark targets are held in memory and the analysis is always
+executed from the first stage.
+
+- Adjacency matrices (automated output, "Spatial Index" engine): '<source
+name>_adjacency_<radius>.npz' file for each persistence radius in the folder of
+the analysis GDB, with the sparse matrix of dark targets from different times
+within the radius of each other (see 'adjacencyMatrix.py'). The persistence,
+weight and cluster ID values of the radius are derived from its matrix, and a
+subsequent analysis of the same dark targets reuses the matrix of the largest
+radius instead of searching neighbouring dark targets again.
 
 ADDITIONAL FUNCTIONS (explained in script below)
 - calcPersis
-- cleanWorkspace
-- adapted from ESRI's Join_Field.py functions
-    - joindataGen
-    - percentile
-    - join_field"""
+- calcPersisIndex
+- calcPersisIntersect
+- overlapAreas
+- loadPersisStats
+- mergeIncremental
+- maxClusterID
+- deleteOutputs
+- cleanWorkspace"""
 
 # Libraries
 # =========
@@ -94,6 +158,41 @@ import os
 from datetime import datetime
 import logging
 import sys
+import numpy as np
+import stageProfiler
+
+# Reload steps required to refresh memory if Catalog is open when changes are made
+import hashJoin                             # get module reference for reload
+reload(hashJoin)                            # reload step 1
+import resultExport                         # get module reference for reload
+reload(resultExport)                        # reload step 1
+import persistenceEngine                    # get module reference for reload
+reload(persistenceEngine)                   # reload step 1
+import geodesicKernel                       # get module reference for reload
+reload(geodesicKernel)                      # reload step 1
+import centroidEngine                       # get module reference for reload
+reload(centroidEngine)                      # reload step 1
+import darkTargetStore                      # get module reference for reload
+reload(darkTargetStore)                     # reload step 1
+import runManifest                          # get module reference for reload
+reload(runManifest)                         # reload step 1
+import persistenceCache                     # get module reference for reload
+reload(persistenceCache)                    # reload step 1
+import edgeTable                            # get module reference for reload
+reload(edgeTable)                           # reload step 1
+import persistencePool                      # get module reference for reload
+reload(persistencePool)                     # reload step 1
+import adjacencyMatrix                      # get module reference for reload
+reload(adjacencyMatrix)                     # reload step 1
+import strTree                              # get module reference for reload
+reload(strTree)                             # reload step 1
+
+# Persistence engine parameter values
+BUFFER_ENGINE = "Buffer and Union"
+INDEX_ENGINE = "Spatial Index"
+
+# Name suffixes of interim feature classes (left in the workspace by an interrupted run, not source feature classes)
+INTERIM_SUFFIXES = ("Copy", "_filter", "_byTargetID", "_points", "_buffer", "_Union", "_dissolve", "_merge", "_persis")
 
 
 class temporalPersistence(object):
@@ -154,7 +253,38 @@ class temporalPersistence(object):
         params4.filters[2].type = "ValueList"
         params4.filters[2].list = [" "]
 
-        params = [params0, params1, params2, params3, params4]
+        params5 = arcpy.Parameter(
+            displayName="Input: Persistence Engine",
+            name="persisEngine",
+            datatype="GPString",
+            parameterType="Optional",
+            direction="Input")
+
+        params5.filter.type = "ValueList"
+        params5.filter.list = [BUFFER_ENGINE, INDEX_ENGINE]
+        params5.value = BUFFER_ENGINE
+
+        params6 = arcpy.Parameter(
+            displayName="Output: Results Export Format",
+            name="exportFormat",
+            datatype="GPString",
+            parameterType="Optional",
+            direction="Input")
+
+        params6.filter.type = "ValueList"
+        params6.filter.list = [resultExport.CSV_FORMAT, resultExport.PARQUET_FORMAT]
+        params6.value = resultExport.CSV_FORMAT
+
+        params7 = arcpy.Parameter(
+            displayName="Input: Worker Processes (Buffer and Union)",
+            name="workerCount",
+            datatype="GPLong",
+            parameterType="Optional",
+            direction="Input")
+
+        params7.value = 1
+
+        params = [params0, params1, params2, params3, params4, params5, params6, params7]
 
         return params
 
@@ -193,6 +323,7 @@ class temporalPersistence(object):
         parameter.  This method is called after internal validation."""
         return
 
+    @stageProfiler.profiledExecute
     def execute(self, parameters, messages):
         """The source code of the tool."""
         # Define variables from parameters
@@ -203,6 +334,15 @@ class temporalPersistence(object):
         otherSources = parameters[4].valueAsText
         if otherSources is not None:
             otherSourceList = parameters[4].valueAsText.split(';')
+        persisEngine = parameters[5].valueAsText
+        if persisEngine is None:
+            persisEngine = BUFFER_ENGINE
+        exportFormat = parameters[6].valueAsText
+        if exportFormat is None:
+            exportFormat = resultExport.CSV_FORMAT
+        workerCount = 1
+        if len(parameters) > 7 and parameters[7].value is not None:
+            workerCount = max(1, int(parameters[7].value))
 
         # Determine analysis GDB
         sourceDesc = arcpy.Describe(source)
@@ -234,6 +374,8 @@ class temporalPersistence(object):
         fcList = arcpy.ListFeatureClasses("RS2_*")
         sourceList = []
         for fc in fcList:
+            if fc.endswith(INTERIM_SUFFIXES):
+                continue
             fcPath = os.path.join(source, fc)
             sourceList.append(fcPath)
         arcpy.AddMessage("Workspace contains " + str(len(sourceList)) + " layers to analyze.")
@@ -271,21 +413,41 @@ class temporalPersistence(object):
 
         # More than one feature class in source workspace, execute temporal analysis
         else:
+            # Stage manifest of the run, stages completed by a previous interrupted run with the same inputs are skipped (see 'runManifest.py')
+            # The spatial index engine holds dark targets in memory and is always executed from the first stage
+            runInputs = [runManifest.datasetFingerprint(fc) for fc in sourceList]
+            if otherSources is not None:
+                runInputs.extend([runManifest.datasetFingerprint(fc) for fc in sorted(sourceFiles)])
+            runInputs.extend([keepExpression, rejectExpression, otherSources, persisEngine])
+            manifestFile = os.path.join(os.path.dirname(analysisGDB), os.path.splitext(os.path.basename(source))[0] + "_manifest.json")
+            manifest = runManifest.RunManifest(manifestFile, runManifest.fingerprint(runInputs), persisEngine != INDEX_ENGINE)
+
+            # Targets of other sources are appended to the filter outputs, which are only reused if the other sources stage was also completed
+            if otherSources is not None and yrPersisBool and not manifest.isRecorded("otherSources"):
+                manifest.restart()
+
             # ======================================================= #
             # Apply filter criteria and dissolve polygons by targetID #
             # ======================================================= #
 
+            # Dark targets are loaded once into an in-memory store for the spatial index engine (no interim feature classes)
+            if persisEngine == INDEX_ENGINE:
+                store = darkTargetStore.DarkTargetStore()
+
             # Iterate through source feature classes to apply filter criteria and dissolve dark target polygons by targetID
             for fc in sourceList:
                 arcpy.AddMessage("\nProcessing " + fc + "...")
                 logging.info("Processing '%s' feature class for filter criteria and targetID dissolve", fc)
                 fcName = fc.split('\\')[len(fc.split('\\'))-1]
+                if manifest.isComplete("filter", [fcName]):
+                    continue
 
                 # Add total layer count field and value
                 arcpy.AddMessage("Adding total layer count field and values...")
                 if yrPersisBool:
-                    arcpy.AddField_management(fc, "totalYrLyr", "SHORT")
-                    logging.info("Add Field: '%s' field added", 'totalYrLyr')
+                    if arcpy.ListFields(fc, "totalYrLyr") == []:
+                        arcpy.AddField_management(fc, "totalYrLyr", "SHORT")
+                        logging.info("Add Field: '%s' field added", 'totalYrLyr')
                     with arcpy.da.UpdateCursor(fc, "totalYrLyr") as cursor:
                         for row in cursor:
                             row[0] = len(sourceList)
@@ -294,14 +456,28 @@ class temporalPersistence(object):
                             cursor.updateRow(row)
                     logging.info("Update Cursor: '%s' values updated", 'totalYrLyr')
                 else:
-                    arcpy.AddField_management(fc, "totalLyr", "SHORT")
-                    logging.info("Add Field: '%s' field added", 'totalLyr')
+                    if arcpy.ListFields(fc, "totalLyr") == []:
+                        arcpy.AddField_management(fc, "totalLyr", "SHORT")
+                        logging.info("Add Field: '%s' field added", 'totalLyr')
                     with arcpy.da.UpdateCursor(fc, "totalLyr") as cursor:
                         for row in cursor:
                             row[0] = len(sourceList)
                             cursor.updateRow(row)
                     logging.info("Update Cursor: '%s' values updated", 'totalLyr')
 
+                # Load dark targets into the in-memory store and apply attribute criteria (dissolved by targetID in memory before persistence analysis)
+                if persisEngine == INDEX_ENGINE:
+                    arcpy.AddMessage("Loading dark targets and applying attribute criteria...")
+                    with stageProfiler.stage("Load and select dark targets") as record:
+                        numLoaded = len(store)
+                        store.loadFeatureClass(fc)
+                        store.selectByAttributes(fc, keepExpression, rejectExpression)
+                        record["rows"] = len(store) - numLoaded
+                    logging.info("Dark Target Store: '%d' dark targets loaded from '%s' feature class, meeting the following selection criteria: '%s' and rejection criteria: '%s'", len(store), fc, keepExpression, rejectExpression)
+                    logging.info("Processing for '%s' feature class filter criteria and targetID dissolve complete\n", fc)
+                    manifest.complete("filter", [fcName])
+                    continue
+
                 # Apply attribute criteria filters to reduce number of polygons to analyze
                 tempLayer = "dtLyr"
                 arcpy.MakeFeatureLayer_management(fc, tempLayer)
@@ -310,7 +486,8 @@ class temporalPersistence(object):
                 # Apply selection criteria for attributes to KEEP
                 if keepExpression is not None:
                     arcpy.AddMessage("Selecting attributes to keep...")
-                    arcpy.SelectLayerByAttribute_management(tempLayer, "NEW_SELECTION", keepExpression)
+                    with stageProfiler.stage("SelectLayerByAttribute"):
+                        arcpy.SelectLayerByAttribute_management(tempLayer, "NEW_SELECTION", keepExpression)
                     logging.info("Select Layer by Attribute: Features from '%s' selected, meeting the following selection criteria: '%s'", tempLayer, keepExpression)
 
                 # Apply selection criteria for attributes to REJECT
@@ -326,6 +503,8 @@ class temporalPersistence(object):
                 # Copy filtered dark targets to new feature class for subsequent dissolve
                 if keepExpression is not None or rejectExpression is not None:
                     filterFC = os.path.join(analysisGDB, fcName + "_filter")
+                    if arcpy.Exists(filterFC):
+                        arcpy.Delete_management(filterFC)
                     arcpy.CopyFeatures_management(tempLayer,filterFC)
                     logging.info("Copy Features: '%s' feature class copied from selected features in '%s' layer", filterFC, tempLayer)
                 else:
@@ -334,7 +513,10 @@ class temporalPersistence(object):
                 # Dissolve filtered dark targets by targetID
                 arcpy.AddMessage("Dissolving by targetID...")
                 outFeatureClass = os.path.join(analysisGDB, fcName + '_byTargetID')
-                arcpy.Dissolve_management(filterFC, outFeatureClass, "targetID")
+                if arcpy.Exists(outFeatureClass):
+                    arcpy.Delete_management(outFeatureClass)
+                with stageProfiler.stage("Dissolve"):
+                    arcpy.Dissolve_management(filterFC, outFeatureClass, "targetID")
                 logging.info("Dissolve: '%s' feature class created from '%s' feature class dissolve", outFeatureClass, filterFC)
 
                 # Rename targetID field to corresponding year or day feature class (for pairing with corresponding statistics table in subsequent analysis step)
@@ -343,6 +525,7 @@ class temporalPersistence(object):
                 arcpy.AlterField_management(outFeatureClass, "targetID", new_name)
                 logging.info("Alter Field: '%s' field renamed to '%s'", 'targetID', new_name)
                 logging.info("Processing for '%s' feature class filter criteria and targetID dissolve complete\n", fc)
+                manifest.complete("filter", [fcName])
 
             # ========================================= #
             # Split and add other input sources by year #
@@ -350,21 +533,29 @@ class temporalPersistence(object):
 
             arcpy.env.workspace = analysisGDB
             if otherSources is not None:
+                # Restore source list and year span of other sources split and added by a previous interrupted run
+                if yrPersisBool and manifest.isComplete("otherSources"):
+                    state = manifest.state("otherSources")
+                    sourceList = state["sourceList"]
+                    span = state["span"]
+
                 # Check if year-to-year overall analysis, other input sources possible in this case
-                if yrPersisBool:
+                elif yrPersisBool:
                     arcpy.AddMessage("\nAdditional input shapefiles or feature classes detected for multi-year analysis. Appending data to appropriate years...")
 
-                    # Copy original source list to preserve integrity of original feature classes
-                    arcpy.AddMessage("Copying original input feature classes...")
-                    newSourceList = []
-                    fcTidList = arcpy.ListFeatureClasses("*_byTargetID")
-                    for fc in sourceList:
-                        fcCopy = os.path.join(analysisGDB, fc + "Copy")
-                        arcpy.CopyFeatures_management(fc, fcCopy)
-                        logging.info("Copy Features: '%s' feature class copied from '%s'", fcCopy, fc)
-                        newSourceList.append(fcCopy)
-                    sourceList = newSourceList
-                    logging.info("Feature class copies complete\n")
+                    # Copy original source list to preserve integrity of original feature classes (not required for the in-memory store)
+                    if persisEngine != INDEX_ENGINE:
+                        self.deleteOutputs(analysisGDB, ["*Copy", "dt_*_byTargetID"])
+                        arcpy.AddMessage("Copying original input feature classes...")
+                        newSourceList = []
+                        fcTidList = arcpy.ListFeatureClasses("*_byTargetID")
+                        for fc in sourceList:
+                            fcCopy = os.path.join(analysisGDB, fc + "Copy")
+                            arcpy.CopyFeatures_management(fc, fcCopy)
+                            logging.info("Copy Features: '%s' feature class copied from '%s'", fcCopy, fc)
+                            newSourceList.append(fcCopy)
+                        sourceList = newSourceList
+                        logging.info("Feature class copies complete\n")
 
                     # Iterate through other input sources to split and append dark targets by year
                     for fc in sourceFiles:
@@ -403,6 +594,14 @@ class temporalPersistence(object):
                             otherSourceCopy = os.path.join(analysisGDB,otherSourceCopyName)
                             otherSourceID = sourceFiles[fc][0]
 
+                            # Load current year's dark targets into the in-memory store (added to the time slice of the corresponding year)
+                            if persisEngine == INDEX_ENGINE:
+                                arcpy.AddMessage("Loading dark targets...")
+                                store.loadFeatureClass(fc, yrOutput, otherSourceID, where_clause, False)
+                                logging.info("Dark Target Store: Dark targets from current year selection of '%s' feature class loaded", fc)
+                                logging.info("Processing for '%s' from distinct year values complete\n", str(yr))
+                                continue
+
                             # Append current year's dark targets to already existing feature class for that year
                             if equivSourceName in fcTidList or otherSourceName in fcTidList:
                                 arcpy.AddMessage("Feature class for current year detected...")
@@ -476,6 +675,7 @@ class temporalPersistence(object):
                             span = newSpan
 
                         logging.info("Processing for '%s' feature class from other input sources complete\n", fc)
+                    manifest.complete("otherSources", state={"sourceList": sourceList, "span": span})
 
                 # Not year-to-year overall analysis, cannot incorporate other input feature classes.
                 else:
@@ -485,309 +685,387 @@ class temporalPersistence(object):
             # Calculate persistence of dark targets #
             # ===================================== #
 
+            # Calculate persistence of dark targets via points feature classes and buffer distances
+            bufferDistanceList = bufferDists.split(";")
+            adjacency = {}
+            incremental = False
+
+            # Dissolve dark targets by targetID in memory and find neighbouring targets once at the largest buffer distance (smaller buffer distances answered from the same pairs sorted by distance)
+            if persisEngine == INDEX_ENGINE:
+                # Centroids and neighbour pairs of previous analyses with the same dark targets and selection are reused from the cache (see 'persistenceCache.py')
+                cache = persistenceCache.PersistenceCache(os.path.join(os.path.dirname(analysisGDB), persistenceCache.CACHE_FOLDER))
+                arcpy.AddMessage("\nDissolving dark targets by targetID...")
+                with stageProfiler.stage("Dissolve by targetID", int(store.selected.sum())):
+                    targets = store.dissolveByTargetID("0" in bufferDistanceList, cache)
+                logging.info("Dark Target Store: '%d' dark targets dissolved by targetID from '%d' selected dark targets", len(targets["targetID"]), int(store.selected.sum()))
+                indexDistList = [int(dist) for dist in bufferDistanceList if int(dist) > 0]
+                sourceName = os.path.splitext(os.path.basename(source))[0]
+
+                # Geodesic distances between centroids in NAD 1983 Canada Atlas Lambert (planar distances for dark targets in any other coordinate system)
+                geodesic = store.spatialReference is not None and store.spatialReference.factoryCode == geodesicKernel.ATLAS_LAMBERT_WKID
+
+                # Geodesic distances are exact at each persistence radius of the analysis (cached separately for each list of radii)
+                metric = ["geodesic"] + sorted(indexDistList) if geodesic else ["planar"]
+                targetsKey = persistenceCache.contentKey(targets["sliceKeys"], metric)
+                if indexDistList != []:
+                    maxDist = max(indexDistList)
+                    if not geodesic:
+                        logging.info("Spatial Index: Dark targets not in NAD 1983 Canada Atlas Lambert, planar distances used")
+
+                    # Incremental analysis if time slices were added to the previous analysis, whose other time slices are unchanged (see 'edgeTable.py')
+                    edgeFile = os.path.join(os.path.dirname(analysisGDB), sourceName + edgeTable.EDGE_SUFFIX)
+                    previous = edgeTable.loadEdgeTable(edgeFile)
+                    if previous is not None and "0" not in bufferDistanceList and arcpy.Exists(str(previous["output"])):
+                        addedSlices = edgeTable.newSlices(previous, targets, maxDist, bufferDistanceList)
+                        if addedSlices:
+                            previousEdges = edgeTable.mapEdges(previous, targets)
+                            incremental = previousEdges is not None
+
+                    if incremental:
+                        arcpy.AddMessage("\nQuerying spatial index for neighbouring targets of " + str(len(addedSlices)) + " new layers within " + str(maxDist) + " meters...")
+                        with stageProfiler.stage("Spatial index new neighbours", len(targets["targetID"])):
+                            if geodesic:
+                                newEdges = geodesicKernel.findGeodesicNeighbours(targets["x"], targets["y"], targets["slice"], indexDistList, addedSlices)
+                            else:
+                                newEdges = persistenceEngine.findNewNeighbours(targets["x"], targets["y"], targets["slice"], addedSlices, maxDist)
+                            neighbours = persistenceEngine.sortNeighbours(*[np.concatenate([previousEdges[i], newEdges[i]]) for i in range(3)])
+
+                        # Dark targets of the new time slices and dark targets with new neighbours are updated in the output of the previous analysis
+                        affected = np.in1d(targets["slice"], addedSlices)
+                        affected[newEdges[0]] = True
+                        previousOutput = str(previous["output"])
+                        logging.info("Edge Table: '%d' pairs of targets read from '%s', '%d' new pairs of targets involving the following new times: '%s'", len(previousEdges[0]) // 2, edgeFile, len(newEdges[0]) // 2, str([store.times[s] for s in addedSlices]))
+                    else:
+                        arcpy.AddMessage("\nQuerying spatial index for neighbouring targets within " + str(maxDist) + " meters...")
+                        neighbours = cache.getNeighbours(targetsKey, maxDist)
+
+                        # Adjacency matrix saved by a previous analysis of the same dark targets at the largest buffer distance (see 'adjacencyMatrix.py')
+                        if neighbours is None:
+                            matrix = adjacencyMatrix.loadAdjacency(adjacencyMatrix.adjacencyFile(os.path.dirname(analysisGDB), sourceName, maxDist), targetsKey)
+                            if matrix is not None:
+                                neighbours = persistenceEngine.sortNeighbours(*adjacencyMatrix.toPairs(matrix))
+                                cache.putNeighbours(targetsKey, maxDist, neighbours)
+                        if neighbours is None:
+                            with stageProfiler.stage("Spatial index neighbours", len(targets["targetID"])):
+                                if geodesic:
+                                    neighbours = geodesicKernel.findGeodesicNeighbours(targets["x"], targets["y"], targets["slice"], indexDistList)
+                                else:
+                                    neighbours = persistenceEngine.findNeighbours(targets["x"], targets["y"], targets["slice"], maxDist)
+                                neighbours = persistenceEngine.sortNeighbours(*neighbours)
+                            cache.putNeighbours(targetsKey, maxDist, neighbours)
+                    logging.info("Spatial Index: Found '%d' pairs of targets from differing times within '%s' metres\n", len(neighbours[0]) // 2, str(maxDist))
+
             # Determine and iterate through list of feature classes with dark targets organized by '*_byTargetID' to create point feature classes
             fcTidList = arcpy.ListFeatureClasses("*_byTargetID")
-            arcpy.AddMessage("\nCreating point feature classes from targetID feature classes...")
-            logging.info("Processing 'byTargetID' feature classes for creation of point feature classes")
-            for fc in fcTidList:
-                pointName = fc + "_points"
-                outFeatures = os.path.join(analysisGDB, pointName)
-                arcpy.FeatureToPoint_management(fc, outFeatures, "CENTROID")
-                logging.info("Feature To Point: '%s' points feature class created from centroid of features in '%s' feature class", outFeatures, fc)
-            logging.info("Processing for creation of points feature classes complete\n")
-
-            # Calculate persistence of dark targets via points feature classes and buffer distances
+            if persisEngine != INDEX_ENGINE and not manifest.isComplete("points"):
+                arcpy.AddMessage("\nCreating point feature classes from targetID feature classes...")
+                logging.info("Processing 'byTargetID' feature classes for creation of point feature classes")
+                for fc in fcTidList:
+                    pointName = fc + "_points"
+                    outFeatures = os.path.join(analysisGDB, pointName)
+                    if arcpy.Exists(outFeatures):
+                        arcpy.Delete_management(outFeatures)
+                    with stageProfiler.stage("Write centroids") as record:
+                        record["rows"] = centroidEngine.writeCentroids(fc, outFeatures)
+                    logging.info("Centroids: '%s' points feature class created from centroid of features in '%s' feature class", outFeatures, fc)
+                logging.info("Processing for creation of points feature classes complete\n")
+                manifest.complete("points")
             pointFeatList = arcpy.ListFeatureClasses("*_points")
-            bufferDistanceList = bufferDists.split(";")
+
             for dist in bufferDistanceList:
+                if manifest.isComplete("persistence", [dist]):
+                    continue
                 arcpy.AddMessage("\nVerifying persistence of dark targets at " + str(dist) + " meters...")
                 logging.info("Processing persistence analysis at distance of '%s' metres\n", str(dist))
-                self.calcPersis(analysisGDB, yrPersisBool, fcTidList, pointFeatList, int(dist))
+                with stageProfiler.stage("Persistence at " + str(dist) + " metres"):
+                    if persisEngine == INDEX_ENGINE and int(dist) > 0:
+                        adjacency[dist] = self.calcPersisIndex(store, targets, yrPersisBool, neighbours, int(dist))
+                    elif persisEngine == INDEX_ENGINE:
+                        adjacency[dist] = self.calcPersisIntersect(store, targets, yrPersisBool)
+                    else:
+                        self.calcPersis(analysisGDB, yrPersisBool, fcTidList, pointFeatList, int(dist), workerCount)
                 logging.info("Processing for persistence analysis at distance of '%s' metres complete\n", str(dist))
+                manifest.complete("persistence", [dist])
 
-            # =================================================== #
-            # Join persistence values with source feature classes #
-            # =================================================== #
+            # ================================================================== #
+            # Write dark targets with persistence values to single feature class #
+            # ================================================================== #
 
-            arcpy.AddMessage("\nJoining persistence stats with feature classes...")
+            arcpy.AddMessage("\nJoining persistence stats with dark targets...")
             statsList = arcpy.ListTables()
 
-            # Iterate through source feature classes to join persistence values
-            for fc in sourceList:
-                logging.info("Processing '%s' feature class to join persistence results", fc)
-                persisLayer = "persisLyr"
-                arcpy.MakeFeatureLayer_management(fc, persisLayer)
-                logging.info("Make Feature Layer: '%s' layer created from '%s' feature class", persisLayer, fc)
-                statsTable = "targetID_" + fc.split('\\')[len(fc.split('\\'))-1].split('_')[1]
-                if statsTable.endswith("Copy"):
-                    statsTable = statsTable[:-4]
-
-                # Iterate through stats tables to match with corresponding feature class (to join persistence values)
-                for table in statsList:
-                    if table.startswith(statsTable):
-                        arcpy.AddMessage("Joining " + fc + " with " + table + "...")
-                        outTable = os.path.join(analysisGDB, table)
-                        joinField = statsTable
-                        arcpy.AddJoin_management(persisLayer, "targetID", outTable, joinField)
-                        logging.info("Add Join: '%s' table joined to joined to '%s' layer", outTable, persisLayer)
-                outFC = fc.split('\\')[len(fc.split('\\'))-1] + "_persis"
-                arcpy.FeatureClassToFeatureClass_conversion(persisLayer, analysisGDB, outFC)
-                logging.info("Feature Class to Feature Class: '%s' layer converted to '%s' feature class", persisLayer, outFC)
-
-                # Rename attribute fields to standardize for subsequent merge
-                arcpy.AddMessage("Preparing " + fc + " for merge (renaming attribute fields)...")
-                persisFC = os.path.join(analysisGDB, outFC)
-                fieldList = arcpy.ListFields(persisFC)
-                for field in fieldList:
-                    if field.name.startswith("RS2_") or field.name.startswith("dt_"):
-                        if field.name.endswith("Shape_Length") or field.name.endswith("Shape_Area"):
-                            arcpy.DeleteField_management(persisFC, field.name)
-                        else:
-                            newNameSplit = field.name.split("_")
-                            newName = "_".join(newNameSplit[2:])
-                            arcpy.AlterField_management(persisFC, field.name, newName)
-                    if field.name.startswith("targetID_"):
-                        if "pers" in field.name or "wght" in field.name:
-                            arcpy.AlterField_management(persisFC, field.name, field.name.split("_")[len(field.name.split("_"))-1])
-                        else:
-                            arcpy.DeleteField_management(persisFC, field.name)
-
-                logging.info("Processing for '%s' feature class to join persistence results complete\n", fc)
-
-            # ======================================================= #
-            # Merge persistent dark targets into single feature class #
-            # ======================================================= #
-
-            arcpy.AddMessage("\nMerging persistent targets into single feature class...")
-            persisList = arcpy.ListFeatureClasses("*_persis")
-            if yrPersisBool:
-                finalResultName = "persistent_targets_" + span
-                mergeName = finalResultName + "_merge"
+            # Name of final output recorded with the join stage of a previous interrupted run
+            if manifest.isComplete("join", [bufferDists]):
+                finalResultName = manifest.state("join")["finalResultName"]
             else:
-                finalResultName = "RS2_" + persisList[0].split('_')[1][:4]
-                mergeName = finalResultName + "_merge"
+                # Load attributes and polygon objects of source feature classes (Buffer and Union engine) and record persistence values of each targetID from the stats tables
+                if persisEngine != INDEX_ENGINE:
+                    store = darkTargetStore.DarkTargetStore()
+                    with stageProfiler.stage("Load dark targets") as record:
+                        for fc in sourceList:
+                            store.loadFeatureClass(fc, coordinates=False)
+                            logging.info("Dark Target Store: Dark targets loaded from '%s' feature class", fc)
+                        record["rows"] = len(store)
+                    targets = store.groupByTargetID()
+                    with stageProfiler.stage("Load persistence stats", len(targets["targetID"])):
+                        for dist in bufferDistanceList:
+                            self.loadPersisStats(analysisGDB, store, targets, yrPersisBool, int(dist))
+
+                # Write every dark target with its standardized attribute fields and persistence values in a single output (replaces join, export, rename and merge of each feature class)
+                arcpy.AddMessage("\nWriting persistent targets into single feature class...")
+                if yrPersisBool:
+                    finalResultName = "persistent_targets_" + span
+                else:
+                    finalResultName = "RS2_" + store.times[0][:4]
+                outputMerge = os.path.join(analysisGDB, finalResultName + "_merge")
+                if arcpy.Exists(outputMerge):
+                    arcpy.Delete_management(outputMerge)
+
+                # Only the dark targets of the new time slices are written for an incremental analysis (appended to the output of the previous analysis)
+                if incremental:
+                    rows = np.nonzero(np.in1d(store.slice, addedSlices))[0]
+                else:
+                    rows = np.arange(len(store))
+                with stageProfiler.stage("Write persistent targets", len(rows)):
+                    store.writeFeatureClass(outputMerge, rows)
+                logging.info("Dark Target Store: '%s' created with persistence values for dark targets of the following times: '%s'", outputMerge, str(store.times))
+                manifest.complete("join", [bufferDists], {"finalResultName": finalResultName})
+            mergeName = finalResultName + "_merge"
             finalOutput = os.path.join(analysisGDB, finalResultName)
             outputMerge = os.path.join(analysisGDB, mergeName)
-            arcpy.Merge_management(persisList, outputMerge)
-            logging.info("Merge: '%s' created from merging the following feature classes: '%s'", outputMerge, str(persisList))
-
-            # Check if output feature class already exists and join new persistence values
-            if arcpy.Exists(finalOutput):
-                arcpy.AddMessage("Final merge feature class already exists, incorporating in merge process...")
-                logging.info("Exists: '%s' feature class already exists, joining new persistence values", finalOutput)
-                addFields = []
-                for dist in bufferDistanceList:
-                    if yrPersisBool:
-                        persisFieldName = "Ypers" + dist
-                        wghtFieldName = "Ywght" + dist
-                    else:
-                        persisFieldName = "pers" + dist
-                        wghtFieldName = "wght" + dist
-                    fldList = arcpy.ListFields(finalOutput)
-                    fldNames = []
-                    for fld in fldList:
-                        fldNames.append(fld.name)
-                    if persisFieldName in fldNames:
-                        arcpy.DeleteField_management(finalOutput, persisFieldName)
-                        arcpy.DeleteField_management(finalOutput, wghtFieldName)
-                    addFields.append(persisFieldName)
-                    addFields.append(wghtFieldName)
-                self.join_field(finalOutput, "targetID", outputMerge, "targetID", ";".join(addFields))
-                logging.info("Joined new values to '%s' feature class for the following fields: '%s'\n", finalOutput, str(addFields))
-
-            # If no previous output feature class, rename merge output to final day or year analysis output
-            else:
-                arcpy.Rename_management(outputMerge, finalOutput)
-                logging.info("Rename: '%s' feature class renamed to '%s'\n", outputMerge, finalOutput)
+
+            # Check if output feature class already exists and join new persistence values (unless merged by a previous interrupted run)
+            if not manifest.isComplete("merge", [bufferDists]):
+                if incremental:
+                    self.mergeIncremental(previousOutput, finalOutput, outputMerge, store, targets, affected, yrPersisBool, bufferDistanceList)
+
+                # Merge output already renamed to final output by a previous run interrupted before the merge stage was recorded
+                elif arcpy.Exists(finalOutput) and not arcpy.Exists(outputMerge):
+                    logging.info("Exists: '%s' feature class already renamed to '%s' by interrupted run\n", outputMerge, finalOutput)
+                elif arcpy.Exists(finalOutput):
+                    arcpy.AddMessage("Final merge feature class already exists, incorporating in merge process...")
+                    logging.info("Exists: '%s' feature class already exists, joining new persistence values", finalOutput)
+                    addFields = []
+                    for dist in bufferDistanceList:
+                        if yrPersisBool:
+                            persisFieldName = "Ypers" + dist
+                            wghtFieldName = "Ywght" + dist
+                        else:
+                            persisFieldName = "pers" + dist
+                            wghtFieldName = "wght" + dist
+                        fldList = arcpy.ListFields(finalOutput)
+                        fldNames = []
+                        for fld in fldList:
+                            fldNames.append(fld.name)
+                        if persisFieldName in fldNames:
+                            arcpy.DeleteField_management(finalOutput, persisFieldName)
+                            arcpy.DeleteField_management(finalOutput, wghtFieldName)
+                        addFields.append(persisFieldName)
+                        addFields.append(wghtFieldName)
+                    hashJoin.joinField(finalOutput, "targetID", outputMerge, "targetID", addFields)
+                    logging.info("Joined new values to '%s' feature class for the following fields: '%s'\n", finalOutput, str(addFields))
+
+                # If no previous output feature class, rename merge output to final day or year analysis output
+                else:
+                    arcpy.Rename_management(outputMerge, finalOutput)
+                    logging.info("Rename: '%s' feature class renamed to '%s'\n", outputMerge, finalOutput)
+                manifest.complete("merge", [bufferDists])
 
             # ============================================ #
             # Assign cluster IDs to clustered dark targets #
             # ============================================ #
 
-            arcpy.AddMessage("\nAssigning cluster IDs to clustered targets...")
-            logging.info("Processing cluster IDs\n")
-
-            # Determine dissolve feature classes (which contains data on intersecting dark targets) and organize by buffer distance
-            dissolveList = arcpy.ListFeatureClasses("*_dissolve")
-            dissolveListDict = {}
-            for fc in dissolveList:
-                bufferDist = fc.split("_")[len(fc.split("_"))-3]
-                if bufferDist in dissolveListDict:
-                    dissolveListDict[bufferDist].append(fc)
-                else:
-                    dissolveListDict[bufferDist] = [fc]
-
-            # Iterate through buffer distances to determine clusters per distance
-            for bufferDist in dissolveListDict:
-                arcpy.AddMessage("\nProcessing clustering at " + bufferDist + " meters...")
-                logging.info("Processing dark target clusters at '%s' meters\n", bufferDist)
-                clusterList = []
-
-                # Iterate through feature classes within buffer distance to determine clustered targets
-                for fc in dissolveListDict[bufferDist]:
-                    arcpy.AddMessage("Detecting clusters in " + fc + "...")
-                    logging.info("Processing '%s' feature class for initial clustering of targetIDs", fc)
-
-                    # Determine targetID fields from differing days or years (targetID_2010, targetID_2011, etc) to include in cursor iteration
-                    fldList = arcpy.ListFields(fc)
-                    cursorFields = []
-                    for fld in fldList:
-                        if fld.name.startswith("targetID"):
-                            cursorFields.append(fld.name)
-
-                    # Select rows for cursor iteration that contain a targetID (not empty) for current feature class and initialize clustered targets list
-                    expression = cursorFields[0] + " <> ''"
+            # Clusters determined again unless assigned by a previous interrupted run
+            if not manifest.isComplete("clustering", [bufferDists]):
+                arcpy.AddMessage("\nAssigning cluster IDs to clustered targets...")
+                logging.info("Processing cluster IDs\n")
+
+                # Determine dissolve feature classes (which contains data on intersecting dark targets) and organize by buffer distance
+                dissolveList = sorted(arcpy.ListFeatureClasses("*_dissolve"))
+                dissolveListDict = {}
+                for fc in dissolveList:
+                    bufferDist = fc.split("_")[len(fc.split("_"))-3]
+                    if bufferDist in dissolveListDict:
+                        dissolveListDict[bufferDist].append(fc)
+                    else:
+                        dissolveListDict[bufferDist] = [fc]
+
+                # Add buffer distances calculated by the spatial index engine (no dissolve feature classes, clusters taken from the adjacency matrix)
+                for bufferDist in adjacency:
+                    if bufferDist not in dissolveListDict:
+                        dissolveListDict[bufferDist] = []
+
+                # Iterate through buffer distances to determine clusters per distance (targetID to clusterID dictionary recorded by clusterID field name)
+                clusterFieldDict = {}
+                clusterUpdateIDs = {}
+                for bufferDist in dissolveListDict:
+                    arcpy.AddMessage("\nProcessing clustering at " + bufferDist + " meters...")
+                    logging.info("Processing dark target clusters at '%s' meters\n", bufferDist)
                     targetList = []
 
-                    # Cursor iteration through table rows of current feature class to detect clustered targets
-                    with arcpy.da.SearchCursor(fc, cursorFields, expression) as cursor:
-                        for row in cursor:
-                            rowFields = []
-
-                            # Iterate through fields within the row to detect presence of targetIDs from differing times and append to rowFields list to determine clustering
-                            for item in row:
-                                if item != "":
-                                    rowFields.append(item)
-
-                            # If more than one targetID detected in same row, row of targetIDs is appended as an initial cluster to the targetList
-                            if len(rowFields) > 1:
-                                targetList.append(rowFields)
-                    logging.info("Search Cursor: Detected clustered targets in '%s' feature class", fc)
-
-                    # Iterate through target list to group repeating targets into clusters
-                    for item in targetList:
-                        itemPresent = False
-
-                        # Iterate through each targetID in the target list and check cluster list if already recorded
-                        for target in item:
-                            for cluster in clusterList:
-                                if target in cluster:
-
-                                    # If targetID found in cluster list, append all targetIDs in target list item to corresponding cluster in cluster list (targetID will be duplicated within cluster)
-                                    itemPresent = True
-                                    for target in item:
-                                        cluster.append(target)
-
-                        # If target is not previously recorded in a cluster, append target list item as a new cluster to cluster list
-                        if not itemPresent:
-                            clusterList.append(item)
-
-                    logging.info("Processing for '%s' feature class for initial clustering of targetIDs complete\n", fc)
-
-                # Iterate through cluster list to group clusters spanning differing times (days or years) that were missed in initialize iteration of feature classes
-                arcpy.AddMessage("Detecting overall grouping of clusters...")
-                groupClusterList = []
-                for cluster in clusterList:
-                    clusterPresent = False
-
-                    # Iterate through each targetID in the cluster and check grouped cluster list if already recorded
-                    for target in cluster:
-                        for groupCluster in groupClusterList:
-                            if target in groupCluster:
-
-                                # If targetID found in grouped cluster list, append all targetID in cluster to corresponding grouped cluster in grouped cluster list (targetID will be duplicated within grouped cluster)
-                                clusterPresent = True
-                                for target in cluster:
-                                    groupCluster.append(target)
-
-                    # If target is not previously recorded in a grouped cluster, append cluster as a new grouped cluster to grouped cluster list
-                    if not clusterPresent:
-                        groupClusterList.append(cluster)
-
-                logging.info("Determined overall grouping of targetID clusters")
-
-                # Deduplication of targetIDs in each cluster
-                arcpy.AddMessage("Removing targetID duplicates in clusters...")
-                finalClusterList = []
-                for cluster in groupClusterList:
-                    dedupeCluster = set(cluster)
-                    finalCluster = list(dedupeCluster)
-                    finalClusterList.append(finalCluster)
-                logging.info("Removed duplicate targetIDs in each cluster")
-
-                # Assign cluster ID to each cluster (arbitrary number assignment before decimal, maximum month difference after decimal)
-                arcpy.AddMessage("Assigning cluster ID and calculating time span (in months) for each cluster...")
-                clusterDict = {}
-                clusterid = 1
-                for cluster in finalClusterList:
-                    clusterDict[clusterid] = cluster
-                    clusterid += 1
-
-                # Detect and calculate maximum difference of months between dark targets for cluster ID
-                monthDiffDict = {}
-                for key, value in clusterDict.iteritems():
-                    targetDates = []
-                    for target in value:
-                        if len(target.split("_")) == 5:
-                            dateString = target.split("_")[2]
-                        elif len(target.split("_")) == 3:
-                            dateString = target.split("_")[1]
-                        else:
-                            dateString = None
-                        if dateString is not None:
-                            date = datetime.strptime(dateString, "%Y%m%d")
-                            targetDates.append(date)
-                    targetDates.sort()
-                    if targetDates == []:
-                        monthDiff = 0
+                    # Iterate through feature classes within buffer distance to determine clustered targets
+                    for fc in dissolveListDict[bufferDist]:
+                        arcpy.AddMessage("Detecting clusters in " + fc + "...")
+                        logging.info("Processing '%s' feature class for initial clustering of targetIDs", fc)
+
+                        # Determine targetID fields from differing days or years (targetID_2010, targetID_2011, etc) to include in cursor iteration
+                        fldList = arcpy.ListFields(fc)
+                        cursorFields = []
+                        for fld in fldList:
+                            if fld.name.startswith("targetID"):
+                                cursorFields.append(fld.name)
+
+                        # Select rows for cursor iteration that contain a targetID (not empty) for current feature class
+                        expression = cursorFields[0] + " <> ''"
+
+                        # Cursor iteration through table rows of current feature class to detect clustered targets
+                        with arcpy.da.SearchCursor(fc, cursorFields, expression) as cursor:
+                            for row in cursor:
+                                rowFields = []
+
+                                # Iterate through fields within the row to detect presence of targetIDs from differing times and append to rowFields list to determine clustering
+                                for item in row:
+                                    if item != "":
+                                        rowFields.append(item)
+
+                                # If more than one targetID detected in same row, row of targetIDs is appended as an initial cluster to the targetList
+                                if len(rowFields) > 1:
+                                    targetList.append(rowFields)
+                        logging.info("Search Cursor: Detected clustered targets in '%s' feature class", fc)
+                        logging.info("Processing for '%s' feature class for initial clustering of targetIDs complete\n", fc)
+
+                    # Clusters of the spatial index engine are the connected components of the adjacency matrix
+                    if bufferDist in adjacency:
+                        arcpy.AddMessage("Detecting clusters from adjacency matrix...")
+                        with stageProfiler.stage("Build clusters", len(adjacency[bufferDist]["indices"]) // 2):
+                            finalClusterList = adjacencyMatrix.clusters(adjacency[bufferDist], targets["targetID"])
+                        logging.info("Determined overall grouping of targetID clusters: '%d' clusters from '%d' neighbour pairs", len(finalClusterList), len(adjacency[bufferDist]["indices"]) // 2)
+
+                    # Group initial clusters sharing targetIDs into overall clusters spanning differing times (days or years), without duplicate targetIDs
                     else:
-                        monthDiff = (targetDates[len(targetDates)-1].year - targetDates[0].year) * 12 + (targetDates[len(targetDates)-1].month - targetDates[0].month)
-                    monthDiffDict[key] = monthDiff
-                logging.info("Assigned cluster ID and calculated time span for each cluster")
+                        arcpy.AddMessage("Detecting overall grouping of clusters...")
+                        with stageProfiler.stage("Build clusters", len(targetList)):
+                            finalClusterList = persistenceEngine.buildClusters(targetList)
+                        logging.info("Determined overall grouping of targetID clusters: '%d' clusters from '%d' initial clusters", len(finalClusterList), len(targetList))
 
-                # Create clusterID field and update relevant dark targets with clusterID value
-                arcpy.AddMessage("Creating clusterID field and updating clusterID values...")
-                if yrPersisBool:
-                    clusterFieldName = "Yclst" + bufferDist
-                else:
-                    clusterFieldName = "clst" + bufferDist
-                arcpy.AddField_management(finalOutput, clusterFieldName, "TEXT")
-                cursorFields = ["targetID", clusterFieldName]
-                with arcpy.da.UpdateCursor(finalOutput, cursorFields) as cursor:
-                    for row in cursor:
-                        for key, value in clusterDict.iteritems():
-                            if row[0] in value:
-                                clusterIDString = str(key) + "." + str(monthDiffDict[key])
-                                row[1] = clusterIDString
-                        cursor.updateRow(row)
-                logging.info("Update Cursor: Cluster ID values updated for '%s' feature class\n", finalOutput)
-
-                logging.info("Processing for dark targets at '%s' meters complete\n", bufferDist)
-
-            logging.info("Processing for cluster IDs complete\n")
-
-            # ================================== #
-            # Export attribute table as csv file #
-            # ================================== #
-
-            arcpy.AddMessage("Exporting attribute table for " + finalResultName + " as csv file...")
-            fldValueList = []
-            fldList = arcpy.ListFields(finalOutput)
-            for fld in fldList:
-                if fld.name != "Shape":
-                    fldValueList.append(fld.name)
-            output_csv = os.path.join(os.path.dirname(analysisGDB), finalResultName + ".csv")
-            arcpy.ExportXYv_stats(finalOutput, fldValueList, "COMMA", output_csv, "ADD_FIELD_NAMES")
-            logging.info("Export XY Values: Exported all attribute values for '%s' feature class as '%s' csv file\n", finalOutput, output_csv)
+                    # Determine clusterID field name
+                    if yrPersisBool:
+                        clusterFieldName = "Yclst" + bufferDist
+                    else:
+                        clusterFieldName = "clst" + bufferDist
+
+                    # Incremental analysis: only clusters with affected dark targets are assigned new cluster IDs (following the largest cluster ID of the previous analysis)
+                    clusterid = 1
+                    if incremental:
+                        affectedIDs = set(targets["targetID"][affected].tolist())
+                        finalClusterList = [cluster for cluster in finalClusterList if any(target in affectedIDs for target in cluster)]
+                        clusterUpdateIDs[clusterFieldName] = affectedIDs.union(*finalClusterList)
+                        clusterid = self.maxClusterID(finalOutput, clusterFieldName) + 1
+                        logging.info("Incremental analysis: '%d' clusters with affected dark targets assigned new cluster IDs from '%d'", len(finalClusterList), clusterid)
+
+                    # Assign cluster ID to each cluster (arbitrary number assignment before decimal, maximum month difference after decimal)
+                    arcpy.AddMessage("Assigning cluster ID and calculating time span (in months) for each cluster...")
+                    clusterIDDict = {}
+                    for cluster in finalClusterList:
+
+                        # Detect and calculate maximum difference of months between dark targets for cluster ID
+                        targetDates = []
+                        for target in cluster:
+                            if len(target.split("_")) == 5:
+                                dateString = target.split("_")[2]
+                            elif len(target.split("_")) == 3:
+                                dateString = target.split("_")[1]
+                            else:
+                                dateString = None
+                            if dateString is not None:
+                                date = datetime.strptime(dateString, "%Y%m%d")
+                                targetDates.append(date)
+                        targetDates.sort()
+                        if targetDates == []:
+                            monthDiff = 0
+                        else:
+                            monthDiff = (targetDates[len(targetDates)-1].year - targetDates[0].year) * 12 + (targetDates[len(targetDates)-1].month - targetDates[0].month)
+
+                        # Index cluster ID string by targetID for direct lookup during the cursor update
+                        clusterIDString = str(clusterid) + "." + str(monthDiff)
+                        for target in cluster:
+                            clusterIDDict[target] = clusterIDString
+                        clusterid += 1
+                    logging.info("Assigned cluster ID and calculated time span for each cluster")
+
+                    # Create clusterID field (values updated for every buffer distance in a single cursor iteration below)
+                    if arcpy.ListFields(finalOutput, clusterFieldName) == []:
+                        arcpy.AddField_management(finalOutput, clusterFieldName, "TEXT")
+                        logging.info("Add Field: '%s' field added to '%s' feature class", clusterFieldName, finalOutput)
+                    clusterFieldDict[clusterFieldName] = clusterIDDict
+
+                    logging.info("Processing for dark targets at '%s' meters complete\n", bufferDist)
+
+                # Update relevant dark targets with clusterID value for every buffer distance
+                if clusterFieldDict != {}:
+                    arcpy.AddMessage("\nUpdating clusterID values...")
+                    clusterFieldNames = sorted(clusterFieldDict.keys())
+                    cursorFields = ["targetID"] + clusterFieldNames
+                    with stageProfiler.stage("Update cluster IDs") as record, arcpy.da.UpdateCursor(finalOutput, cursorFields) as cursor:
+                        numRows = 0
+                        for row in cursor:
+                            # Incremental analysis: cluster IDs of dark targets outside of the affected clusters are kept
+                            fieldIdx = [i for i in range(len(clusterFieldNames)) if not incremental or row[0] in clusterUpdateIDs[clusterFieldNames[i]]]
+                            if fieldIdx == []:
+                                continue
+                            for i in fieldIdx:
+                                row[i + 1] = clusterFieldDict[clusterFieldNames[i]].get(row[0])
+                            cursor.updateRow(row)
+                            numRows += 1
+                        record["rows"] = numRows
+                    logging.info("Update Cursor: Cluster ID values updated for '%s' feature class for the following fields: '%s'\n", finalOutput, str(clusterFieldNames))
+
+                logging.info("Processing for cluster IDs complete\n")
+                manifest.complete("clustering", [bufferDists])
+
+            # ============================================= #
+            # Export attribute table as csv or parquet file #
+            # ============================================= #
+
+            if not manifest.isComplete("export", [exportFormat]):
+                arcpy.AddMessage("Exporting attribute table for " + finalResultName + " as " + exportFormat + " file...")
+                outputPath = os.path.join(os.path.dirname(analysisGDB), finalResultName)
+                outputFile = resultExport.exportTable(finalOutput, outputPath, exportFormat)
+                logging.info("Export: Exported all attribute values for '%s' feature class as '%s' file\n", finalOutput, outputFile)
+                manifest.complete("export", [exportFormat])
 
             # =============================== #
             # Clean up analysis GDB workspace #
             # =============================== #
 
             self.cleanWorkspace(analysisGDB, fcTidList, pointFeatList, statsList, outputMerge)
+            manifest.remove()
+
+            # Record neighbour pairs for a subsequent incremental analysis (direct intersection analysis not supported)
+            if persisEngine == INDEX_ENGINE and indexDistList != [] and "0" not in bufferDistanceList:
+                edgeTable.saveEdgeTable(edgeFile, targets, neighbours, maxDist, bufferDistanceList, finalOutput)
+
+            # Record adjacency matrix of each buffer distance calculated by the spatial index engine for subsequent analyses of the same dark targets
+            for dist in adjacency:
+                adjacencyMatrix.saveAdjacency(adjacencyMatrix.adjacencyFile(os.path.dirname(analysisGDB), sourceName, int(dist)), adjacency[dist], targets, int(dist), targetsKey)
 
         logging.info("temporalPersistence.py script finished\n\n")
         return
 
-    def calcPersis(self, workspace, yrPersisBool, targetIDfeatList, pointList, bufferDist):
+    def calcPersis(self, workspace, yrPersisBool, targetIDfeatList, pointList, bufferDist, workers=1):
         """Calculates persistence values of each dark target at the specified buffer distance.
 
+        The Union, Dissolve and Statistics of each time slice are performed by
+        persistencePool.unionStats, in parallel worker processes if more than one
+        worker is specified.
+
         Parameters:
             workspace = Points to the workspace in which the geoprocessing occurs and to which interim feature classes and tables will be saved
             yrPersisBool = Boolean value indicating whether type of analysis is day-to-day within the year or overall year-to-year
             targetIDfeatList = List of feature classes in which dark targets are dissolved by targetID
             pointList = List of point feature classes created from the centroid of each dark target (by targetID)
             bufferDist = Buffer distance at which to carry out the persistence analysis
+            workers = Number of worker processes among which the time slices are distributed
 
         Return:
             No return, however creates attribute table output with the persistence and weight values for each dark target.
@@ -814,6 +1092,10 @@ class temporalPersistence(object):
             and 1 for each dark target within its buffer distance)"""
         analysisGDB = workspace
 
+        # Delete interim outputs left at this buffer distance by an interrupted run
+        distWildCard = "*_" + str(bufferDist)
+        self.deleteOutputs(analysisGDB, [distWildCard + "_buffer", distWildCard + "_Union", distWildCard + "_Union_dissolve"], [distWildCard + "_stats"])
+
         # Create distance buffer for each points feature class for persistence analysis
         if bufferDist > 0:
             arcpy.AddMessage("Creating buffers for point feature classes...")
@@ -822,7 +1104,8 @@ class temporalPersistence(object):
                 bufferFC = fc + "_" + str(bufferDist) + "_buffer"
                 outBuffer = os.path.join(analysisGDB, bufferFC)
                 distance = str(bufferDist) + " Meters"
-                arcpy.Buffer_analysis(fc, outBuffer, distance, "FULL", "ROUND", "NONE", "", "GEODESIC")
+                with stageProfiler.stage("Buffer"):
+                    arcpy.Buffer_analysis(fc, outBuffer, distance, "FULL", "ROUND", "NONE", "", "GEODESIC")
                 logging.info("Buffer: '%s' buffer created from '%s' feature class", outBuffer, fc)
             logging.info("Processing for creation of buffers feature classes complete\n")
             wild_card = "*_" + str(bufferDist) + "_buffer"
@@ -834,78 +1117,297 @@ class temporalPersistence(object):
         else:
             fcList = targetIDfeatList
 
-        # Iterate through buffer (or targetID, in case of analysis by direct intersection) feature classes to compile feature classes for union analysis
-        for fc in fcList:
-            arcpy.AddMessage("\nPerforming union for persistence analysis on dark targets in " + fc.split("_")[1] + "...")
-            logging.info("Processing '%s' feature class for union analysis", fc)
+        # Iterate through buffer (or targetID, in case of analysis by direct intersection) feature classes for union analysis (in parallel worker processes if specified)
+        if workers > 1 and len(fcList) > 1:
+            arcpy.AddMessage("\nPerforming union for persistence analysis on dark targets in parallel...")
+            with stageProfiler.stage("Union worker pool", len(fcList)):
+                persistencePool.runPool(analysisGDB, [(fc, targetIDfeatList, yrPersisBool, bufferDist) for fc in fcList], workers)
+        else:
+            for fc in fcList:
+                arcpy.AddMessage("\nPerforming union for persistence analysis on dark targets in " + fc.split("_")[1] + "...")
+                logging.info("Processing '%s' feature class for union analysis", fc)
+                persistencePool.unionStats(analysisGDB, analysisGDB, fc, targetIDfeatList, yrPersisBool, bufferDist)
+                logging.info("Processing for '%s' feature class for union analysis complete\n", fc)
+
+    def calcPersisIndex(self, store, targets, yrPersisBool, neighbours, bufferDist):
+        """Calculates persistence values of each dark target at the specified buffer distance from spatial index neighbour pairs.
+
+        Centroid-distance approximation of calcPersis, without creating buffer, union,
+        dissolve feature classes or statistics tables. Dark targets from different times
+        are considered persistent when their centroids are located within the buffer
+        distance of each other: the persistence value is the number of other times with
+        a centroid within the buffer distance, and the weight value is 1 plus the number
+        of such centroids. calcPersis instead unions the buffer of each centroid with the
+        dark target polygons of the other times (persistence value is the maximum overlap
+        count of the union areas and weight value is the number of dissolved union areas),
+        so that large dark targets whose centroid is beyond the buffer distance still
+        count. The values of both engines are therefore not comparable.
 
-            # Determine time (day or year) of current buffer feature class and use current buffer feature class to start list of feature classes to union
-            fcTime = fc.split("_")[1]
-            unionList = [fc]
+        Parameters:
+            store = In-memory dark target store (darkTargetStore.DarkTargetStore) to which the values are recorded
+            targets = Dictionary of dark targets dissolved by targetID (returned by the store's dissolveByTargetID)
+            yrPersisBool = Boolean value indicating whether type of analysis is day-to-day within the year or overall year-to-year
+            neighbours = Neighbour pairs sorted by distance (persistenceEngine.sortNeighbours), found at a distance equal or greater than the buffer distance
+            bufferDist = Buffer distance at which to carry out the persistence analysis
 
-            # Determine field and feature class names for union depending of type of analysis (day-to-day or year-to-year)
-            if yrPersisBool:
-                union = "persistent_targets_" + fcTime + "_"+ str(bufferDist) + "_Union"
-                persisFieldName = "Ypers" + str(bufferDist)
-                weightFieldName = "Ywght" + str(bufferDist)
-            else:
-                union = "RS2_" + fcTime + "_" + str(bufferDist) + "_Union"
-                persisFieldName = "pers" + str(bufferDist)
-                weightFieldName = "wght" + str(bufferDist)
-
-            # Append targetID feature classes from times other than current buffer feature class to list of feature classes to union
-            for targetFc in targetIDfeatList:
-                if fcTime != targetFc.split("_")[1]:
-                    unionList.append(targetFc)
-
-            # Perform union of feature classes to determine dark target persistence between layers
-            arcpy.Union_analysis(unionList, union)
-            logging.info("Union: Created '%s' feature class from union of following feature classes: '%s'", union, str(unionList))
-
-            # Dissolve union features by targetID to remove possible duplicate features
-            arcpy.AddMessage("Dissolving...")
-            dissolveName = union + "_dissolve"
-            dissolve = os.path.join(analysisGDB, dissolveName)
-            dissolveFields = []
-            fldList = arcpy.ListFields(union)
-            for fld in fldList:
-                if fld.name.startswith("targetID"):
-                    dissolveFields.append(fld.name)
-            arcpy.Dissolve_management(union, dissolve, dissolveFields)
-            logging.info("Dissolve: '%s' feature class created from '%s' feature class dissolve", dissolve, union)
-
-            # Add and calculate persistence values
-            arcpy.AddMessage("Calculating persistence value...")
-            arcpy.AddField_management(dissolve, persisFieldName, "SHORT")
-            logging.info("Add Field: '%s' field added to '%s' feature class", persisFieldName, dissolve)
-            cursorFields = dissolveFields
-            cursorFields.append(persisFieldName)
-            with arcpy.da.UpdateCursor(dissolve, cursorFields) as cursor:
-
-                # Calculate persistence of targets by checking for polygons with multiple targetIDs (indicating an overlap occurring after the Union of feature classes)
+        Return:
+            Returns sparse adjacency matrix (adjacencyMatrix.fromPairs) of the dark targets
+            from different times located within the buffer distance of each other, from
+            which the persistence and weight values and the clusters are derived.
+            Persistence and weight values for each dark target are recorded in the store
+            under the same field names as calcPersis."""
+        # Determine field names depending of type of analysis (day-to-day or year-to-year)
+        if yrPersisBool:
+            persisFieldName = "Ypers" + str(bufferDist)
+            weightFieldName = "Ywght" + str(bufferDist)
+        else:
+            persisFieldName = "pers" + str(bufferDist)
+            weightFieldName = "wght" + str(bufferDist)
+
+        # Reduce neighbour pairs to dark targets from differing times within buffer distance of each other
+        targetIdx, neighbourIdx, distance = persistenceEngine.withinRadius(neighbours, bufferDist)
+        logging.info("Spatial Index: '%d' pairs of targets from differing times within '%s' metres", len(targetIdx) // 2, str(bufferDist))
+        matrix = adjacencyMatrix.fromPairs(len(targets["targetID"]), targetIdx, neighbourIdx, distance)
+
+        # Calculate persistence and weight values
+        arcpy.AddMessage("Calculating persistence value and weight value...")
+        persis, weight = adjacencyMatrix.persistence(matrix, targets["slice"])
+        store.setTargetValues(persisFieldName, persis, "SHORT")
+        store.setTargetValues(weightFieldName, weight, "LONG")
+        logging.info("Dark Target Store: '%s' and '%s' values recorded for '%d' dark targets", persisFieldName, weightFieldName, len(persis))
+        return matrix
+
+    def calcPersisIntersect(self, store, targets, yrPersisBool):
+        """Calculates persistence values of each dark target by direct intersection (buffer distance of 0) of the dissolved dark targets.
+
+        Produces the same persistence and weight values as calcPersis at a buffer distance
+        of 0, without creating targetID, union, dissolve feature classes or statistics
+        tables. Only the pairs of dark targets from different times whose envelopes
+        overlap (see 'strTree.py') are tested for intersection, and only the dark targets
+        intersecting dark targets from other times are split into the areas of the Union
+        (see overlapAreas).
+
+        Parameters:
+            store = In-memory dark target store (darkTargetStore.DarkTargetStore) to which the values are recorded
+            targets = Dictionary of dark targets dissolved by targetID, with the dissolved polygons (returned by the store's dissolveByTargetID)
+            yrPersisBool = Boolean value indicating whether type of analysis is day-to-day within the year or overall year-to-year
+
+        Return:
+            Returns sparse adjacency matrix (adjacencyMatrix.fromPairs) of the dark targets
+            from different times intersecting each other (distance of 0), from which the
+            clusters are derived. Persistence and weight values for each dark target are
+            recorded in the store under the same field names as calcPersis."""
+        # Determine field names depending of type of analysis (day-to-day or year-to-year)
+        if yrPersisBool:
+            persisFieldName = "Ypers0"
+            weightFieldName = "Ywght0"
+        else:
+            persisFieldName = "pers0"
+            weightFieldName = "wght0"
+        numTargets = len(targets["targetID"])
+        geometry = targets["geometry"]
+
+        # Candidate pairs of dark targets from differing times with overlapping envelopes
+        arcpy.AddMessage("Finding dark targets with overlapping extents...")
+        with stageProfiler.stage("STR tree candidates", numTargets):
+            xmin, ymin, xmax, ymax = store.targetExtents(targets)
+            first, second = strTree.STRTree(xmin, ymin, xmax, ymax).queryPairs()
+            differ = targets["slice"][first] != targets["slice"][second]
+            first = first[differ]
+            second = second[differ]
+        logging.info("STR Tree: '%d' pairs of targets from differing times with overlapping extents", len(first))
+
+        # Pairs of dark targets whose interiors intersect (sharing an area of the Union, not only a boundary)
+        arcpy.AddMessage("Verifying intersection of " + str(len(first)) + " pairs of dark targets...")
+        with stageProfiler.stage("Exact intersection", len(first)):
+            intersecting = np.array([not geometry[a].disjoint(geometry[b]) and not geometry[a].touches(geometry[b])
+                                     for a, b in zip(first, second)], dtype=bool)
+        first = first[intersecting]
+        second = second[intersecting]
+        logging.info("Intersect: '%d' pairs of targets from differing times intersecting each other", len(first))
+        matrix = adjacencyMatrix.fromPairs(numTargets, np.concatenate([first, second]), np.concatenate([second, first]), np.zeros(2 * len(first)))
+
+        # Persistence and weight values of targets without intersecting targets are those of their single area of the Union
+        arcpy.AddMessage("Calculating persistence value and weight value...")
+        persis = np.zeros(numTargets, dtype=np.int64)
+        weight = np.ones(numTargets, dtype=np.int64)
+        indptr = matrix["indptr"]
+        with stageProfiler.stage("Union areas", len(first)):
+            for t in np.nonzero(np.diff(indptr) > 0)[0]:
+                neighbourIdx = matrix["indices"][indptr[t]:indptr[t + 1]]
+                sliceGroups = []
+                for s in np.unique(targets["slice"][neighbourIdx]):
+                    sliceGroups.append([geometry[n] for n in neighbourIdx[targets["slice"][neighbourIdx] == s]])
+                persis[t], weight[t] = self.overlapAreas(geometry[t], sliceGroups)
+        store.setTargetValues(persisFieldName, persis, "SHORT")
+        store.setTargetValues(weightFieldName, weight, "LONG")
+        logging.info("Dark Target Store: '%s' and '%s' values recorded for '%d' dark targets", persisFieldName, weightFieldName, len(persis))
+        return matrix
+
+    def overlapAreas(self, polygon, sliceGroups):
+        """Splits a dark target into the areas of the Union with the dark targets of other times intersecting it.
+
+        Equivalent of the Union of the dark target with the targetID feature classes of
+        the other times, dissolved on the targetID fields: each area is the part of the
+        dark target covered by one combination of dark targets (at most one per time,
+        as the targetID field of each time holds a single targetID).
+
+        Parameters:
+            polygon = Dissolved polygon of the dark target (arcpy Polygon)
+            sliceGroups = List of lists of dissolved polygons of intersecting dark targets, one list per other time
+
+        Return:
+            Returns tuple of the persistence value (largest number of times of the dark
+            targets covering an area) and weight value (number of areas)"""
+        areas = [(polygon, 0)]
+        for group in sliceGroups:
+            cover = group[0]
+            for other in group[1:]:
+                cover = cover.union(other)
+            splitAreas = []
+            for area, count in areas:
+                for other in group:
+                    part = area.intersect(other, 4)
+                    if part.area > 0:
+                        splitAreas.append((part, count + 1))
+                remainder = area.difference(cover)
+                if remainder.area > 0:
+                    splitAreas.append((remainder, count))
+            areas = splitAreas
+        return max([0] + [count for area, count in areas]), max(len(areas), 1)
+
+    def loadPersisStats(self, workspace, store, targets, yrPersisBool, bufferDist):
+        """Records the persistence and weight values of the statistics tables created by calcPersis in the in-memory dark target store.
+
+        Parameters:
+            workspace = Points to the workspace containing the statistics tables
+            store = In-memory dark target store (darkTargetStore.DarkTargetStore) to which the values are recorded
+            targets = Dictionary of dark targets grouped by targetID (returned by the store's groupByTargetID or dissolveByTargetID)
+            yrPersisBool = Boolean value indicating whether type of analysis is day-to-day within the year or overall year-to-year
+            bufferDist = Buffer distance of the statistics tables
+
+        Return:
+            No return"""
+        if yrPersisBool:
+            persisFieldName = "Ypers" + str(bufferDist)
+            weightFieldName = "Ywght" + str(bufferDist)
+        else:
+            persisFieldName = "pers" + str(bufferDist)
+            weightFieldName = "wght" + str(bufferDist)
+
+        # Index statistics by time and targetID
+        statsDict = {}
+        for i in range(len(store.times)):
+            statsTable = os.path.join(workspace, "targetID_" + store.times[i] + "_" + str(bufferDist) + "_stats")
+            if not arcpy.Exists(statsTable):
+                continue
+            fields = ["targetID_" + store.times[i], "MAX_" + persisFieldName, weightFieldName]
+            with arcpy.da.SearchCursor(statsTable, fields) as cursor:
                 for row in cursor:
-                    persis_count = -1
-                    for item in row[:-1]:
-                        if item != "":
-                            persis_count += 1
-                    row[len(row)-1] = persis_count
-                    cursor.updateRow(row)
-            logging.info("Update Cursor: Persistence values calculated for '%s' feature class", dissolve)
+                    statsDict[(i, row[0])] = row[1:]
+            logging.info("Search Cursor: Persistence values read from '%s' table", statsTable)
+
+        # Targets without statistics are left null (as for a join)
+        persis = np.repeat(np.nan, len(targets["targetID"]))
+        weight = np.repeat(np.nan, len(targets["targetID"]))
+        for t in range(len(targets["targetID"])):
+            stats = statsDict.get((targets["slice"][t], targets["targetID"][t]))
+            if stats is not None:
+                persis[t], weight[t] = stats
+        store.setTargetValues(persisFieldName, persis, "SHORT")
+        store.setTargetValues(weightFieldName, weight, "LONG")
+
+    def mergeIncremental(self, previousOutput, finalOutput, outputMerge, store, targets, affected, yrPersisBool, bufferDistanceList):
+        """Appends the dark targets of new time slices to the output of the previous analysis, updating only the values of affected dark targets.
 
-            # Summarize persistence statistics (count maximum persistence value and determine weight value for each dark target)
-            arcpy.AddMessage("Summarizing persistence statistics and determining weight value...")
-            statsTable = "targetID_" + fcTime + "_" + str(bufferDist) + "_stats"
-            outTable = os.path.join(analysisGDB, statsTable)
+        Parameters:
+            previousOutput = Consolidated feature class of the previous analysis (renamed to the final output if its name differs)
+            finalOutput = Consolidated feature class of the current analysis
+            outputMerge = Feature class of the dark targets of the new time slices (written by the store)
+            store = In-memory dark target store (darkTargetStore.DarkTargetStore) with the persistence and weight values
+            targets = Dictionary of dark targets dissolved by targetID (returned by the store's dissolveByTargetID)
+            affected = Boolean array indicating the dark targets (by targetID) of the new time slices and the dark targets with new neighbours
+            yrPersisBool = Boolean value indicating whether type of analysis is day-to-day within the year or overall year-to-year
+            bufferDistanceList = List of buffer distances of the analysis
+
+        Return:
+            No return"""
+        # Rename output of previous analysis to final output name (e.g. year span extended by a new year)
+        if previousOutput != finalOutput:
+            arcpy.Rename_management(previousOutput, finalOutput)
+            logging.info("Rename: '%s' feature class renamed to '%s'", previousOutput, finalOutput)
+
+        # Persistence and weight fields, and total layer count field (updated for every dark target)
+        valueFields = []
+        for dist in bufferDistanceList:
             if yrPersisBool:
-                stats = "Ypers" + str(bufferDist) + " MAX"
+                valueFields.extend(["Ypers" + dist, "Ywght" + dist])
             else:
-                stats = "pers" + str(bufferDist) + " MAX"
-            casefield = "targetID_" + fcTime
-            arcpy.Statistics_analysis(dissolve, outTable, stats, casefield)
-            logging.info("Statistics: '%s' table created with maximum persistence value and weight value (frequency) calculations from '%s' feature class", outTable, dissolve)
-            arcpy.AlterField_management(outTable, "FREQUENCY", weightFieldName)
+                valueFields.extend(["pers" + dist, "wght" + dist])
+        totalField = "totalYrLyr" if yrPersisBool else "totalLyr"
+        totalValue = None
+        if totalField in store.columns and arcpy.ListFields(finalOutput, totalField) != []:
+            totalValue = int(np.nanmax(store.columns[totalField]))
+
+        # Update affected dark targets of the previous analysis
+        arcpy.AddMessage("Updating persistence values of affected dark targets...")
+        targetIndex = dict((targets["targetID"][t], t) for t in range(len(targets["targetID"])))
+        cursorFields = ["targetID"] + valueFields + ([totalField] if totalValue is not None else [])
+        numRows = 0
+        with arcpy.da.UpdateCursor(finalOutput, cursorFields) as cursor:
+            for row in cursor:
+                t = targetIndex.get(row[0])
+                changed = False
+                if t is not None and affected[t]:
+                    for i in range(len(valueFields)):
+                        value = store.targetValues[valueFields[i]][t].item()
+                        row[i + 1] = None if isinstance(value, float) and np.isnan(value) else value
+                    changed = True
+                if totalValue is not None and row[-1] != totalValue:
+                    row[-1] = totalValue
+                    changed = True
+                if changed:
+                    cursor.updateRow(row)
+                    numRows += 1
+        logging.info("Update Cursor: '%d' rows of '%s' updated for the following fields: '%s'", numRows, finalOutput, str(cursorFields[1:]))
+
+        # Append dark targets of new time slices
+        arcpy.AddMessage("Appending dark targets of new layers...")
+        arcpy.Append_management(outputMerge, finalOutput, "NO_TEST")
+        logging.info("Append: Features from '%s' appended to '%s' feature class\n", outputMerge, finalOutput)
+
+    def maxClusterID(self, fc, clusterFieldName):
+        """Returns the largest cluster ID number (before the decimal) of a clusterID field, or 0 if the field is missing or empty."""
+        if arcpy.ListFields(fc, clusterFieldName) == []:
+            return 0
+        maxID = 0
+        with arcpy.da.SearchCursor(fc, [clusterFieldName]) as cursor:
+            for row in cursor:
+                if row[0]:
+                    maxID = max(maxID, int(row[0].split(".")[0]))
+        return maxID
+
+    def deleteOutputs(self, workspace, featureWildCards, tableWildCards=None):
+        """Deletes interim outputs of a stage left in the geodatabase workspace by an interrupted run, before the stage is executed again.
+
+        Parameters:
+            workspace = Points to the workspace in which the deletion of feature classes and tables will occur.
+            featureWildCards = List of wild cards of the names of feature classes to delete
+            tableWildCards = List of wild cards of the names of tables to delete (no tables deleted if not specified)
 
-            logging.info("Processing for '%s' feature class for union analysis complete\n", fc)
+        Return:
+            No return"""
+        if tableWildCards is None:
+            tableWildCards = []
+        arcpy.env.workspace = workspace
+        for wildCard in featureWildCards:
+            for fc in arcpy.ListFeatureClasses(wildCard):
+                arcpy.Delete_management(fc)
+                logging.info("Delete: '%s' interim feature class of interrupted run deleted", fc)
+        for wildCard in tableWildCards:
+            for table in arcpy.ListTables(wildCard):
+                arcpy.Delete_management(table)
+                logging.info("Delete: '%s' interim table of interrupted run deleted", table)
 
     def cleanWorkspace(self,workspace,fcTidList,pointFeatList,statsTableList,mergeFC):
         """Clears geodatabase workspace of interim feature classes used during geoprocessing executed in this script.
@@ -966,76 +1468,4 @@ class temporalPersistence(object):
             logging.info("Delete: '%s' feature class deleted", fc)
         arcpy.AddMessage("Deleting pre-dissolved merge feature class...")
         arcpy.Delete_management(mergeFC)
-        logging.info("Delete: '%s' feature class deleted", mergeFC)
-
-    def joindataGen(self,joinTable,fieldList,sortField):
-        """Code snippet from Esri's Join_Field.py (as a replacement to the Join Field geoprocessing tool, which suffers from exceedingly lengthy processing times.)
-
-        Define generator for join data"""
-        with arcpy.da.SearchCursor(joinTable,fieldList,sql_clause=['DISTINCT',
-                                                                   'ORDER BY '+sortField]) as cursor:
-            for row in cursor:
-                yield row
-
-    def percentile(self,n,pct):
-        """Code snippet from Esri's Join_Field.py (as a replacement to the Join Field geoprocessing tool, which suffers from exceedingly lengthy processing times.)
-
-        Function for progress reporting"""
-        return int(float(n)*float(pct)/100.0)
-
-    def join_field(self, inTable, inJoinField, joinTable, outJoinField, joinFields):
-        """Code snippet from Esri's Join_Field.py (as a replacement to the Join Field geoprocessing tool, which suffers from exceedingly lengthy processing times.)
-
-        Add join fields"""
-        arcpy.AddMessage('\nAdding join fields...')
-        fList = [f for f in arcpy.ListFields(joinTable) if f.name in joinFields.split(';')]
-        for i in range(len(fList)):
-            name = fList[i].name
-            type = fList[i].type
-            if type in ['Integer','OID']:
-                arcpy.AddField_management(inTable,name,field_type='LONG')
-            elif type == 'String':
-                arcpy.AddField_management(inTable,name,field_type='TEXT',field_length=fList[i].length)
-            elif type == 'Double':
-                arcpy.AddField_management(inTable,name,field_type='DOUBLE')
-            elif type == 'Date':
-                arcpy.AddField_management(inTable,name,field_type='DATE')
-            else:
-                arcpy.AddError('\nUnknown field type: {0} for field: {1}'.format(type,name))
-
-        # Write values to join fields
-        arcpy.AddMessage('\nJoining data...')
-        # Create generator for values
-        fieldList = [outJoinField] + joinFields.split(';')
-        joinDataGen = self.joindataGen(joinTable,fieldList,outJoinField)
-        version = sys.version_info[0]
-        if version == 2:
-            joinTuple = joinDataGen.next()
-        else:
-            joinTuple = next(joinDataGen)
-        #
-        fieldList = [inJoinField] + joinFields.split(';')
-        count = int(arcpy.GetCount_management(inTable).getOutput(0))
-        breaks = [self.percentile(count,b) for b in range(10,100,10)]
-        j = 0
-        with arcpy.da.UpdateCursor(inTable,fieldList,sql_clause=(None,'ORDER BY '+inJoinField)) as cursor:
-            for row in cursor:
-                j+=1
-                if j in breaks:
-                    arcpy.AddMessage(str(int(round(j*100.0/count))) + ' percent complete...')
-                row = list(row)
-                key = row[0]
-                try:
-                    while joinTuple[0] < key:
-                        if version == 2:
-                            joinTuple = joinDataGen.next()
-                        else:
-                            joinTuple = next(joinDataGen)
-                    if key == joinTuple[0]:
-                        for i in range(len(joinTuple))[1:]:
-                            row[i] = joinTuple[i]
-                        row = tuple(row)
-                        cursor.updateRow(row)
-                except StopIteration:
-                    arcpy.AddWarning('\nEnd of join table.')
-                    break
\ No newline at end of file
+        logging.info("Delete: '%s' feature class deleted", mergeFC)
\ No newline at end of file
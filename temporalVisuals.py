@@ -53,6 +53,11 @@ feature classes used in the creation of the analysis result output map document.
 import arcpy
 import os
 import logging
+import stageProfiler
+
+# Reload steps required to refresh memory if Catalog is open when changes are made
+import centroidEngine                       # get module reference for reload
+reload(centroidEngine)                      # reload step 1
 
 
 class temporalVisuals(object):
@@ -122,6 +127,7 @@ class temporalVisuals(object):
         parameter.  This method is called after internal validation."""
         return
 
+    @stageProfiler.profiledExecute
     def execute(self, parameters, messages):
         """The source code of the tool."""
         # Define variables from parameters
@@ -219,8 +225,8 @@ class temporalVisuals(object):
 ##        where_clause = persisField + " IS NOT NULL"
         arcpy.MakeFeatureLayer_management(targetsFC, targetLyr, where_clause)
         logging.info("Make Feature Layer: '%s' layer created from '%s' feature class with selection of features where persistence fields at '%s' meters are not null", targetLyr, targetsFC, bufferDistanceList[0])
-        arcpy.FeatureToPoint_management(targetLyr, pointFC, "CENTROID")
-        logging.info("Feature to Point: '%s' points feature class created from centroid of features in '%s' layer\n", pointFC, targetLyr)
+        centroidEngine.writeCentroids(targetLyr, pointFC)
+        logging.info("Centroids: '%s' points feature class created from centroid of features in '%s' layer\n", pointFC, targetLyr)
 
         # Create buffer feature class for each desired buffer distance
         arcpy.AddMessage("\nCreating buffer feature classes...")
@@ -36,6 +36,7 @@ from the yearly dark targets geodatabases to the master geodatabase."""
 import arcpy
 import os
 import logging
+import stageProfiler
 
 
 class updateMasterGDB(object):
@@ -81,6 +82,7 @@ class updateMasterGDB(object):
         parameter.  This method is called after internal validation."""
         return
 
+    @stageProfiler.profiledExecute
     def execute(self, parameters, messages):
         """The source code of the tool."""
         # Set log configuration